@@ -14,6 +14,7 @@ from preliz.predictive import *
 from preliz.unidimensional import *
 from preliz.multidimensional import *
 from preliz.internal.rcparams import rc_context, rcParams
+from preliz.internal.cache import clear_cache
 from preliz.internal.citations import citations
 
 
@@ -1,4 +1,5 @@
 # Continuous Distributions
+from preliz.distributions.approximated import Approximated
 from preliz.distributions.asymmetric_laplace import AsymmetricLaplace
 
 # Discrete Distributions
@@ -117,4 +118,5 @@ __all__ = (  # noqa: PLE0604
     + [Truncated.__name__]
     + [Censored.__name__]
     + [Hurdle.__name__]
+    + [Approximated.__name__]
 )
@@ -0,0 +1,148 @@
+import numpy as np
+from scipy.special import expit, logit
+
+from preliz.distributions.distributions import DistributionTransformer
+from preliz.internal.cache import cached
+from preliz.internal.chebyshev import eval_piecewise, fit_piecewise
+from preliz.internal.distribution_helper import valid_scalar_params
+from preliz.internal.sampling import rvs_method
+
+
+class Approximated(DistributionTransformer):
+    r"""
+    Approximated distribution.
+
+    This is not a distribution per se, but a surrogate of a continuous univariate distribution
+    with scalar parameters, usually created with the ``approximate`` method of a distribution.
+
+    The cdf and ppf are replaced by piecewise Chebyshev interpolants built once, so evaluating
+    them has the same small cost for any distribution. This pays off for distributions with
+    expensive cdf or ppf, like mixtures, truncated or censored distributions, that are evaluated
+    many times, for example when plotting, sampling by inversion or eliciting.
+
+    The cdf is interpolated between the quantiles ``tol`` and ``1 - tol`` with an absolute error
+    below ``tol``. The ppf is interpolated as a function of :math:`\text{logit}(q)` for the same
+    quantiles, with an error below ``tol * (|x| + iqr)``, where iqr is the interquartile range,
+    or below the error introduced by rounding :math:`q`, whichever is larger. The original
+    distribution is used outside those intervals and on the pieces where the interpolants did not
+    converge, like near singularities or discontinuities. All the other methods, like the pdf or
+    the moments, are those of the original distribution.
+
+    Parameters
+    ----------
+    dist: PreliZ distribution
+        Continuous univariate PreliZ distribution with scalar parameters.
+    tol: float
+        Error tolerance of the interpolants. Defaults to 1e-10.
+    """
+
+    def __init__(self, dist, tol=1e-10):
+        self.dist = dist
+        super().__init__()
+        if self.kind != "continuous":
+            raise ValueError("Only continuous distributions can be approximated")
+        if not tol > 0:
+            raise ValueError("tol must be positive")
+        self.tol = tol
+        self._parametrization()
+
+    def _parametrization(self, **kwargs):
+        if kwargs:
+            self.dist._parametrization(**kwargs)
+        if not valid_scalar_params(self.dist):
+            raise ValueError("Only distributions with scalar parameters can be approximated")
+
+        self.params = self.dist.params
+        self.param_names = self.dist.param_names
+        self.params_support = self.dist.params_support
+        self.support = self.dist.support
+        self.is_frozen = True
+        self._cdf_pieces, self._ppf_pieces = cached(
+            self.dist, "approximate", lambda tol: _fit_surrogate(self.dist, tol), self.tol
+        )
+
+    @property
+    def batch_shape(self):
+        # The weights of a Mixture define the components, not a batch
+        return self.dist.batch_shape
+
+    def mean(self):
+        return self.dist.mean()
+
+    def median(self):
+        return self.ppf(0.5)
+
+    def mode(self):
+        return self.dist.mode()
+
+    def var(self):
+        return self.dist.var()
+
+    def std(self):
+        return self.dist.std()
+
+    def skewness(self):
+        return self.dist.skewness()
+
+    def kurtosis(self):
+        return self.dist.kurtosis()
+
+    def entropy(self):
+        return self.dist.entropy()
+
+    @rvs_method
+    def rvs(self, size=None, random_state=None):
+        random_state = np.random.default_rng(random_state)
+        return self.ppf(random_state.uniform(size=size))
+
+    def pdf(self, x):
+        return self.dist.pdf(x)
+
+    def logpdf(self, x):
+        return self.dist.logpdf(x)
+
+    def cdf(self, x):
+        x = np.asarray(x, dtype=float)
+        vals, missing = eval_piecewise(self._cdf_pieces, x)
+        if np.any(missing):
+            vals[missing] = self.dist.cdf(x[missing])
+        return vals[()]
+
+    def logcdf(self, x):
+        return self.dist.logcdf(x)
+
+    def logsf(self, x):
+        return self.dist.logsf(x)
+
+    def ppf(self, q):
+        q = np.asarray(q, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vals, missing = eval_piecewise(self._ppf_pieces, logit(q))
+        if np.any(missing):
+            vals[missing] = self.dist.ppf(q[missing])
+        return vals[()]
+
+    def _neg_logpdf(self, x):
+        return -self.logpdf(x).sum()
+
+    def _fit_moments(self, mean, sigma):
+        self.dist._fit_moments(mean, sigma)
+        self._parametrization()
+
+
+def _fit_surrogate(dist, tol):
+    """Build the piecewise interpolants of the cdf, in x, and of the ppf, in logit(q)."""
+    lower, q_1, q_3, upper = dist.ppf([tol, 0.25, 0.75, 1 - tol])
+    scale = q_3 - q_1
+    eps = np.finfo(float).eps
+
+    cdf_pieces = fit_piecewise(dist.cdf, lower, upper, lambda x, vals: tol + 4 * eps)
+
+    def ppf_tolerance(s, vals):
+        # an error of a few ulps in q changes the ppf by about eps / pdf
+        with np.errstate(divide="ignore"):
+            noise = 4 * eps / dist.pdf(vals.ravel()).reshape(vals.shape)
+        return tol * (np.abs(vals) + scale) + noise
+
+    ppf_pieces = fit_piecewise(lambda s: dist.ppf(expit(s)), logit(tol), -logit(tol), ppf_tolerance)
+    return cdf_pieces, ppf_pieces
@@ -4,6 +4,8 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import log1mexp
 
 
 class AsymmetricLaplace(Continuous):
@@ -114,6 +116,14 @@ class AsymmetricLaplace(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.b, self.kappa)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.b, self.kappa)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.b, self.kappa)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.mu, self.b, self.kappa)
@@ -125,33 +135,42 @@ class AsymmetricLaplace(Continuous):
         return nb_neg_logpdf(x, self.mu, self.b, self.kappa)
 
     def entropy(self):
-        return nb_entropy(self.b, self.kappa)
+        return np.broadcast_to(nb_entropy(self.b, self.kappa), self.batch_shape)
 
     def median(self):
-        if self.kappa > 1:
-            return self.mu + self.kappa * self.b * np.log(
-                (1 + self.kappa**2) / (2 * self.kappa**2)
-            )
-        return self.mu - np.log((1 + self.kappa**2) / 2) / (self.kappa / self.b)
+        return np.where(
+            self.kappa > 1,
+            self.mu + self.kappa * self.b * np.log((1 + self.kappa**2) / (2 * self.kappa**2)),
+            self.mu - np.log((1 + self.kappa**2) / 2) / (self.kappa / self.b),
+        )
 
     def mean(self):
         return (1 / self.kappa - self.kappa) * self.b + self.mu
 
     def mode(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def var(self):
-        return ((1 / self.kappa) ** 2 + self.kappa**2) * self.b**2
+        return np.broadcast_to(
+            ((1 / self.kappa) ** 2 + self.kappa**2) * self.b**2, self.batch_shape
+        )
 
     def std(self):
         return self.var() ** 0.5
 
     def skewness(self):
-        return 2.0 * (1 - np.power(self.kappa, 6)) / np.power(1 + np.power(self.kappa, 4), 1.5)
+        return np.broadcast_to(
+            2.0 * (1 - np.power(self.kappa, 6)) / np.power(1 + np.power(self.kappa, 4), 1.5),
+            self.batch_shape,
+        )
 
     def kurtosis(self):
-        return 6.0 * (1 + np.power(self.kappa, 8)) / np.power(1 + np.power(self.kappa, 4), 2)
+        return np.broadcast_to(
+            6.0 * (1 + np.power(self.kappa, 8)) / np.power(1 + np.power(self.kappa, 4), 2),
+            self.batch_shape,
+        )
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         random_samples = random_state.uniform(-self.kappa, 1 / self.kappa, size)
@@ -177,6 +196,24 @@ def nb_cdf(x, mu, b, kappa):
     return np.exp(x * kap_inv) * (kappa / kap_kapinv)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, mu, b, kappa):
+    x = (x - mu) / b
+    kap_kapinv = kappa + 1 / kappa
+    if x >= 0:
+        return log1mexp(-x * kappa - np.log(kappa * kap_kapinv))
+    return x / kappa + np.log(kappa / kap_kapinv)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, mu, b, kappa):
+    x = (x - mu) / b
+    kap_kapinv = kappa + 1 / kappa
+    if x >= 0:
+        return -x * kappa - np.log(kappa * kap_kapinv)
+    return log1mexp(x / kappa + np.log(kappa / kap_kapinv))
+
+
 @nb.vectorize(nopython=True, cache=True)
 def nb_ppf(q, mu, b, kappa):
     kap_inv = 1 / kappa
@@ -205,7 +242,7 @@ def nb_neg_logpdf(x, mu, b, kappa):
     return (-nb_logpdf(x, mu, b, kappa)).sum()
 
 
-@nb.njit(cache=True)
+@nb.njit(cache=True, nogil=True)
 def nb_rvs(random_samples, mu, b, kappa):
     sgn = np.sign(random_samples)
     return mu - (1 / (1 / b * sgn * kappa**sgn)) * np.log(1 - random_samples * sgn * kappa**sgn)
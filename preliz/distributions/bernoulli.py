@@ -4,6 +4,7 @@ import numpy as np
 from preliz.distributions.distributions import Discrete
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import expit, logit, xlogx
 
 
@@ -135,6 +136,7 @@ class Bernoulli(Discrete):
     def kurtosis(self):
         return (1 - 6 * self.p * self._q) / (self.p * self._q)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.binomial(1, self.p, size=size)
@@ -4,6 +4,7 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, any_not_none, eps
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import (
     betainc,
     betaincinv,
@@ -11,6 +12,8 @@ from preliz.internal.special import (
     cdf_bounds,
     digamma,
     gammaln,
+    log_betainc,
+    log_betaincc,
     mean_and_std,
     ppf_bounds_cont,
     xlog1py,
@@ -148,6 +151,14 @@ class Beta(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.alpha, self.beta, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.alpha, self.beta)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.alpha, self.beta)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.alpha, self.beta, self.support[0], self.support[1])
@@ -179,13 +190,10 @@ class Beta(Continuous):
         return self.var() ** 0.5
 
     def skewness(self):
-        if self.alpha == self.beta:
-            return np.zeros_like(self.alpha)
-        else:
-            psc = self.alpha + self.beta
-            return (2 * (self.beta - self.alpha) * np.sqrt(psc + 1)) / (
-                (psc + 2) * np.sqrt(self.alpha * self.beta)
-            )
+        psc = self.alpha + self.beta
+        return (2 * (self.beta - self.alpha) * np.sqrt(psc + 1)) / (
+            (psc + 2) * np.sqrt(self.alpha * self.beta)
+        )
 
     def kurtosis(self):
         psc = self.alpha + self.beta
@@ -196,6 +204,7 @@ class Beta(Continuous):
             / (prod * (psc + 2) * (psc + 3))
         )
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.beta(self.alpha, self.beta, size)
@@ -218,6 +227,24 @@ def nb_cdf(x, alpha, beta, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, alpha, beta):
+    if x <= 0:
+        return -np.inf
+    if x >= 1:
+        return 0.0
+    return log_betainc(alpha, beta, x)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, alpha, beta):
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return -np.inf
+    return log_betaincc(alpha, beta, x)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, alpha, beta, lower, upper):
     x_val = betaincinv(alpha, beta, q)
@@ -4,9 +4,19 @@ import numba as nb
 import numpy as np
 
 from preliz.distributions.distributions import Discrete
-from preliz.internal.distribution_helper import all_not_none, eps
+from preliz.internal.cache import cache_method
+from preliz.internal.distribution_helper import (
+    TABLE_TAIL_MASS,
+    all_not_none,
+    binomial_tail_bounds,
+    cdf_from_table,
+    cdf_table,
+    eps,
+    ppf_from_table,
+)
 from preliz.internal.optimization import find_ppf, optimize_ml, optimize_moments
-from preliz.internal.special import betaln, cdf_bounds
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import betaincinv, betaln, cdf_bounds, ppf_bounds_disc, xlogy
 
 
 class BetaBinomial(Discrete):
@@ -73,6 +83,7 @@ class BetaBinomial(Discrete):
         self.n = np.int64(n)
         self.params = (self.alpha, self.beta, self.n)
         self.support = (0, self.n)
+        self._cdf_table = None
         self.is_frozen = True
 
     def pdf(self, x):
@@ -80,19 +91,41 @@ class BetaBinomial(Discrete):
         return np.exp(self.logpdf(x))
 
     def cdf(self, x):
-        if isinstance(x, np.ndarray | list | tuple):
-            cdf_values = np.zeros_like(x, dtype=float)
-            for i, val in enumerate(x):
-                x_vals = np.arange(0, val + 1)
-                cdf_values[i] = np.sum(self.pdf(x_vals))
-            return cdf_bounds(cdf_values, x, *self.support)
+        x = np.asarray(x)
+        table = self._get_cdf_table()
+        if table is not None:
+            cdf_values = cdf_from_table(*table, x)
         else:
-            x_vals = np.arange(0, x + 1)
-            return cdf_bounds(np.sum(self.pdf(x_vals)), x, *self.support)
+            x_b, alpha, beta, n = np.broadcast_arrays(x, *self.params)
+            cdf_values = np.zeros(x_b.shape)
+            for idx in np.ndindex(x_b.shape):
+                x_vals = np.arange(0, np.floor(x_b[idx]) + 1)
+                logpdf = nb_logpdf(x_vals, alpha[idx], beta[idx], n[idx], 0, n[idx])
+                cdf_values[idx] = np.sum(np.exp(logpdf))
+        return cdf_bounds(cdf_values, x, *self.support)
 
     def ppf(self, q):
         q = np.asarray(q)
-        return find_ppf(self, q)
+        table = self._get_cdf_table()
+        if table is None:
+            return find_ppf(self, q)
+        return ppf_bounds_disc(ppf_from_table(*table, q), q, *self.support)
+
+    def _get_cdf_table(self):
+        # built once per parameter set, `_update` resets it
+        if self._cdf_table is None:
+            self._cdf_table = cdf_table(self, self._table_window())
+        return self._cdf_table
+
+    def _table_window(self):
+        # half of each tail bounds the probability of success beyond its quantiles, the other
+        # half the binomial tails, which are largest at those quantiles
+        half_mass = TABLE_TAIL_MASS / 2
+        p_lower = betaincinv(self.alpha, self.beta, half_mass)
+        p_upper = 1 - betaincinv(self.beta, self.alpha, half_mass)
+        lower = binomial_tail_bounds(self.n, p_lower, half_mass)[0]
+        upper = binomial_tail_bounds(self.n, p_upper, half_mass)[1]
+        return lower, upper
 
     def logpdf(self, x):
         return nb_logpdf(x, self.alpha, self.beta, self.n, *self.support)
@@ -100,10 +133,11 @@ class BetaBinomial(Discrete):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.alpha, self.beta, self.n, *self.support)
 
+    @cache_method
     def entropy(self):
         x_values = self.xvals("full")
-        logpdf = self.logpdf(x_values)
-        return -np.sum(np.exp(logpdf) * logpdf)
+        pdf = self.pdf(x_values)
+        return -np.sum(xlogy(pdf, pdf), axis=0)
 
     def mean(self):
         return self.n * self.alpha / (self.alpha + self.beta)
@@ -163,6 +197,7 @@ class BetaBinomial(Discrete):
         right -= (18 * alpha_beta_product * n**2) / (alpha_beta_sum) ** 2
         return (left * right) - 3
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.binomial(
@@ -4,12 +4,14 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import (
     betainc,
     betaincinv,
     betaln,
     cdf_bounds,
     digamma,
+    log_betainc,
     ppf_bounds_cont,
     xlogy,
 )
@@ -110,6 +112,14 @@ class BetaScaled(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.alpha, self.beta, self.lower, self.upper)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.alpha, self.beta, self.lower, self.upper)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.alpha, self.beta, self.lower, self.upper)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.alpha, self.beta, self.support[0], self.support[1])
@@ -143,23 +153,24 @@ class BetaScaled(Continuous):
         return self.var() ** 0.5
 
     def skewness(self):
-        if self.alpha == self.beta:
-            return np.zeros_like(self.alpha)
-        else:
-            psc = self.alpha + self.beta
-            return (2 * (self.beta - self.alpha) * np.sqrt(psc + 1)) / (
-                (psc + 2) * np.sqrt(self.alpha * self.beta)
-            )
+        psc = self.alpha + self.beta
+        return np.broadcast_to(
+            (2 * (self.beta - self.alpha) * np.sqrt(psc + 1))
+            / ((psc + 2) * np.sqrt(self.alpha * self.beta)),
+            self.batch_shape,
+        )
 
     def kurtosis(self):
         psc = self.alpha + self.beta
         prod = self.alpha * self.beta
-        return (
+        return np.broadcast_to(
             6
             * (np.abs(self.alpha - self.beta) ** 2 * (psc + 1) - prod * (psc + 2))
-            / (prod * (psc + 2) * (psc + 3))
+            / (prod * (psc + 2) * (psc + 3)),
+            self.batch_shape,
         )
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return (
@@ -185,6 +196,24 @@ def nb_cdf(x, alpha, beta, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, alpha, beta, lower, upper):
+    if x <= lower:
+        return -np.inf
+    if x >= upper:
+        return 0.0
+    return log_betainc(alpha, beta, (x - lower) / (upper - lower))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, alpha, beta, lower, upper):
+    if x <= lower:
+        return 0.0
+    if x >= upper:
+        return -np.inf
+    return log_betainc(beta, alpha, (upper - x) / (upper - lower))
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, alpha, beta, lower, upper):
     x_val = betaincinv(alpha, beta, q) * (upper - lower) + lower
@@ -5,9 +5,12 @@ from scipy.special import bdtr, bdtrik
 from preliz.distributions.distributions import Discrete
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_moments
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import (
     cdf_bounds,
     gammaln,
+    log_betainc,
+    log_betaincc,
     mean_and_std,
     ppf_bounds_disc,
     xlog1py,
@@ -91,6 +94,14 @@ class Binomial(Discrete):
     def cdf(self, x):
         return nb_cdf(x, self.n, self.p, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.n, self.p)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.n, self.p)
+
     def ppf(self, q):
         return nb_ppf(q, self.n, self.p, self.support[0], self.support[1])
 
@@ -127,6 +138,7 @@ class Binomial(Discrete):
     def kurtosis(self):
         return (1 - 6 * self.p * self._q) / (self.n * self.p * self._q)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.binomial(self.n, self.p, size=size)
@@ -150,6 +162,26 @@ def nb_cdf(x, n, p, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, n, p):
+    if x < 0:
+        return -np.inf
+    x = np.floor(x)
+    if x >= n:
+        return 0.0
+    return log_betaincc(x + 1, n - x, p)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, n, p):
+    if x < 0:
+        return 0.0
+    x = np.floor(x)
+    if x >= n:
+        return -np.inf
+    return log_betainc(x + 1, n - x, p)
+
+
 # @nb.jit
 def nb_ppf(q, n, p, lower, upper):
     q = np.asarray(q)
@@ -4,6 +4,7 @@ import numpy as np
 from preliz.distributions.distributions import Discrete
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import expit, logit, xlogx
 
 
@@ -82,6 +83,11 @@ class Categorical(Discrete):
 
         self.is_frozen = True
 
+    @property
+    def batch_shape(self):
+        # The probabilities define the categories, not a batch
+        return () if self.is_frozen else None
+
     def pdf(self, x):
         x = np.atleast_1d(x)
         return nb_pdf(x, self.p)
@@ -125,6 +131,7 @@ class Categorical(Discrete):
     def kurtosis(self):
         return NotImplemented
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.choice(self.p, size)
@@ -4,6 +4,7 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import ppf_bounds_cont
 
 
@@ -71,6 +72,14 @@ class Cauchy(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.alpha, self.beta)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.alpha, self.beta)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.alpha, self.beta)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.alpha, self.beta, -np.inf, np.inf)
@@ -82,29 +91,39 @@ class Cauchy(Continuous):
         return nb_neg_logpdf(x, self.alpha, self.beta)
 
     def entropy(self):
-        return nb_entropy(self.beta)
+        return np.broadcast_to(nb_entropy(self.beta), self.batch_shape)
+
+    def _entropy_grad(self):
+        return np.array([0, 1 / self.beta])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        pdf = self.pdf(x)
+        z_val = np.nan_to_num((x - self.alpha) / self.beta)
+        return np.stack([-pdf, -pdf * z_val])
 
     def mean(self):
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
     def mode(self):
-        return self.alpha
+        return np.broadcast_to(self.alpha, self.batch_shape)
 
     def median(self):
-        return self.alpha
+        return np.broadcast_to(self.alpha, self.batch_shape)
 
     def var(self):
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
     def std(self):
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
     def skewness(self):
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
     def kurtosis(self):
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         random_samples = random_state.uniform(0, 1, size)
@@ -122,6 +141,24 @@ def nb_cdf(x, alpha, beta):
     return 1 / np.pi * np.arctan((x - alpha) / beta) + 0.5
 
 
+@nb.njit(cache=True)
+def nb_logcdf(x, alpha, beta):
+    return _log_std_cdf((x - alpha) / beta)
+
+
+@nb.njit(cache=True)
+def nb_logsf(x, alpha, beta):
+    return _log_std_cdf((alpha - x) / beta)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def _log_std_cdf(z_val):
+    # arctan2 gives the mass of each tail without cancellation
+    if z_val < 0:
+        return np.log(np.arctan2(1, -z_val) / np.pi)
+    return np.log1p(-np.arctan2(1, z_val) / np.pi)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, alpha, beta, lower, upper):
     x_val = alpha + beta * np.tan(np.pi * (q - 0.5))
@@ -143,6 +180,6 @@ def nb_neg_logpdf(x, alpha, beta):
     return -(nb_logpdf(x, alpha, beta)).sum()
 
 
-@nb.njit(cache=True)
+@nb.njit(cache=True, nogil=True)
 def nb_rvs(random_samples, alpha, beta):
     return alpha + beta * np.tan(np.pi * (random_samples - 0.5))
@@ -2,7 +2,10 @@ import numpy as np
 
 from preliz.distributions.distributions import DistributionTransformer
 from preliz.distributions.truncated import Truncated
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import xlogx, xprody
 
 
@@ -84,13 +87,8 @@ class Censored(DistributionTransformer):
         self.params_support = (*self.dist.params_support, self.dist.support, self.dist.support)
 
     def mean(self):
-        if self.kind == "discrete":
-            p_low = self.dist.cdf(self.lower - 1)
-        else:
-            p_low = self.dist.cdf(self.lower)
-        p_up = 1 - self.dist.cdf(self.upper)
-        p_int = 1 - (p_low + p_up)
-        mean_trunc = Truncated(self.dist, self.lower, self.upper).mean()
+        p_low, p_up, p_int = self._tail_probs()
+        mean_trunc = self._interior_moments()[0]
         return xprody(self.lower, p_low) + mean_trunc * p_int + xprody(self.upper, p_up)
 
     def mode(self):
@@ -108,15 +106,9 @@ class Censored(DistributionTransformer):
 
     def var(self):
         mean = self.mean()
-        if self.kind == "discrete":
-            p_low = self.dist.cdf(self.lower - 1)
-        else:
-            p_low = self.dist.cdf(self.lower)
-        p_up = 1 - self.dist.cdf(self.upper)
-        p_int = 1 - (p_low + p_up)
-        trunc = Truncated(self.dist, self.lower, self.upper)
-        mean_trunc = trunc.mean()
-        var_trunc = trunc.var() + (mean_trunc - mean) ** 2
+        p_low, p_up, p_int = self._tail_probs()
+        mean_trunc, var_trunc = self._interior_moments()[:2]
+        var_trunc = var_trunc + (mean_trunc - mean) ** 2
         return (
             xprody((self.lower - mean) ** 2, p_low)
             + var_trunc * p_int
@@ -129,17 +121,11 @@ class Censored(DistributionTransformer):
     def skewness(self):
         mean = self.mean()
         std = self.std()
-        if self.kind == "discrete":
-            p_low = self.dist.cdf(self.lower - 1)
-        else:
-            p_low = self.dist.cdf(self.lower)
-        p_up = 1 - self.dist.cdf(self.upper)
-        p_int = 1 - (p_low + p_up)
-        trunc = Truncated(self.dist, self.lower, self.upper)
-        mean_trunc = trunc.mean()
-        std_trunc = trunc.std()
+        p_low, p_up, p_int = self._tail_probs()
+        mean_trunc, var_trunc, skew_trunc = self._interior_moments()[:3]
+        std_trunc = var_trunc**0.5
 
-        skew_trunc = trunc.skewness() + ((mean_trunc - mean) / std_trunc) ** 3
+        skew_trunc = skew_trunc + ((mean_trunc - mean) / std_trunc) ** 3
         return (
             xprody(((self.lower - mean) / std) ** 3, p_low)
             + skew_trunc * p_int
@@ -149,23 +135,18 @@ class Censored(DistributionTransformer):
     def kurtosis(self):
         mean = self.mean()
         std = self.std()
-        if self.kind == "discrete":
-            p_low = self.dist.cdf(self.lower - 1)
-        else:
-            p_low = self.dist.cdf(self.lower)
-        p_up = 1 - self.dist.cdf(self.upper)
-        p_int = 1 - (p_low + p_up)
-        trunc = Truncated(self.dist, self.lower, self.upper)
-        mean_trunc = trunc.mean()
-        std_trunc = trunc.std()
+        p_low, p_up, p_int = self._tail_probs()
+        mean_trunc, var_trunc, _, kurt_trunc = self._interior_moments()[:4]
+        std_trunc = var_trunc**0.5
 
-        kurt_trunc = trunc.kurtosis() + 3 + ((mean_trunc - mean) / std_trunc) ** 4
+        kurt_trunc = kurt_trunc + 3 + ((mean_trunc - mean) / std_trunc) ** 4
         return (
             xprody(((self.lower - mean) / std) ** 4, p_low)
             + kurt_trunc * p_int
             + xprody(((self.upper - mean) / std) ** 4, p_up)
         ) - 3
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         return np.clip(self.dist.rvs(size, random_state), self.lower, self.upper)
 
@@ -177,6 +158,16 @@ class Censored(DistributionTransformer):
         vals = self.dist.cdf(x)
         return np.where(x < self.lower, 0, np.where(x > self.upper, 1, vals))
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        vals = self.dist.logcdf(x)
+        return np.where(x < self.lower, -np.inf, np.where(x > self.upper, 0, vals))
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        vals = self.dist.logsf(x)
+        return np.where(x < self.lower, 0, np.where(x > self.upper, -np.inf, vals))
+
     def ppf(self, q):
         return np.clip(self.dist.ppf(q), self.lower, self.upper)
 
@@ -184,18 +175,17 @@ class Censored(DistributionTransformer):
         x = np.asarray(x)
         vals = self.dist.logpdf(x)
         vals = np.where((x < self.lower) | (x > self.upper), -np.inf, vals)
-        with np.errstate(divide="ignore"):
-            vals = np.where(x == self.lower, np.log(self.dist.cdf(self.lower)), vals)
-            if self.kind == "discrete":
-                vals = np.where(x == self.upper, np.log1p(-self.dist.cdf(self.upper - 1)), vals)
-            else:
-                vals = np.where(x == self.upper, np.log1p(-self.dist.cdf(self.upper)), vals)
+        vals = np.where(x == self.lower, self.dist.logcdf(self.lower), vals)
+        if self.kind == "discrete":
+            vals = np.where(x == self.upper, self.dist.logsf(self.upper - 1), vals)
+        else:
+            vals = np.where(x == self.upper, self.dist.logsf(self.upper), vals)
 
         return vals
 
     def entropy(self):
         p_low_inc = self.dist.cdf(self.lower)
-        p_up = 1 - self.dist.cdf(self.upper)
+        p_up = self.dist.sf(self.upper)
         if self.kind == "discrete":
             p_l = np.nan_to_num(self.dist.pdf(self.lower))
             p_u = np.nan_to_num(self.dist.pdf(self.upper))
@@ -208,15 +198,41 @@ class Censored(DistributionTransformer):
             p_up_inc = p_up
             xlogx_pl = xlogx_pu = 0
 
-        p_int = 1 - (p_low + p_up)
         entropy_bound = -(xlogx(p_low_inc) + xlogx(p_up_inc))
-        trunc_ent = Truncated(self.dist, self.lower, self.upper).entropy()
-        entropy_interval = trunc_ent * p_int - xlogx(p_int) + xlogx_pl + xlogx_pu
+        if self.kind == "discrete":
+            p_int = 1 - (p_low + p_up)
+            trunc_ent = self._interior_moments()[4]
+            entropy_interval = trunc_ent * p_int - xlogx(p_int) + xlogx_pl + xlogx_pu
+        else:
+            # the quadrature of -pdf * log(pdf) between the bounds, without renormalizing
+            entropy_interval = self._interior_moments()[4]
         return entropy_interval + entropy_bound
 
     def _neg_logpdf(self, x):
         return -self.logpdf(x).sum()
 
+    @cache_method
+    def _tail_probs(self):
+        """Return the probability below and above the bounds, and the probability in between."""
+        if self.kind == "discrete":
+            p_low = self.dist.cdf(self.lower - 1)
+        else:
+            p_low = self.dist.cdf(self.lower)
+        p_up = self.dist.sf(self.upper)
+        return p_low, p_up, 1 - (p_low + p_up)
+
+    def _interior_moments(self):
+        """
+        Return the mean, variance, skewness, kurtosis and entropy between the bounds.
+
+        The moments are those of the base distribution truncated to the bounds. For continuous
+        distributions the entropy is the integral of -pdf * log(pdf) between the bounds.
+        """
+        if self.kind == "discrete":
+            trunc = Truncated(self.dist, self.lower, self.upper)
+            return (*trunc.moments("mvsk"), trunc.entropy())
+        return quad_moments(self.dist, "mvske", lower=self.lower, upper=self.upper)
+
     def _fit_moments(self, mean, sigma):
         self.dist._fit_moments(mean, sigma)
         self._parametrization(**dict(zip(self.dist.param_names, self.dist.params)))
@@ -1,11 +1,21 @@
 import numba as nb
 import numpy as np
-from scipy.special import gammainc, gammaincinv
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
-from preliz.internal.special import cdf_bounds, digamma, gammaln, ppf_bounds_cont, xlogy
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    cdf_bounds,
+    digamma,
+    gammainc,
+    gammaincinv,
+    gammaln,
+    log_gammainc,
+    log_gammaincc,
+    ppf_bounds_cont,
+    xlogy,
+)
 
 
 class ChiSquared(Continuous):
@@ -75,6 +85,14 @@ class ChiSquared(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.nu)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.nu)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.nu)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.nu)
@@ -109,6 +127,7 @@ class ChiSquared(Continuous):
     def kurtosis(self):
         return 12 / self.nu
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.chisquare(self.nu, size)
@@ -120,12 +139,26 @@ class ChiSquared(Continuous):
         optimize_ml(self, sample)
 
 
-# @nb.njit(cache=True)
+@nb.njit(cache=True)
 def nb_cdf(x, nu):
     return cdf_bounds(gammainc(nu / 2, x / 2), x, 0, np.inf)
 
 
-# @nb.njit(cache=True)
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, nu):
+    if x <= 0:
+        return -np.inf
+    return log_gammainc(nu / 2, x / 2)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, nu):
+    if x <= 0:
+        return 0.0
+    return log_gammaincc(nu / 2, x / 2)
+
+
+@nb.njit(cache=True)
 def nb_ppf(q, nu):
     vals = 2 * gammaincinv(nu / 2, q)
     return ppf_bounds_cont(vals, q, 0, np.inf)
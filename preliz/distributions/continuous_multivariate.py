@@ -9,13 +9,16 @@ try:
 except ImportError:
     pass
 from scipy import stats
+from scipy.special import ndtri
 
 from preliz.distributions.beta import Beta
 from preliz.distributions.distributions_multivariate import Continuous
+from preliz.distributions.gamma import Gamma
 from preliz.distributions.normal import Normal
 from preliz.internal.distribution_helper import all_not_none
 from preliz.internal.plot_helper import check_inside_notebook, get_slider
 from preliz.internal.plot_helper_multivariate import plot_dirichlet, plot_mvnormal
+from preliz.internal.sampling import sobol_uniform
 
 eps = np.finfo(float).eps
 
@@ -85,6 +88,13 @@ class Dirichlet(Continuous):
     def _fit_mle(self, sample, **kwargs):
         raise NotImplementedError
 
+    def _qmc_rvs(self, size=None, random_state=None):
+        shape = () if size is None else tuple(np.atleast_1d(size))
+        points = sobol_uniform((*shape, len(self.alpha)), self.alpha.shape, random_state)
+        # normalized independent gamma variates, each one from its own dimension of the sequence
+        gammas = Gamma(self.alpha, 1).ppf(points)
+        return gammas / gammas.sum(-1, keepdims=True)
+
     def mode(self):
         return (
             (self.alpha - 1) / (np.sum(self.alpha) - len(self.alpha))
@@ -430,6 +440,14 @@ class MvNormal(Continuous):
     def _fit_mle(self, sample, **kwargs):
         raise NotImplementedError
 
+    def _qmc_rvs(self, size=None, random_state=None):
+        shape = () if size is None else tuple(np.atleast_1d(size))
+        points = sobol_uniform((*shape, len(self.mu)), self.mu.shape, random_state)
+        # the factor from the eigendecomposition also works for singular covariance matrices
+        eigvals, eigvecs = np.linalg.eigh(self.cov)
+        factor = eigvecs * np.sqrt(np.clip(eigvals, 0, None))
+        return self.mu + ndtri(points) @ factor.T
+
     def mode(self):
         return self.mu
 
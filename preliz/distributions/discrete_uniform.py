@@ -3,6 +3,7 @@ import numpy as np
 
 from preliz.distributions.distributions import Discrete
 from preliz.internal.distribution_helper import all_not_none
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import cdf_bounds, ppf_bounds_disc
 
 
@@ -113,11 +114,12 @@ class DiscreteUniform(Discrete):
         return self.var() ** 0.5
 
     def skewness(self):
-        return 0
+        return np.zeros(self.batch_shape)
 
     def kurtosis(self):
         return -(6 * (self._n**2 + 1)) / (5 * (self._n**2 - 1))
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.integers(self.lower, self.upper + 1, size)
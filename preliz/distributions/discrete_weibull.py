@@ -2,9 +2,11 @@ import numba as nb
 import numpy as np
 
 from preliz.distributions.distributions import Discrete
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, eps, num_kurtosis, num_skewness
 from preliz.internal.optimization import find_mode, optimize_ml, optimize_moments
-from preliz.internal.special import cdf_bounds, ppf_bounds_disc
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import cdf_bounds, log1mexp, ppf_bounds_disc
 
 
 class DiscreteWeibull(Discrete):
@@ -70,6 +72,14 @@ class DiscreteWeibull(Discrete):
         x = np.asarray(x)
         return nb_cdf(x, self.q, self.beta, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.q, self.beta)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.q, self.beta)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.q, self.beta, self.support[0], self.support[1])
@@ -80,36 +90,42 @@ class DiscreteWeibull(Discrete):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.q, self.beta)
 
+    @cache_method
     def entropy(self):
         x = self.xvals("full", 5000)
         logpdf = self.logpdf(x)
-        return -np.sum(np.exp(logpdf) * logpdf)
+        return -np.sum(np.exp(logpdf) * logpdf, axis=0)
 
+    @cache_method
     def mean(self):
         x_values = self.xvals("full")
         pdf = self.pdf(x_values)
-        return np.sum(x_values * pdf)
+        return np.sum(x_values * pdf, axis=0)
 
     def median(self):
         return self.ppf(0.5)
 
+    @cache_method
     def var(self):
         x_values = self.xvals("full")
         pdf = self.pdf(x_values)
-        return np.sum((x_values - self.mean()) ** 2 * pdf)
+        return np.sum((x_values - self.mean()) ** 2 * pdf, axis=0)
 
     def std(self):
         return self.var() ** 0.5
 
+    @cache_method
     def skewness(self):
         return num_skewness(self)
 
+    @cache_method
     def kurtosis(self):
         return num_kurtosis(self)
 
     def mode(self):
         return find_mode(self)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return self.ppf(random_state.uniform(size=size))
@@ -135,6 +151,20 @@ def nb_cdf(x, q, beta, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, q, beta):
+    if x < 0:
+        return -np.inf
+    return log1mexp((np.floor(x) + 1) ** beta * np.log(q))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, q, beta):
+    if x < 0:
+        return 0.0
+    return (np.floor(x) + 1) ** beta * np.log(q)
+
+
 @nb.njit(cache=True)
 def nb_ppf(p, q, beta, lower, upper):
     x_val = np.ceil((np.log(1 - p) / np.log(q)) ** (1 / beta) - 1)
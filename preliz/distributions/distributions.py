@@ -10,6 +10,7 @@ except ImportError:
     pass
 import numpy as np
 
+from preliz.internal.cache import cache_method, cached
 from preliz.internal.distribution_helper import init_vals, valid_distribution, valid_scalar_params
 from preliz.internal.optimization import find_mode, optimize_hdi
 from preliz.internal.plot_helper import (
@@ -35,7 +36,7 @@ class Distribution:
 
     def __repr__(self):
         name = self.__class__.__name__
-        if name in ["Truncated", "Censored", "Hurdle"]:
+        if name in ["Truncated", "Censored", "Hurdle", "Approximated"]:
             name += self.dist.__class__.__name__
         if name == "Mixture":
             name = (
@@ -67,6 +68,19 @@ class Distribution:
         else:
             return None
 
+    @property
+    def batch_shape(self):
+        """Shape of the batch defined by broadcasting the parameters.
+
+        Scalar parameters define a single distribution and have an empty batch shape.
+        Parameters that are arrays define a batch of distributions of the same family,
+        methods like ``pdf``, ``cdf`` or ``ppf`` broadcast their input against this shape.
+        """
+        if self.is_frozen:
+            return np.broadcast_shapes(*(np.shape(param) for param in self.params))
+        else:
+            return None
+
     def summary(self, mass=None, interval=None, fmt=".2f"):
         """
         Namedtuple with the mean, median, sd, and lower and upper bounds.
@@ -94,10 +108,8 @@ class Distribution:
 
         if valid_scalar_params(self):
             name = self.__class__.__name__
-            if name == "Truncated":
-                name = "Truncated" + self.dist.__class__.__name__
-            elif name == "Censored":
-                name = "Censored" + self.dist.__class__.__name__
+            if name in ["Truncated", "Censored", "Approximated"]:
+                name += self.dist.__class__.__name__
             elif name == "Mixture":
                 name = "Mixture" + "".join(
                     dict.fromkeys(dist.__class__.__name__ for dist in self.dist)
@@ -125,7 +137,7 @@ class Distribution:
         else:
             return None
 
-    def rvs(self, size=None, random_state=None):
+    def rvs(self, size=None, random_state=None, method="random", out=None, workers=None):
         """Random sample.
 
         Parameters
@@ -134,9 +146,51 @@ class Distribution:
             Defining number of random variates. Defaults to 1.
         random_state : {None, int, numpy.random.Generator, numpy.random.RandomState}
             Defaults to None
+        method : str
+            Use ``"random"`` (default) for independent draws or ``"qmc"`` for quasi-random draws,
+            scrambled Sobol points pushed through the ppf. The latter are not independent but
+            estimate integrals, like means or probabilities, with a much smaller error for the
+            same sample size. Use a power of 2 as the number of draws for the best results.
+        out : numpy.ndarray, optional
+            Array, for example a memory-mapped one, to write the draws into. Its shape is used as
+            ``size`` and it is filled in chunks, so no array of the same size is allocated.
+            The filled array is returned.
+        workers : int, optional
+            Number of threads the draws are split across, along the first axis. Use ``-1`` for
+            all the CPUs. Every thread draws from its own stream spawned from ``random_state``,
+            so the result is reproducible for a given seed and number of workers, but differs
+            from the one obtained with a different number of workers. Only for ``method="random"``.
         """
         raise NotImplementedError
 
+    def iter_rvs(self, chunk_size, total, random_state=None):
+        """Random sample generated in chunks.
+
+        All the chunks are drawn from the same stream, so large samples can be processed in
+        bounded memory.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Number of draws per chunk. The last chunk is smaller if ``total`` is not a multiple
+            of ``chunk_size``.
+        total : int
+            Total number of draws.
+        random_state : {None, int, numpy.random.Generator}
+            Defaults to None
+
+        Yields
+        ------
+        numpy.ndarray
+            Arrays of shape ``(n, *batch_shape)`` with ``n <= chunk_size``.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        random_state = np.random.default_rng(random_state)
+        for start in range(0, total, chunk_size):
+            n_draws = min(chunk_size, total - start)
+            yield self.rvs((n_draws, *self.batch_shape), random_state=random_state)
+
     def pdf(self, x):
         """Probability density/mass function.
 
@@ -195,7 +249,7 @@ class Distribution:
         x : array_like
             Values on which to evaluate the sf
         """
-        return 1 - self.cdf(x)
+        return np.exp(self.logsf(x))
 
     def logsf(self, x):
         """Log survival function log(1 - cdf).
@@ -205,7 +259,8 @@ class Distribution:
         x : array_like
             Values on which to evaluate the logsf
         """
-        return np.log(self.sf(x))
+        with np.errstate(divide="ignore"):
+            return np.log1p(-self.cdf(x))
 
     def isf(self, x):
         """Inverse survival function (inverse of sf).
@@ -267,8 +322,7 @@ class Distribution:
         for m_t in types:
             if m_t not in "mdvsk":
                 raise ValueError(
-                    "The input string should only contain the letters "
-                    "'m', 'd', 'v', 's', or 'k'."
+                    "The input string should only contain the letters 'm', 'd', 'v', 's', or 'k'."
                 )
             if m_t == "m":
                 moments.append(self.mean())
@@ -283,6 +337,24 @@ class Distribution:
 
         return moments
 
+    def approximate(self, tol=1e-10):
+        """
+        Return a surrogate distribution with fast cdf and ppf.
+
+        The cdf and ppf are replaced by piecewise Chebyshev interpolants, so evaluating them has
+        the same small cost for any distribution. Useful for distributions with an expensive cdf
+        or ppf, like mixtures, truncated or censored distributions, that are evaluated many times.
+        See :class:`preliz.distributions.approximated.Approximated` for the error guarantees.
+
+        Parameters
+        ----------
+        tol : float
+            Error tolerance of the interpolants. Defaults to 1e-10.
+        """
+        from preliz.distributions.approximated import Approximated
+
+        return Approximated(self, tol)
+
     def eti(self, mass=None, fmt=".2f"):
         """Equal-tailed interval containing `mass`.
 
@@ -304,7 +376,9 @@ class Distribution:
             raise ValueError("Invalid format string.")
 
         if valid_scalar_params(self):
-            lower_tail, upper_tail = self.ppf([(1 - mass) / 2, 1 - (1 - mass) / 2])
+            lower_tail, upper_tail = cached(
+                self, "eti", lambda mass: self.ppf([(1 - mass) / 2, 1 - (1 - mass) / 2]), mass
+            )
             if self.kind == "continuous" and fmt != "none":
                 lower_tail = float(f"{lower_tail:{fmt}}")
                 upper_tail = float(f"{upper_tail:{fmt}}")
@@ -340,7 +414,9 @@ class Distribution:
             warnings.warn("HDI may not be correct for multimodal distributions")
 
         if valid_scalar_params(self):
-            lower_tail, upper_tail = optimize_hdi(self, mass)
+            lower_tail, upper_tail = cached(
+                self, "hdi", lambda mass: optimize_hdi(self, mass), mass
+            )
             if self.kind == "continuous" and fmt != "none":
                 lower_tail = float(f"{lower_tail:{fmt}}")
                 upper_tail = float(f"{upper_tail:{fmt}}")
@@ -474,6 +550,7 @@ class Distribution:
         else:
             return lower >= s_l and upper <= s_u
 
+    @cache_method
     def _finite_endpoints(self, support):
         """
         Return finite endpoints even for unbounded distributions.
@@ -491,10 +568,17 @@ class Distribution:
 
             lower_ep, upper_ep = self.support
 
-            if not np.isfinite(lower_ep) or support == "restricted":
-                lower_ep = self.ppf(0.0001)
-            if not np.isfinite(upper_ep) or support == "restricted":
-                upper_ep = self.ppf(0.9999)
+            if self.batch_shape:
+                if support == "restricted":
+                    lower_ep, upper_ep = self.ppf(0.0001), self.ppf(0.9999)
+                else:
+                    lower_ep = np.where(np.isfinite(lower_ep), lower_ep, self.ppf(0.0001))
+                    upper_ep = np.where(np.isfinite(upper_ep), upper_ep, self.ppf(0.9999))
+            else:
+                if not np.isfinite(lower_ep) or support == "restricted":
+                    lower_ep = self.ppf(0.0001)
+                if not np.isfinite(upper_ep) or support == "restricted":
+                    upper_ep = self.ppf(0.9999)
 
         return lower_ep, upper_ep
 
@@ -517,16 +601,29 @@ class Distribution:
             For discrete distributions the returned values may be fewer
             than `n_points` if the actual number of discrete values in the support of the
             distribution is smaller than `n_points`.
+
+        Returns
+        -------
+        x_vals : array
+            For scalar parameters an array of shape ``(n_points,)``. For batched parameters
+            the first axis indexes the values and the rest broadcast against ``batch_shape``.
         """
         lower_ep, upper_ep = self._finite_endpoints(support)
+        batch_shape = self.batch_shape
 
         if self.kind == "continuous":
             if n_points is None:
                 n_points = 1000
+            if batch_shape:
+                lower_ep = np.broadcast_to(lower_ep, batch_shape)
+                upper_ep = np.broadcast_to(upper_ep, batch_shape)
             return _continuous_xvals(lower_ep, upper_ep, n_points)
         else:
             if n_points is None:
                 n_points = 200
+            if batch_shape:
+                x_vals = _discrete_xvals(np.min(lower_ep), np.max(upper_ep), n_points)
+                return x_vals.reshape(-1, *(1,) * len(batch_shape))
             return _discrete_xvals(lower_ep, upper_ep, n_points)
 
     def plot_pdf(
@@ -57,7 +57,7 @@ class Multivariate:
         else:
             return None
 
-    def rvs(self, *args, **kwds):
+    def rvs(self, *args, method="random", **kwds):
         """Random sample.
 
         Parameters
@@ -66,8 +66,19 @@ class Multivariate:
             Defining number of random variates. Defaults to 1.
         random_state : {None, int, numpy.random.Generator, numpy.random.RandomState}
             Defaults to None
+        method : str
+            Use ``"random"`` (default) for independent draws or ``"qmc"`` for quasi-random draws
+            from a scrambled Sobol sequence, one dimension per component. Only available for
+            Dirichlet and MvNormal.
         """
-        return self.rv_frozen.rvs(*args, **kwds)
+        if method == "random":
+            return self.rv_frozen.rvs(*args, **kwds)
+        if method == "qmc":
+            return self._qmc_rvs(*args, **kwds)
+        raise ValueError(f"method must be 'random' or 'qmc', not {method!r}")
+
+    def _qmc_rvs(self, size=None, random_state=None):
+        raise NotImplementedError
 
     def cdf(self, x):
         """Cumulative distribution function.
@@ -3,9 +3,12 @@ import numpy as np
 from scipy.stats import skew
 
 from preliz.distributions.distributions import Continuous
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import find_ppf
-from preliz.internal.special import erf, mean_and_std, norm_logcdf
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import erf, log1mexp, mean_and_std, norm_logcdf
 
 
 class ExGaussian(Continuous):
@@ -86,6 +89,14 @@ class ExGaussian(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.sigma, self.nu)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.sigma, self.nu)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.sigma, self.nu)
+
     def ppf(self, q):
         q = np.asarray(q)
         return find_ppf(self, q)
@@ -96,19 +107,18 @@ class ExGaussian(Continuous):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.mu, self.sigma, self.nu)
 
+    @cache_method
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
-        return -np.trapz(np.exp(logpdf) * logpdf, x_values)
+        return quad_moments(self, "e")[0]
 
     def mean(self):
-        return self.mu + self.nu
+        return np.broadcast_to(self.mu + self.nu, self.batch_shape)
 
     def median(self):
         return self.ppf(0.5)
 
     def var(self):
-        return self.sigma**2 + self.nu**2
+        return np.broadcast_to(self.sigma**2 + self.nu**2, self.batch_shape)
 
     def std(self):
         return self.var() ** 0.5
@@ -116,13 +126,14 @@ class ExGaussian(Continuous):
     def skewness(self):
         nus2 = (self.nu / self.sigma) ** 2
         opnus2 = 1.0 + nus2
-        return 2 * (self.nu / self.sigma) ** 3 * opnus2 ** (-1.5)
+        return np.broadcast_to(2 * (self.nu / self.sigma) ** 3 * opnus2 ** (-1.5), self.batch_shape)
 
     def kurtosis(self):
         nus2 = (self.nu / self.sigma) ** 2
         opnus2 = 1.0 + nus2
-        return 6.0 * nus2 * nus2 * opnus2 ** (-2)
+        return np.broadcast_to(6.0 * nus2 * nus2 * opnus2 ** (-2), self.batch_shape)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.normal(self.mu, self.sigma, size) + random_state.exponential(
@@ -155,6 +166,31 @@ def nb_cdf(x, mu, sigma, nu):
         return cdf_n
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, mu, sigma, nu):
+    log_cdf_n = norm_logcdf((x - mu) / sigma)
+    if x == -np.inf or nu <= 0.05 * sigma:
+        return log_cdf_n
+    log_term = 0.5 / nu * (2 * mu + sigma**2 / nu - 2 * x) + norm_logcdf(
+        (x - (mu + (sigma**2) / nu)) / sigma
+    )
+    return log_cdf_n + log1mexp(min(log_term - log_cdf_n, 0.0))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, mu, sigma, nu):
+    log_sf_n = norm_logcdf((mu - x) / sigma)
+    if x == -np.inf:
+        return 0.0
+    if x == np.inf or nu <= 0.05 * sigma:
+        return log_sf_n
+    log_term = 0.5 / nu * (2 * mu + sigma**2 / nu - 2 * x) + norm_logcdf(
+        (x - (mu + (sigma**2) / nu)) / sigma
+    )
+    log_max = max(log_sf_n, log_term)
+    return log_max + np.log1p(np.exp(min(log_sf_n, log_term) - log_max))
+
+
 @nb.vectorize(nopython=True, cache=True)
 def nb_logpdf(x, mu, sigma, nu):
     if nu > 0.05 * sigma:
@@ -3,7 +3,8 @@ import numpy as np
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
-from preliz.internal.special import cdf_bounds, mean_sample, ppf_bounds_cont, xlog1py
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import cdf_bounds, log1mexp, mean_sample, ppf_bounds_cont, xlog1py
 
 
 class Exponential(Continuous):
@@ -89,6 +90,14 @@ class Exponential(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.lam)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.lam)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.lam)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.beta)
@@ -118,11 +127,12 @@ class Exponential(Continuous):
         return self.beta**2
 
     def skewness(self):
-        return 2
+        return np.full(self.batch_shape, 2.0)
 
     def kurtosis(self):
-        return 6
+        return np.full(self.batch_shape, 6.0)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.exponential(self.beta, size)
@@ -142,6 +152,20 @@ def nb_cdf(x, lam):
     return cdf_bounds(1 - np.exp(-x_lam), x, 0, np.inf)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, lam):
+    if x <= 0:
+        return -np.inf
+    return log1mexp(-lam * x)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, lam):
+    if x <= 0:
+        return 0.0
+    return -lam * x
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, beta):
     return ppf_bounds_cont(-xlog1py(beta, -q), q, 0, np.inf)
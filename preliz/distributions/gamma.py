@@ -1,11 +1,21 @@
 import numba as nb
 import numpy as np
-from scipy.special import gammainc, gammaincinv
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, any_not_none, eps
 from preliz.internal.optimization import optimize_ml
-from preliz.internal.special import cdf_bounds, digamma, gammaln, ppf_bounds_cont, xlogy
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    cdf_bounds,
+    digamma,
+    gammainc,
+    gammaincinv,
+    gammaln,
+    log_gammainc,
+    log_gammaincc,
+    ppf_bounds_cont,
+    xlogy,
+)
 
 
 class Gamma(Continuous):
@@ -117,6 +127,14 @@ class Gamma(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.alpha, self.beta, 0, np.inf)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.alpha, self.beta)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.alpha, self.beta)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.alpha, self.beta, 0, np.inf)
@@ -146,11 +164,12 @@ class Gamma(Continuous):
         return self.var() ** 0.5
 
     def skewness(self):
-        return 2 / self.alpha**0.5
+        return np.broadcast_to(2 / self.alpha**0.5, self.batch_shape)
 
     def kurtosis(self):
-        return 6 / self.alpha
+        return np.broadcast_to(6 / self.alpha, self.batch_shape)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.gamma(self.alpha, 1 / self.beta, size)
@@ -163,11 +182,27 @@ class Gamma(Continuous):
         optimize_ml(self, sample)
 
 
+@nb.njit(cache=True)
 def nb_cdf(x, alpha, beta, lower, upper):
-    prob = gammainc(alpha, x / (1 / beta))
+    prob = gammainc(alpha, x * beta)
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, alpha, beta):
+    if x <= 0:
+        return -np.inf
+    return log_gammainc(alpha, x * beta)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, alpha, beta):
+    if x <= 0:
+        return 0.0
+    return log_gammaincc(alpha, x * beta)
+
+
+@nb.njit(cache=True)
 def nb_ppf(q, alpha, beta, lower, upper):
     x_val = gammaincinv(alpha, q) * (1 / beta)
     return ppf_bounds_cont(x_val, q, lower, upper)
@@ -178,8 +213,8 @@ def nb_logpdf(x, alpha, beta):
     if x <= 0:
         return -np.inf
     else:
-        x = x / (1 / beta)
-        return xlogy(alpha - 1.0, x) - x - gammaln(alpha) - np.log(1 / beta)
+        x = x * beta
+        return xlogy(alpha - 1.0, x) - x - gammaln(alpha) + np.log(beta)
 
 
 @nb.njit(cache=True)
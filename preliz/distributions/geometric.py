@@ -3,7 +3,15 @@ import numpy as np
 
 from preliz.distributions.distributions import Discrete
 from preliz.internal.distribution_helper import eps
-from preliz.internal.special import cdf_bounds, mean_sample, ppf_bounds_disc, xlog1py, xlogx
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    cdf_bounds,
+    log1mexp,
+    mean_sample,
+    ppf_bounds_disc,
+    xlog1py,
+    xlogx,
+)
 
 
 class Geometric(Discrete):
@@ -63,6 +71,14 @@ class Geometric(Discrete):
         x = np.asarray(x)
         return nb_cdf(x, self.p, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.p)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.p)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.p, self.support[0], self.support[1])
@@ -97,6 +113,7 @@ class Geometric(Discrete):
     def kurtosis(self):
         return 6 + (self.p**2) / (1 - self.p)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.geometric(self.p, size=size)
@@ -117,6 +134,20 @@ def nb_cdf(x, p, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, p):
+    if x < 1:
+        return -np.inf
+    return log1mexp(np.floor(x) * np.log1p(-p))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, p):
+    if x < 1:
+        return 0.0
+    return np.floor(x) * np.log1p(-p)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, p, lower, upper):
     x_vals = np.ceil(np.log(1 - q) / np.log(1 - p))
@@ -5,7 +5,8 @@ from scipy.special import zeta
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
-from preliz.internal.special import cdf_bounds, ppf_bounds_cont
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import cdf_bounds, log1mexp, ppf_bounds_cont
 
 
 class Gumbel(Continuous):
@@ -77,6 +78,14 @@ class Gumbel(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.beta, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.beta)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.beta)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.mu, self.beta, self.support[0], self.support[1])
@@ -88,29 +97,39 @@ class Gumbel(Continuous):
         return nb_neg_logpdf(x, self.mu, self.beta)
 
     def entropy(self):
-        return nb_entropy(self.beta)
+        return np.broadcast_to(nb_entropy(self.beta), self.batch_shape)
+
+    def _entropy_grad(self):
+        return np.array([0, 1 / self.beta])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        pdf = np.nan_to_num(self.pdf(x))
+        z_val = np.nan_to_num((x - self.mu) / self.beta)
+        return np.stack([-pdf, -pdf * z_val])
 
     def mean(self):
         return self.mu + self.beta * np.euler_gamma
 
     def mode(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def median(self):
         return self.mu - self.beta * np.log(np.log(2))
 
     def var(self):
-        return np.pi**2 / 6 * self.beta**2
+        return np.broadcast_to(np.pi**2 / 6 * self.beta**2, self.batch_shape)
 
     def std(self):
         return self.var() ** 0.5
 
     def skewness(self):
-        return 12 * 6**0.5 * zeta(3) / np.pi**3
+        return np.full(self.batch_shape, 12 * 6**0.5 * zeta(3) / np.pi**3)
 
     def kurtosis(self):
-        return 12 / 5
+        return np.full(self.batch_shape, 12 / 5)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return nb_ppf(random_state.uniform(size=size), self.mu, self.beta, -np.inf, np.inf)
@@ -130,6 +149,16 @@ def nb_cdf(x, mu, beta, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.njit(cache=True)
+def nb_logcdf(x, mu, beta):
+    return -np.exp(-(x - mu) / beta)
+
+
+@nb.njit(cache=True)
+def nb_logsf(x, mu, beta):
+    return log1mexp(-np.exp(-(x - mu) / beta))
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, mu, beta, lower, upper):
     x_val = mu - beta * np.log(-np.log(q))
@@ -4,6 +4,7 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import eps
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import cdf_bounds, ppf_bounds_cont
 
 
@@ -65,6 +66,14 @@ class HalfCauchy(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.beta, 0, np.inf)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.beta)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.beta)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.beta, 0, np.inf)
@@ -79,7 +88,7 @@ class HalfCauchy(Continuous):
         return nb_entropy(self.beta)
 
     def mean(self):
-        return np.inf
+        return np.full_like(self.beta, np.inf)
 
     def mode(self):
         return np.zeros_like(self.beta)
@@ -88,17 +97,18 @@ class HalfCauchy(Continuous):
         return self.ppf(0.5)
 
     def var(self):
-        return np.inf
+        return np.full_like(self.beta, np.inf)
 
     def std(self):
-        return np.inf
+        return np.full_like(self.beta, np.inf)
 
     def skewness(self):
-        return np.nan
+        return np.full_like(self.beta, np.nan)
 
     def kurtosis(self):
-        return np.nan
+        return np.full_like(self.beta, np.nan)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         random_samples = random_state.uniform(0, 1, size)
@@ -117,6 +127,26 @@ def nb_cdf(x, beta, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, beta):
+    if x <= 0:
+        return -np.inf
+    if x < beta:
+        return np.log(2 / np.pi * np.arctan2(x, beta))
+    return np.log1p(-2 / np.pi * np.arctan2(beta, x))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, beta):
+    if x <= 0:
+        return 0.0
+    if x == np.inf:
+        return -np.inf
+    if x > beta:
+        return np.log(2 / np.pi * np.arctan2(beta, x))
+    return np.log1p(-2 / np.pi * np.arctan2(x, beta))
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, beta, lower, upper):
     x_val = beta * np.tan(np.pi / 2 * q)
@@ -141,6 +171,6 @@ def nb_neg_logpdf(x, beta):
     return (-nb_logpdf(x, beta)).sum()
 
 
-@nb.njit(cache=True)
+@nb.njit(cache=True, nogil=True)
 def nb_rvs(random_samples, beta):
     return beta * np.tan(np.pi / 2 * random_samples)
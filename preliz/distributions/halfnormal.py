@@ -3,7 +3,8 @@ import numpy as np
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps, from_precision, to_precision
-from preliz.internal.special import erfinv, half_erf, ppf_bounds_cont
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import erfinv, half_erf, log_erf, log_erfc, ppf_bounds_cont
 
 
 class HalfNormal(Continuous):
@@ -90,6 +91,14 @@ class HalfNormal(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.sigma)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.sigma)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.sigma)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.sigma, self.support[0], self.support[1])
@@ -119,11 +128,12 @@ class HalfNormal(Continuous):
         return self.sigma * 0.6028102749890869
 
     def skewness(self):
-        return 0.9952717464311565
+        return np.full(self.batch_shape, 0.9952717464311565)
 
     def kurtosis(self):
-        return 0.8691773036059736
+        return np.full(self.batch_shape, 0.8691773036059736)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return np.abs(random_state.normal(0, self.sigma, size))
@@ -140,6 +150,20 @@ def nb_cdf(x, sigma):
     return half_erf(x / (sigma * 2**0.5))
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, sigma):
+    if x <= 0:
+        return -np.inf
+    return log_erf(x / (sigma * 2**0.5))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, sigma):
+    if x <= 0:
+        return 0.0
+    return log_erfc(x / (sigma * 2**0.5))
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, sigma, lower, upper):
     x_vals = np.asarray(sigma * 2**0.5 * erfinv(q))
@@ -4,6 +4,7 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps, from_precision, to_precision
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import (
     beta,
     betainc,
@@ -12,6 +13,7 @@ from preliz.internal.special import (
     digamma,
     gamma,
     gammaln,
+    log_betainc,
     ppf_bounds_cont,
 )
 
@@ -116,6 +118,14 @@ class HalfStudentT(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.nu, self.sigma)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.nu, self.sigma)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.nu, self.sigma)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.nu, self.sigma)
@@ -130,19 +140,18 @@ class HalfStudentT(Continuous):
         return nb_entropy(self.nu, self.sigma)
 
     def mean(self):
-        if self.nu > 1:
-            gamma0 = gamma((self.nu + 1) / 2)
-            gamma1 = gamma(self.nu / 2)
-            if np.isfinite(gamma0) and np.isfinite(gamma1):
-                mean = (
-                    2 * self.sigma * (self.nu / np.pi) ** 0.5 * (gamma0 / (gamma1 * (self.nu - 1)))
-                )
-            else:
-                mean = self.sigma * (2 / np.pi) ** 0.5
-        return mean
+        gamma0 = gamma((self.nu + 1) / 2)
+        gamma1 = gamma(self.nu / 2)
+        # assume nu is large enough that the mean of the halfnormal is a good approximation
+        mean = np.where(
+            np.isfinite(gamma0) & np.isfinite(gamma1),
+            2 * self.sigma * (self.nu / np.pi) ** 0.5 * (gamma0 / (gamma1 * (self.nu - 1))),
+            self.sigma * (2 / np.pi) ** 0.5,
+        )
+        return np.where(self.nu > 1, mean, np.inf)
 
     def mode(self):
-        return np.zeros_like(self.sigma)
+        return np.zeros(self.batch_shape)
 
     def median(self):
         return self.ppf(0.5)
@@ -150,16 +159,17 @@ class HalfStudentT(Continuous):
     def var(self):
         gamma0 = gamma((self.nu + 1) / 2)
         gamma1 = gamma(self.nu / 2)
-        if self.nu > 2:
-            if np.isfinite(gamma0) and np.isfinite(gamma1):
-                var = self.sigma**2 * (
-                    (self.nu / (self.nu - 2))
-                    - ((4 * self.nu) / (np.pi * (self.nu - 1) ** 2)) * (gamma0 / gamma1) ** 2
-                )
-            else:
-                # assume nu is large enough that the std of the halfnormal is a good approximation
-                var = self.sigma**2 * (1 - 2.0 / np.pi)
-        return var
+        # assume nu is large enough that the std of the halfnormal is a good approximation
+        var = np.where(
+            np.isfinite(gamma0) & np.isfinite(gamma1),
+            self.sigma**2
+            * (
+                (self.nu / (self.nu - 2))
+                - ((4 * self.nu) / (np.pi * (self.nu - 1) ** 2)) * (gamma0 / gamma1) ** 2
+            ),
+            self.sigma**2 * (1 - 2.0 / np.pi),
+        )
+        return np.where(self.nu > 2, var, np.where(self.nu > 1, np.inf, np.nan))
 
     def std(self):
         return self.var() ** 0.5
@@ -170,6 +180,7 @@ class HalfStudentT(Continuous):
     def kurtosis(self):
         return NotImplemented
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return np.abs(random_state.standard_t(self.nu, size) * self.sigma)
@@ -206,6 +217,26 @@ def nb_cdf(x, nu, sigma):
     return cdf_bounds(np.where(x < 0, factor, 1 - factor) * 2 - 1, x, 0, np.inf)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, nu, sigma):
+    if x <= 0:
+        return -np.inf
+    if x == np.inf:
+        return 0.0
+    x = x / sigma
+    return log_betainc(0.5, 0.5 * nu, x**2 / (x**2 + nu))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, nu, sigma):
+    if x <= 0:
+        return 0.0
+    if x == np.inf:
+        return -np.inf
+    x = x / sigma
+    return log_betainc(0.5 * nu, 0.5, nu / (x**2 + nu))
+
+
 @nb.njit(cache=True)
 def nb_ppf(p, nu, sigma):
     p_factor = (p + 1) / 2
@@ -1,7 +1,11 @@
 import numpy as np
 
 from preliz.distributions.distributions import DistributionTransformer
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, eps
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import log1mexp
 
 
 class Hurdle(DistributionTransformer):
@@ -74,13 +78,13 @@ class Hurdle(DistributionTransformer):
         self.support = self.dist.support
         self.params_support = (*self.dist.params_support, (0, 1))
 
+    @cache_method
     def mean(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
         if self.kind == "discrete":
-            return np.sum(x_values * pdf)
+            x_values = self.xvals("full")
+            return np.sum(x_values * self.pdf(x_values), axis=0)
         else:
-            return np.trapz(x_values * pdf, x_values)
+            return self.psi * self._continuous_moments()[0]
 
     def mode(self):
         if self.kind == "discrete":
@@ -95,42 +99,47 @@ class Hurdle(DistributionTransformer):
     def median(self):
         return self.ppf(0.5)
 
+    @cache_method
     def var(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
         if self.kind == "discrete":
-            return np.sum((x_values - self.mean()) ** 2 * pdf)
+            x_values = self.xvals("full")
+            return np.sum((x_values - self.mean()) ** 2 * self.pdf(x_values), axis=0)
         else:
-            return np.trapz((x_values - self.mean()) ** 2 * pdf, x_values)
+            # mixture of the point mass at zero and the continuous part
+            mean, var, _ = self._continuous_moments()
+            return self.psi * var + self.psi * (1 - self.psi) * mean**2
 
     def std(self):
         return self.var() ** 0.5
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return self.ppf(random_state.uniform(size=size))
 
     def pdf(self, x):
         if self.dist == "discrete":
-            return np.where(
-                x == 0, 1 - self.psi, self.psi * self.dist.pdf(x) / (1 - self.dist.cdf(0))
-            )
+            return np.where(x == 0, 1 - self.psi, self.psi * self.dist.pdf(x) / self.dist.sf(0))
         else:
-            return np.where(
-                x == 0, 1 - self.psi, self.psi * self.dist.pdf(x) / (1 - self.dist.cdf(eps))
-            )
+            return np.where(x == 0, 1 - self.psi, self.psi * self.dist.pdf(x) / self.dist.sf(eps))
 
     def cdf(self, x):
-        if self.dist == "discrete":
-            return np.where(
-                x <= 0, 1 - self.psi, 1 - self.psi * (1 - self.dist.cdf(x)) / (1 - self.dist.cdf(0))
-            )
-        else:
-            return np.where(
-                x <= 0,
-                1 - self.psi,
-                1 - self.psi * (1 - self.dist.cdf(x)) / (1 - self.dist.cdf(eps)),
-            )
+        return np.exp(self.logcdf(x))
+
+    def logcdf(self, x):
+        x = np.asarray(x)
+        with np.errstate(divide="ignore"):
+            return np.where(x <= 0, np.log1p(-self.psi), log1mexp(self._logsf(x)))
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        with np.errstate(divide="ignore"):
+            return np.where(x <= 0, np.log(self.psi), self._logsf(x))
+
+    def _logsf(self, x):
+        """Logsf for x > 0, the base distribution rescaled to the mass psi above zero."""
+        with np.errstate(invalid="ignore"):
+            return np.minimum(np.log(self.psi) + self.dist.logsf(x) - self.dist.logsf(eps), 0)
 
     def ppf(self, q):
         if self.kind == "discrete":
@@ -151,23 +160,28 @@ class Hurdle(DistributionTransformer):
             pdf_values = np.where(
                 x == 0,
                 np.log(1 - self.psi),
-                np.log(self.psi) + self.dist.logpdf(x) - np.log(1 - self.dist.cdf(0)),
+                np.log(self.psi) + self.dist.logpdf(x) - self.dist.logsf(0),
             )
         else:
             pdf_values = np.where(
                 x == 0,
                 np.log(1 - self.psi),
-                np.log(self.psi) + self.dist.logpdf(x) - np.log(1 - self.dist.cdf(eps)),
+                np.log(self.psi) + self.dist.logpdf(x) - self.dist.logsf(eps),
             )
         return pdf_values
 
+    @cache_method
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
         if self.kind == "discrete":
-            return -np.sum(np.exp(logpdf) * logpdf)
+            x_values = self.xvals("restricted")
+            logpdf = self.logpdf(x_values)
+            return -np.sum(np.exp(logpdf) * logpdf, axis=0)
         else:
-            return -np.trapz(np.exp(logpdf) * logpdf, x_values)
+            return self._continuous_moments()[2]
+
+    def _continuous_moments(self):
+        """Mean and variance of the continuous part, and the entropy of the density for x > 0."""
+        return quad_moments(self, "mve", lower=np.maximum(self.dist.support[0], 0))
 
     def _neg_logpdf(self, x):
         return -self.logpdf(x).sum()
@@ -2,9 +2,18 @@ import numba as nb
 import numpy as np
 
 from preliz.distributions.distributions import Discrete
-from preliz.internal.distribution_helper import all_not_none
+from preliz.internal.cache import cache_method
+from preliz.internal.distribution_helper import (
+    TABLE_TAIL_MASS,
+    all_not_none,
+    binomial_tail_bounds,
+    cdf_from_table,
+    cdf_table,
+    ppf_from_table,
+)
 from preliz.internal.optimization import find_ppf, optimize_ml, optimize_moments
-from preliz.internal.special import betaln, cdf_bounds
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import betaln, cdf_bounds, ppf_bounds_disc, xlogy
 
 eps = np.finfo(float).eps
 
@@ -66,7 +75,8 @@ class HyperGeometric(Discrete):
         self.k = np.int64(k)
         self.n = np.int64(n)
         self.params = (self.N, self.k, self.n)
-        self.support = (max(0, n - N + k), min(k, n))
+        self.support = (np.maximum(0, self.n - self.N + self.k), np.minimum(self.k, self.n))
+        self._cdf_table = None
         self.is_frozen = True
 
     def pdf(self, x):
@@ -74,19 +84,38 @@ class HyperGeometric(Discrete):
         return np.exp(self.logpdf(x))
 
     def cdf(self, x):
-        if isinstance(x, np.ndarray | list | tuple):
-            cdf_values = np.zeros_like(x, dtype=float)
-            for i, val in enumerate(x):
-                x_vals = np.arange(self.support[0], val + 1)
-                cdf_values[i] = np.sum(self.pdf(x_vals))
-            return cdf_bounds(cdf_values, x, *self.support)
+        x = np.asarray(x)
+        table = self._get_cdf_table()
+        if table is not None:
+            cdf_values = cdf_from_table(*table, x)
         else:
-            x_vals = np.arange(self.support[0], x + 1)
-            return cdf_bounds(np.sum(self.pdf(x_vals)), x, *self.support)
+            x_b, N, k, n, lower, upper = np.broadcast_arrays(x, *self.params, *self.support)
+            cdf_values = np.zeros(x_b.shape)
+            for idx in np.ndindex(x_b.shape):
+                x_vals = np.arange(lower[idx], np.floor(x_b[idx]) + 1)
+                logpdf = nb_logpdf(x_vals, N[idx], k[idx], n[idx], lower[idx], upper[idx])
+                cdf_values[idx] = np.sum(np.exp(logpdf))
+        return cdf_bounds(cdf_values, x, *self.support)
 
     def ppf(self, q):
         q = np.asarray(q)
-        return find_ppf(self, q)
+        table = self._get_cdf_table()
+        if table is None:
+            return find_ppf(self, q)
+        return ppf_bounds_disc(ppf_from_table(*table, q), q, *self.support)
+
+    def _get_cdf_table(self):
+        # built once per parameter set, `_update` resets it
+        if self._cdf_table is None:
+            self._cdf_table = cdf_table(self, self._table_window())
+        return self._cdf_table
+
+    def _table_window(self):
+        # the tails are bounded by those of a binomial with the same mean, Hoeffding (1963),
+        # and the roles of the draws and the successes can be swapped
+        lower_d, upper_d = binomial_tail_bounds(self.n, self.k / self.N, TABLE_TAIL_MASS)
+        lower_s, upper_s = binomial_tail_bounds(self.k, self.n / self.N, TABLE_TAIL_MASS)
+        return np.maximum(lower_d, lower_s), np.minimum(upper_d, upper_s)
 
     def logpdf(self, x):
         return nb_logpdf(x, self.N, self.k, self.n, *self.support)
@@ -94,10 +123,11 @@ class HyperGeometric(Discrete):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.N, self.k, self.n, *self.support)
 
+    @cache_method
     def entropy(self):
         x_values = self.xvals("full")
-        logpdf = self.logpdf(x_values)
-        return -np.sum(np.exp(logpdf) * logpdf)
+        pdf = self.pdf(x_values)
+        return -np.sum(xlogy(pdf, pdf), axis=0)
 
     def mean(self):
         return self.n * self.k / self.N
@@ -145,8 +175,9 @@ class HyperGeometric(Discrete):
 
     def mode(self):
         value = (self.n + 1) * (self.k + 1) / (self.N + 2)
-        return max(np.ceil(value) - 1, np.floor(value))
+        return np.maximum(np.ceil(value) - 1, np.floor(value))
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.hypergeometric(self.k, self.N - self.k, self.n, size=size)
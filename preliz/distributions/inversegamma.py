@@ -1,11 +1,21 @@
 import numba as nb
 import numpy as np
-from scipy.special import gammaincc, gammainccinv
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, any_not_none, eps
 from preliz.internal.optimization import optimize_ml
-from preliz.internal.special import cdf_bounds, digamma, gammaln, ppf_bounds_cont, xlogy
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    cdf_bounds,
+    digamma,
+    gammaincc,
+    gammainccinv,
+    gammaln,
+    log_gammainc,
+    log_gammaincc,
+    ppf_bounds_cont,
+    xlogy,
+)
 
 
 class InverseGamma(Continuous):
@@ -105,6 +115,14 @@ class InverseGamma(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.alpha, self.beta, 0, np.inf)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.alpha, self.beta)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.alpha, self.beta)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.alpha, self.beta, 0, np.inf)
@@ -136,15 +154,22 @@ class InverseGamma(Continuous):
         return self.var() ** 0.5
 
     def skewness(self):
-        return np.where(self.alpha > 3, 4 * (self.alpha - 2) ** 0.5 / (self.alpha - 3), np.nan)
+        return np.broadcast_to(
+            np.where(self.alpha > 3, 4 * (self.alpha - 2) ** 0.5 / (self.alpha - 3), np.nan),
+            self.batch_shape,
+        )
 
     def kurtosis(self):
-        return np.where(
-            self.alpha > 4,
-            6 * (5 * self.alpha - 11) / ((self.alpha - 3) * (self.alpha - 4)),
-            np.nan,
+        return np.broadcast_to(
+            np.where(
+                self.alpha > 4,
+                6 * (5 * self.alpha - 11) / ((self.alpha - 3) * (self.alpha - 4)),
+                np.nan,
+            ),
+            self.batch_shape,
         )
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return 1 / random_state.gamma(self.alpha, 1 / self.beta, size)
@@ -157,11 +182,27 @@ class InverseGamma(Continuous):
         optimize_ml(self, sample)
 
 
+@nb.njit(cache=True)
 def nb_cdf(x, alpha, beta, lower, upper):
     prob = gammaincc(alpha, beta / x)
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, alpha, beta):
+    if x <= 0:
+        return -np.inf
+    return log_gammaincc(alpha, beta / x)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, alpha, beta):
+    if x <= 0:
+        return 0.0
+    return log_gammainc(alpha, beta / x)
+
+
+@nb.njit(cache=True)
 def nb_ppf(q, alpha, beta, lower, upper):
     x_val = beta / gammainccinv(alpha, q)
     return ppf_bounds_cont(x_val, q, lower, upper)
@@ -4,7 +4,17 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml, optimize_moments
-from preliz.internal.special import beta, cdf_bounds, digamma, ppf_bounds_cont, xlog1py, xlogy
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    beta,
+    cdf_bounds,
+    digamma,
+    log1mexp,
+    ppf_bounds_cont,
+    trigamma,
+    xlog1py,
+    xlogy,
+)
 
 
 class Kumaraswamy(Continuous):
@@ -54,7 +64,7 @@ class Kumaraswamy(Continuous):
         self.params = (self.a, self.b)
         self.param_names = ("a", "b")
         self.params_support = ((eps, np.inf), (eps, np.inf))
-        if (a and b) is not None:
+        if all_not_none(a, b):
             self._update(a, b)
 
     def _get_frozen(self):
@@ -77,6 +87,14 @@ class Kumaraswamy(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.a, self.b)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.a, self.b)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.a, self.b)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.a, self.b)
@@ -90,6 +108,23 @@ class Kumaraswamy(Continuous):
     def entropy(self):
         return nb_entropy(self.a, self.b)
 
+    def _entropy_grad(self):
+        h_b = digamma(self.b + 1) + np.euler_gamma
+        return np.array(
+            [
+                h_b / self.a**2 - 1 / self.a,
+                1 / self.b**2 + (1 - 1 / self.a) * trigamma(self.b + 1) - 1 / self.b,
+            ]
+        )
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        inside = (x > 0) & (x < 1)
+        x_in = np.where(inside, x, 0.5)
+        d_a = np.where(inside, x_in * self.pdf(x_in) * np.log(x_in) / self.a, 0)
+        d_b = np.where(inside, -self.sf(x_in) * np.log1p(-(x_in**self.a)), 0)
+        return np.stack([d_a, d_b])
+
     def mean(self):
         return _mom(self.a, self.b, 1)
 
@@ -123,6 +158,7 @@ class Kumaraswamy(Continuous):
         m_4 = _mom(self.a, self.b, 4)
         return (m_4 + mean * (-4 * m_3 + mean * (6 * m_2 - 3 * mean**2))) / var**2 - 3
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return self.ppf(random_state.random(size))
@@ -140,6 +176,24 @@ def nb_cdf(x, a, b):
     return cdf_bounds(prob, x, 0, 1)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, a, b):
+    if x <= 0:
+        return -np.inf
+    if x >= 1:
+        return 0.0
+    return log1mexp(b * np.log1p(-(x**a)))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, a, b):
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return -np.inf
+    return b * np.log1p(-(x**a))
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, a, b):
     x_val = (1 - (1 - q) ** (1 / b)) ** (1 / a)
@@ -3,6 +3,7 @@ import numpy as np
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
+from preliz.internal.sampling import rvs_method
 
 
 class Laplace(Continuous):
@@ -69,6 +70,14 @@ class Laplace(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.b)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.b)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.b)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.mu, self.b)
@@ -80,29 +89,39 @@ class Laplace(Continuous):
         return nb_neg_logpdf(x, self.mu, self.b)
 
     def entropy(self):
-        return nb_entropy(self.b)
+        return np.broadcast_to(nb_entropy(self.b), self.batch_shape)
+
+    def _entropy_grad(self):
+        return np.array([0, 1 / self.b])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        pdf = self.pdf(x)
+        z_val = np.nan_to_num((x - self.mu) / self.b)
+        return np.stack([-pdf, -pdf * z_val])
 
     def median(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def mean(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def mode(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def std(self):
         return self.var() ** 0.5
 
     def var(self):
-        return 2 * self.b**2
+        return np.broadcast_to(2 * self.b**2, self.batch_shape)
 
     def skewness(self):
-        return 0.0
+        return np.zeros(self.batch_shape)
 
     def kurtosis(self):
-        return 3.0
+        return np.full(self.batch_shape, 3.0)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.laplace(self.mu, self.b, size)
@@ -124,6 +143,22 @@ def nb_cdf(x, mu, b):
     return 0.5 * np.exp(x)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, mu, b):
+    x = (x - mu) / b
+    if x > 0:
+        return np.log1p(-0.5 * np.exp(-x))
+    return x - np.log(2)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, mu, b):
+    x = (x - mu) / b
+    if x < 0:
+        return np.log1p(-0.5 * np.exp(x))
+    return -x - np.log(2)
+
+
 @nb.vectorize(nopython=True, cache=True)
 def nb_ppf(q, mu, b):
     if q > 0.5:
@@ -4,6 +4,8 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import log_expit
 
 
 class Logistic(Continuous):
@@ -70,6 +72,14 @@ class Logistic(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.s)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.s)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.s)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.mu, self.s)
@@ -81,29 +91,39 @@ class Logistic(Continuous):
         return nb_neg_logpdf(x, self.mu, self.s)
 
     def entropy(self):
-        return nb_entropy(self.s)
+        return np.broadcast_to(nb_entropy(self.s), self.batch_shape)
+
+    def _entropy_grad(self):
+        return np.array([0, 1 / self.s])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        pdf = self.pdf(x)
+        z_val = np.nan_to_num((x - self.mu) / self.s)
+        return np.stack([-pdf, -pdf * z_val])
 
     def mean(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def mode(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def median(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def var(self):
-        return self.s**2 * np.pi**2 / 3
+        return np.broadcast_to(self.s**2 * np.pi**2 / 3, self.batch_shape)
 
     def std(self):
         return self.var() ** 0.5
 
     def skewness(self):
-        return 0
+        return np.zeros(self.batch_shape)
 
     def kurtosis(self):
-        return 6 / 5
+        return np.full(self.batch_shape, 6 / 5)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.logistic(self.mu, self.s, size)
@@ -121,6 +141,16 @@ def nb_cdf(x, mu, s):
     return 1 / (1 + np.exp(-(x - mu) / s))
 
 
+@nb.njit(cache=True)
+def nb_logcdf(x, mu, s):
+    return log_expit((x - mu) / s)
+
+
+@nb.njit(cache=True)
+def nb_logsf(x, mu, s):
+    return log_expit((mu - x) / s)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, mu, s):
     return mu + s * np.log(q / (1 - q))
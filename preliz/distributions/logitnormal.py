@@ -2,8 +2,11 @@ import numba as nb
 import numpy as np
 
 from preliz.distributions.distributions import Continuous
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, eps, from_precision, to_precision
 from preliz.internal.optimization import find_mode_logitnormal
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import (
     cdf_bounds,
     erf,
@@ -11,6 +14,7 @@ from preliz.internal.special import (
     expit,
     logit,
     mean_and_std,
+    norm_logcdf,
     ppf_bounds_cont,
 )
 
@@ -105,6 +109,14 @@ class LogitNormal(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.sigma)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.sigma)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.sigma)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.mu, self.sigma)
@@ -115,44 +127,36 @@ class LogitNormal(Continuous):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.mu, self.sigma)
 
+    @cache_method
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
-        return -np.trapz(np.exp(logpdf) * logpdf, x_values)
+        return quad_moments(self, "mvske")[4]
 
+    @cache_method
     def mean(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        return np.trapz(x_values * pdf, x_values)
+        return quad_moments(self, "mvske")[0]
 
     def median(self):
         return self.ppf(0.5)
 
+    @cache_method
     def var(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        return np.trapz((x_values - self.mean()) ** 2 * pdf, x_values)
+        return quad_moments(self, "mvske")[1]
 
     def std(self):
         return self.var() ** 0.5
 
+    @cache_method
     def skewness(self):
-        mean = self.mean()
-        std = self.std()
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        return np.trapz(((x_values - mean) / std) ** 3 * pdf, x_values)
+        return quad_moments(self, "mvske")[2]
 
+    @cache_method
     def kurtosis(self):
-        mean = self.mean()
-        std = self.std()
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        return np.trapz(((x_values - mean) / std) ** 4 * pdf, x_values) - 3
+        return quad_moments(self, "mvske")[3]
 
     def mode(self):
         return find_mode_logitnormal(self)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return expit(random_state.normal(self.mu, self.sigma, size))
@@ -172,6 +176,24 @@ def nb_cdf(x, mu, sigma):
     return cdf_bounds(0.5 * (1 + erf((logit(x) - mu) / (sigma * 2**0.5))), x, 0, 1)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, mu, sigma):
+    if x <= 0:
+        return -np.inf
+    if x >= 1:
+        return 0.0
+    return norm_logcdf((np.log(x) - np.log1p(-x) - mu) / sigma)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, mu, sigma):
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return -np.inf
+    return norm_logcdf((mu - np.log(x) + np.log1p(-x)) / sigma)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, mu, sigma):
     return ppf_bounds_cont(expit(mu + sigma * 2**0.5 * erfinv(2 * q - 1)), q, 0, 1)
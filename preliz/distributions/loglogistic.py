@@ -2,9 +2,11 @@ import numba as nb
 import numpy as np
 
 from preliz.distributions.distributions import Continuous
-from preliz.internal.distribution_helper import all_not_none, eps
+from preliz.internal.cache import cache_method
+from preliz.internal.distribution_helper import all_not_none, eps, num_kurtosis, num_skewness
 from preliz.internal.optimization import optimize_ml, optimize_moments
-from preliz.internal.special import cdf_bounds, ppf_bounds_cont
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import cdf_bounds, log_expit, ppf_bounds_cont
 
 
 class LogLogistic(Continuous):
@@ -75,6 +77,14 @@ class LogLogistic(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.alpha, self.beta)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.alpha, self.beta)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.alpha, self.beta)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.alpha, self.beta)
@@ -88,6 +98,16 @@ class LogLogistic(Continuous):
     def entropy(self):
         return nb_entropy(self.alpha, self.beta)
 
+    def _entropy_grad(self):
+        return np.array([1 / self.alpha, -1 / self.beta])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        cdf = self.cdf(x)
+        cdf_sf = cdf * (1 - cdf)
+        log_x = np.log(np.where(x > 0, x / self.alpha, 1))
+        return np.stack([-self.beta / self.alpha * cdf_sf, cdf_sf * np.nan_to_num(log_x)])
+
     def mean(self):
         return np.where(
             self.beta > 1, self.alpha * np.pi / self.beta / np.sin(np.pi / self.beta), np.nan
@@ -99,7 +119,7 @@ class LogLogistic(Continuous):
         )
 
     def median(self):
-        return self.alpha
+        return np.broadcast_to(self.alpha, self.batch_shape)
 
     def var(self):
         pib = np.pi / self.beta
@@ -112,24 +132,15 @@ class LogLogistic(Continuous):
     def std(self):
         return self.var() ** 0.5
 
+    @cache_method
     def skewness(self):
-        mean = self.mean()
-        std = self.std()
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        return np.where(
-            self.beta > 3, np.trapz(((x_values - mean) / std) ** 3 * pdf, x_values), np.nan
-        )
+        return np.where(self.beta > 3, num_skewness(self), np.nan)
 
+    @cache_method
     def kurtosis(self):
-        mean = self.mean()
-        std = self.std()
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        return np.where(
-            self.beta > 4, np.trapz(((x_values - mean) / std) ** 4 * pdf, x_values) - 3, np.nan
-        )
+        return np.where(self.beta > 4, num_kurtosis(self), np.nan)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         u_val = random_state.random(size)
@@ -147,6 +158,20 @@ def nb_cdf(x, alpha, beta):
     return cdf_bounds(1 / (1 + (x / alpha) ** (-beta)), x, 0, np.inf)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, alpha, beta):
+    if x <= 0:
+        return -np.inf
+    return log_expit(beta * np.log(x / alpha))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, alpha, beta):
+    if x <= 0:
+        return 0.0
+    return log_expit(-beta * np.log(x / alpha))
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, alpha, beta):
     return ppf_bounds_cont(alpha * (q / (1 - q)) ** (1 / beta), q, 0, np.inf)
@@ -4,11 +4,13 @@ from scipy.special import erf, erfinv
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import (
     cdf_bounds,
     erf,  # noqa: F811
     erfinv,  # noqa: F811
     mean_and_std,
+    norm_logcdf,
     ppf_bounds_cont,
 )
 
@@ -83,6 +85,14 @@ class LogNormal(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.sigma)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.sigma)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.sigma)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.mu, self.sigma)
@@ -96,6 +106,16 @@ class LogNormal(Continuous):
     def entropy(self):
         return nb_entropy(self.mu, self.sigma)
 
+    def _entropy_grad(self):
+        return np.array([1, 1 / self.sigma])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_val = np.nan_to_num((np.log(x) - self.mu) / self.sigma)
+        x_pdf = np.nan_to_num(x * self.pdf(x))
+        return np.stack([-x_pdf, -x_pdf * z_val])
+
     def mean(self):
         return np.exp(self.mu + self.sigma**2 / 2)
 
@@ -103,7 +123,7 @@ class LogNormal(Continuous):
         return np.exp(self.mu - self.sigma**2)
 
     def median(self):
-        return np.exp(self.mu)
+        return np.broadcast_to(np.exp(self.mu), self.batch_shape)
 
     def var(self):
         return (np.exp(self.sigma**2) - 1) * np.exp(2 * self.mu + self.sigma**2)
@@ -112,16 +132,20 @@ class LogNormal(Continuous):
         return self.var() ** 0.5
 
     def skewness(self):
-        return (np.exp(self.sigma**2) + 2) * (np.exp(self.sigma**2) - 1) ** 0.5
+        return np.broadcast_to(
+            (np.exp(self.sigma**2) + 2) * (np.exp(self.sigma**2) - 1) ** 0.5, self.batch_shape
+        )
 
     def kurtosis(self):
-        return (
+        return np.broadcast_to(
             np.exp(4 * self.sigma**2)
             + 2 * np.exp(3 * self.sigma**2)
             + 3 * np.exp(2 * self.sigma**2)
-            - 6
+            - 6,
+            self.batch_shape,
         )
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.lognormal(self.mu, self.sigma, size)
@@ -141,6 +165,20 @@ def nb_cdf(x, mu, sigma):
     return cdf_bounds(0.5 * (1 + erf((np.log(x) - mu) / (sigma * 2**0.5))), x, 0, np.inf)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, mu, sigma):
+    if x <= 0:
+        return -np.inf
+    return norm_logcdf((np.log(x) - mu) / sigma)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, mu, sigma):
+    if x <= 0:
+        return 0.0
+    return norm_logcdf((mu - np.log(x)) / sigma)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, mu, sigma):
     return ppf_bounds_cont(np.exp(mu + sigma * 2**0.5 * erfinv(2 * q - 1)), q, 0, np.inf)
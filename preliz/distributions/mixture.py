@@ -1,8 +1,12 @@
+import numba as nb
 import numpy as np
 
 from preliz.distributions.distributions import DistributionTransformer
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, num_kurtosis, num_skewness
 from preliz.internal.optimization import find_ppf
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
 
 
 class Mixture(DistributionTransformer):
@@ -18,6 +22,9 @@ class Mixture(DistributionTransformer):
 
         f(x) = \sum_{i=1}^n \, w_i \, p_i(x)
 
+    Components of the same family and parametrization are evaluated together, as a single
+    distribution with batched parameters, so mixtures with many components stay fast.
+
     .. plot::
         :context: close-figs
 
@@ -72,77 +79,167 @@ class Mixture(DistributionTransformer):
 
         if all_not_none(*self.params):
             self.is_frozen = True
+            self._stack_components()
+
+    def _stack_components(self):
+        """
+        Group the components by family and parametrization.
+
+        Each group with more than one component is replaced by a single distribution with its
+        parameters stacked along the last axis. ``_groups`` stores the distribution of each group
+        and the indices of its components, ``_group_of`` and ``_position`` map each component to
+        its group and its position inside the group.
+        """
+        members = {}
+        for idx, dist in enumerate(self.dist):
+            if isinstance(dist, DistributionTransformer) or any(np.ndim(p) for p in dist.params):
+                key = idx
+            else:
+                key = (dist.__class__, tuple(dist.param_names))
+            members.setdefault(key, []).append(idx)
+
+        self._groups = []
+        self._group_of = np.empty(len(self.dist), dtype=int)
+        self._position = np.empty(len(self.dist), dtype=int)
+        for group, idxs in enumerate(members.values()):
+            dist = self.dist[idxs[0]]
+            if len(idxs) > 1:
+                stacked = [
+                    np.array([self.dist[idx].params[i] for idx in idxs])
+                    for i in range(len(dist.params))
+                ]
+                dist = dist.__class__(**dict(zip(dist.param_names, stacked)))
+            self._groups.append((dist, np.array(idxs)))
+            self._group_of[idxs] = group
+            self._position[idxs] = np.arange(len(idxs))
+
+    def _eval_components(self, method, x):
+        """Evaluate a method of every component, the components are along the last axis."""
+        x = np.asarray(x)[..., None]
+        if len(self._groups) == 1:
+            return getattr(self._groups[0][0], method)(x)
+        vals = np.empty(x.shape[:-1] + (len(self.dist),))
+        for dist, idxs in self._groups:
+            vals[..., idxs] = getattr(dist, method)(x)
+        return vals
+
+    def _components_stat(self, method):
+        """Compute a summary statistic of every component."""
+        vals = np.empty(len(self.dist))
+        for dist, idxs in self._groups:
+            vals[idxs] = getattr(dist, method)()
+        return vals
+
+    @property
+    def batch_shape(self):
+        # The weights define the components, not a batch
+        return () if self.is_frozen else None
 
     def pdf(self, x):
-        return np.sum(
-            [dist.pdf(x) * weight for dist, weight in zip(self.dist, self.weights)], axis=0
-        )
+        return self._eval_components("pdf", x) @ self.weights
 
     def cdf(self, x):
-        return np.sum(
-            [dist.cdf(x) * weight for dist, weight in zip(self.dist, self.weights)], axis=0
-        )
+        return self._eval_components("cdf", x) @ self.weights
 
     def ppf(self, q):
         return find_ppf(self, q)
 
     def logpdf(self, x):
-        return np.sum(
-            [dist.logpdf(x) * weight for dist, weight in zip(self.dist, self.weights)], axis=0
-        )
+        return self._log_weighted_sum("logpdf", x)
+
+    def logcdf(self, x):
+        return self._log_weighted_sum("logcdf", x)
+
+    def logsf(self, x):
+        return self._log_weighted_sum("logsf", x)
+
+    def _log_weighted_sum(self, method, x):
+        """Log of the weighted sum of a log method of the components, without underflow."""
+        log_vals = self._eval_components(method, x)
+        with np.errstate(divide="ignore"):
+            log_weights = np.log(self.weights)
+        vals = nb_logsumexp(log_vals.reshape(-1, len(self.dist)), log_weights)
+        return vals.reshape(log_vals.shape[:-1])[()]
 
     def _neg_logpdf(self, x):
         return -self.logpdf(x).sum()
 
+    @cache_method
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
         if self.kind == "discrete":
+            x_values = self.xvals("restricted")
+            logpdf = self.logpdf(x_values)
             return -np.sum(np.exp(logpdf) * logpdf)
         else:
-            return -np.trapzoid(np.exp(logpdf) * logpdf, x_values)
+            return quad_moments(self, "mvske")[4]
 
     def mean(self):
-        return np.sum(
-            [dist.mean() * weight for dist, weight in zip(self.dist, self.weights)], axis=0
-        )
+        return self._components_stat("mean") @ self.weights
 
     def median(self):
         return self.ppf(0.5)
 
     def var(self):
-        return (
-            np.sum(
-                [
-                    weight * (dist.var() + (dist.mean() ** 2))
-                    for dist, weight in zip(self.dist, self.weights)
-                ],
-                axis=0,
-            )
-            - self.mean() ** 2
-        )
+        means = self._components_stat("mean")
+        second_moments = self._components_stat("var") + means**2
+        return second_moments @ self.weights - (means @ self.weights) ** 2
 
     def std(self):
         return self.var() ** 0.5
 
+    @cache_method
     def skewness(self):
         return num_skewness(self)
 
+    @cache_method
     def kurtosis(self):
         return num_kurtosis(self)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         dist_idx = random_state.choice(len(self.dist), size=size, p=self.weights)
-        samples = []
-        for idx, dist in enumerate(self.dist):
-            n_samples = np.sum(dist_idx == idx)
-            if n_samples:
-                samples.append(dist.rvs(n_samples, random_state=random_state))
-        return np.concatenate(samples)
+        flat_idx = np.ravel(dist_idx)
+        group_of = self._group_of[flat_idx]
+        samples = np.empty(flat_idx.size, dtype=int if self.kind == "discrete" else float)
+        for group, (dist, idxs) in enumerate(self._groups):
+            in_group = group_of == group
+            n_samples = np.sum(in_group)
+            if not n_samples:
+                continue
+            sampler = dist
+            if len(idxs) > 1:
+                # one draw per sample from the component that was selected for it
+                position = self._position[flat_idx[in_group]]
+                params = [param[position] for param in dist.params]
+                sampler = dist.__class__(**dict(zip(dist.param_names, params)))
+            samples[in_group] = sampler.rvs(n_samples, random_state=random_state)
+        return samples.reshape(np.shape(dist_idx))[()]
 
     def _fit_moments(self, mean, sigma):
         for dist in self.dist:
             dist._fit_moments(mean, sigma)
-        self.is_frozen = True
-        self.weights = np.ones(len(self.dist)) / len(self.dist)
+        self._parametrization(np.ones(len(self.dist)) / len(self.dist))
+
+
+@nb.njit(cache=True)
+def nb_logsumexp(logpdf, log_weights):
+    """Log of the weighted sum of the exponentials of each row of ``logpdf``."""
+    n_rows, n_cols = logpdf.shape
+    out = np.empty(n_rows)
+    for i in range(n_rows):
+        max_val = -np.inf
+        for j in range(n_cols):
+            val = logpdf[i, j] + log_weights[j]
+            if val > max_val or np.isnan(val):
+                max_val = val
+                if np.isnan(val):
+                    break
+        if not np.isfinite(max_val):
+            out[i] = max_val
+            continue
+        total = 0.0
+        for j in range(n_cols):
+            total += np.exp(logpdf[i, j] + log_weights[j] - max_val)
+        out[i] = max_val + np.log(total)
+    return out
@@ -3,9 +3,12 @@ import numpy as np
 from scipy.special import erf, erfinv, zeta
 
 from preliz.distributions.distributions import Continuous
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
-from preliz.internal.special import erf, erfinv, ppf_bounds_cont  # noqa: F811
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import erf, erfinv, log_erf, log_erfc, ppf_bounds_cont  # noqa: F811
 
 
 class Moyal(Continuous):
@@ -79,6 +82,14 @@ class Moyal(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.sigma)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.sigma)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.sigma)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.mu, self.sigma)
@@ -89,32 +100,41 @@ class Moyal(Continuous):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.mu, self.sigma)
 
+    @cache_method
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
-        return -np.trapz(np.exp(logpdf) * logpdf, x_values)
+        return quad_moments(self, "e")[0]
+
+    def _entropy_grad(self):
+        return np.array([0, 1 / self.sigma])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        pdf = np.nan_to_num(self.pdf(x))
+        z_val = np.nan_to_num((x - self.mu) / self.sigma)
+        return np.stack([-pdf, -pdf * z_val])
 
     def mean(self):
         return self.mu + self.sigma * (np.euler_gamma + np.log(2))
 
     def mode(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def median(self):
         return self.ppf(0.5)
 
     def var(self):
-        return self.sigma**2 * (np.pi**2) / 2
+        return np.broadcast_to(self.sigma**2 * (np.pi**2) / 2, self.batch_shape)
 
     def std(self):
         return self.var() ** 0.5
 
     def skewness(self):
-        return 28 * np.sqrt(2) * zeta(3) / np.pi**3
+        return np.full(self.batch_shape, 28 * np.sqrt(2) * zeta(3) / np.pi**3)
 
     def kurtosis(self):
-        return 4
+        return np.full(self.batch_shape, 4.0)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return self.ppf(random_state.random(size))
@@ -134,6 +154,26 @@ def nb_cdf(x, mu, sigma):
     return 1 - erf(np.exp(-z_val / 2) * (2**-0.5))
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, mu, sigma):
+    log_u = -(x - mu) / sigma / 2 - 0.5 * np.log(2)
+    if log_u > 700:
+        # log(erfc(u)) ~ -u**2 overflows
+        return -np.inf
+    return log_erfc(np.exp(log_u))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, mu, sigma):
+    log_u = -(x - mu) / sigma / 2 - 0.5 * np.log(2)
+    if log_u < -700:
+        # erf(u) ~ 2u/sqrt(pi) and u underflows
+        return np.log(2 / np.pi**0.5) + log_u
+    if log_u > 700:
+        return 0.0
+    return log_erf(np.exp(log_u))
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, mu, sigma):
     x_val = sigma * -np.log(2.0 * erfinv(1 - q) ** 2) + mu
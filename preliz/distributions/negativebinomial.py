@@ -3,9 +3,19 @@ import numpy as np
 from scipy.special import nbdtrik
 
 from preliz.distributions.distributions import Discrete
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, any_not_none, eps
 from preliz.internal.optimization import optimize_ml, optimize_moments
-from preliz.internal.special import betainc, cdf_bounds, gammaln, ppf_bounds_disc, xlogy
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    betainc,
+    cdf_bounds,
+    gammaln,
+    log_betainc,
+    log_betaincc,
+    ppf_bounds_disc,
+    xlogy,
+)
 
 
 class NegativeBinomial(Discrete):
@@ -120,6 +130,14 @@ class NegativeBinomial(Discrete):
         x = np.asarray(x)
         return nb_cdf(x, self.n, self.p, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.n, self.p)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.n, self.p)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.n, self.p, self.support[0], self.support[1])
@@ -130,13 +148,14 @@ class NegativeBinomial(Discrete):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.n, self.p)
 
+    @cache_method
     def entropy(self):
         x = self.xvals("full", 5000)
         logpdf = self.logpdf(x)
-        return -np.sum(np.exp(logpdf) * logpdf)
+        return -np.sum(np.exp(logpdf) * logpdf, axis=0)
 
     def mean(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def mode(self):
         return np.where(self.n < 1, 0, np.floor((self.n - 1) * (1 - self.p) / self.p))
@@ -156,6 +175,7 @@ class NegativeBinomial(Discrete):
     def kurtosis(self):
         return 6 / self.n + self.p**2 / ((1 - self.p) * self.n)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.negative_binomial(self.n, self.p, size=size)
@@ -173,6 +193,24 @@ def nb_cdf(x, n, p, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, n, p):
+    if x < 0:
+        return -np.inf
+    if x == np.inf:
+        return 0.0
+    return log_betainc(n, np.floor(x) + 1, p)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, n, p):
+    if x < 0:
+        return 0.0
+    if x == np.inf:
+        return -np.inf
+    return log_betaincc(n, np.floor(x) + 1, p)
+
+
 # @nb.jit
 # bdtrik not supported by numba
 def nb_ppf(q, n, p, lower, upper):
@@ -3,7 +3,8 @@ import numpy as np
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps, from_precision, to_precision
-from preliz.internal.special import erf, erfinv, mean_and_std, ppf_bounds_cont
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import erf, erfinv, mean_and_std, norm_logcdf, ppf_bounds_cont
 
 
 class Normal(Continuous):
@@ -98,6 +99,14 @@ class Normal(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.sigma)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.sigma)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.sigma)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.mu, self.sigma)
@@ -109,29 +118,39 @@ class Normal(Continuous):
         return nb_neg_logpdf(x, self.mu, self.sigma)
 
     def entropy(self):
-        return nb_entropy(self.sigma)
+        return np.broadcast_to(nb_entropy(self.sigma), self.batch_shape)
+
+    def _entropy_grad(self):
+        return np.array([0, 1 / self.sigma])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        pdf = self.pdf(x)
+        z_val = np.nan_to_num((x - self.mu) / self.sigma)
+        return np.stack([-pdf, -pdf * z_val])
 
     def mean(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def mode(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def median(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def var(self):
-        return self.sigma**2
+        return np.broadcast_to(self.sigma**2, self.batch_shape)
 
     def std(self):
-        return self.sigma
+        return np.broadcast_to(self.sigma, self.batch_shape)
 
     def skewness(self):
-        return 0
+        return np.zeros(self.batch_shape)
 
     def kurtosis(self):
-        return 0
+        return np.zeros(self.batch_shape)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.normal(self.mu, self.sigma, size)
@@ -148,6 +167,16 @@ def nb_cdf(x, mu, sigma):
     return 0.5 * (1 + erf((x - mu) / (sigma * 2**0.5)))
 
 
+@nb.njit(cache=True)
+def nb_logcdf(x, mu, sigma):
+    return norm_logcdf((x - mu) / sigma)
+
+
+@nb.njit(cache=True)
+def nb_logsf(x, mu, sigma):
+    return norm_logcdf((mu - x) / sigma)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, mu, sigma):
     return ppf_bounds_cont(mu + sigma * 2**0.5 * erfinv(2 * q - 1), q, -np.inf, np.inf)
@@ -4,7 +4,8 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
-from preliz.internal.special import ppf_bounds_cont, xlogy
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import log1mexp, ppf_bounds_cont, xlogy
 
 
 class Pareto(Continuous):
@@ -71,6 +72,14 @@ class Pareto(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.alpha, self.m)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.alpha, self.m)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.alpha, self.m)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.alpha, self.m, 1, np.inf)
@@ -84,11 +93,23 @@ class Pareto(Continuous):
     def entropy(self):
         return nb_entropy(self.alpha, self.m)
 
+    def _entropy_grad(self):
+        return np.array([-1 / self.alpha - 1 / self.alpha**2, 1 / self.m])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        ratio = np.where(x >= self.m, self.m / x, 0)
+        with np.errstate(divide="ignore"):
+            sf_vals = ratio**self.alpha
+            return np.stack(
+                [-np.nan_to_num(sf_vals * np.log(ratio)), -self.alpha * sf_vals / self.m]
+            )
+
     def mean(self):
         return np.where(self.alpha > 1, self.alpha * self.m / (self.alpha - 1), np.inf)
 
     def mode(self):
-        return self.m
+        return np.broadcast_to(self.m, self.batch_shape)
 
     def median(self):
         return self.m * 2 ** (1 / self.alpha)
@@ -104,21 +125,28 @@ class Pareto(Continuous):
         return self.var() ** 0.5
 
     def skewness(self):
-        return np.where(
-            self.alpha > 3,
-            2 * (1 + self.alpha) / (self.alpha - 3) * (1 - 2 / self.alpha) ** 0.5,
-            np.nan,
+        return np.broadcast_to(
+            np.where(
+                self.alpha > 3,
+                2 * (1 + self.alpha) / (self.alpha - 3) * (1 - 2 / self.alpha) ** 0.5,
+                np.nan,
+            ),
+            self.batch_shape,
         )
 
     def kurtosis(self):
-        return np.where(
-            self.alpha > 4,
-            6
-            * (self.alpha**3 + self.alpha**2 - 6 * self.alpha - 2)
-            / (self.alpha * (self.alpha - 3) * (self.alpha - 4)),
-            np.nan,
+        return np.broadcast_to(
+            np.where(
+                self.alpha > 4,
+                6
+                * (self.alpha**3 + self.alpha**2 - 6 * self.alpha - 2)
+                / (self.alpha * (self.alpha - 3) * (self.alpha - 4)),
+                np.nan,
+            ),
+            self.batch_shape,
         )
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         random_samples = random_state.uniform(0, 1, size)
@@ -140,6 +168,24 @@ def nb_cdf(x, alpha, m):
     return 1 - (m / x) ** alpha
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, alpha, m):
+    if x <= m:
+        return -np.inf
+    if x == np.inf:
+        return 0.0
+    return log1mexp(alpha * np.log(m / x))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, alpha, m):
+    if x <= m:
+        return 0.0
+    if x == np.inf:
+        return -np.inf
+    return alpha * np.log(m / x)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, alpha, m, lower, upper):
     return ppf_bounds_cont(m * (1 - q) ** (-1 / alpha), q, lower, upper)
@@ -162,6 +208,6 @@ def nb_neg_logpdf(x, alpha, m):
     return -(nb_logpdf(x, alpha, m)).sum()
 
 
-@nb.njit(cache=True)
+@nb.njit(cache=True, nogil=True)
 def nb_rvs(random_samples, alpha, m):
     return m / (1 - random_samples) ** (1 / alpha)
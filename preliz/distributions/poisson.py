@@ -1,10 +1,20 @@
 import numba as nb
 import numpy as np
-from scipy.special import pdtr, pdtrik
 
 from preliz.distributions.distributions import Discrete
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import eps
-from preliz.internal.special import cdf_bounds, gammaln, ppf_bounds_disc, xlogy
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    cdf_bounds,
+    erfcinv,
+    gammaincc,
+    gammaln,
+    log_gammainc,
+    log_gammaincc,
+    ppf_bounds_disc,
+    xlogy,
+)
 
 
 class Poisson(Discrete):
@@ -67,9 +77,19 @@ class Poisson(Discrete):
         return np.exp(nb_logpdf(x, self.mu))
 
     def cdf(self, x):
+        x = np.asarray(x)
         return nb_cdf(x, self.mu, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu)
+
     def ppf(self, q):
+        q = np.asarray(q)
         return nb_ppf(q, self.mu, self.support[0], self.support[1])
 
     def logpdf(self, x):
@@ -78,10 +98,11 @@ class Poisson(Discrete):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.mu)
 
+    @cache_method
     def entropy(self):
-        x = np.arange(0, self.ppf(0.9999) + 1, dtype=int)
+        x = np.arange(0, np.max(self.ppf(0.9999)) + 1, dtype=int).reshape(-1, *(1,) * self.mu.ndim)
         logpdf = self.logpdf(x)
-        return -np.sum(np.exp(logpdf) * logpdf)
+        return -np.sum(np.exp(logpdf) * logpdf, axis=0)
 
     def mean(self):
         return self.mu
@@ -104,6 +125,7 @@ class Poisson(Discrete):
     def kurtosis(self):
         return 1 / self.mu
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.poisson(self.mu, size=size)
@@ -115,22 +137,38 @@ class Poisson(Discrete):
         self._update(nb_fit_mle(sample))
 
 
-# @nb.jit
-# pdtr not supported by numba
+@nb.njit(cache=True)
 def nb_cdf(x, mu, lower, upper):
-    prob = pdtr(x, mu)
+    prob = gammaincc(np.floor(x) + 1, mu)
     return cdf_bounds(prob, x, lower, upper)
 
 
-# @nb.jit
-# pdtr not supported by numba
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, mu):
+    if x < 0:
+        return -np.inf
+    return log_gammaincc(np.floor(x) + 1, mu)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, mu):
+    if x < 0:
+        return 0.0
+    return log_gammainc(np.floor(x) + 1, mu)
+
+
+@nb.vectorize(nopython=True, cache=True)
 def nb_ppf(q, mu, lower, upper):
-    q = np.asarray(q)
-    vals = np.ceil(pdtrik(q, mu))
-    vals1 = np.maximum(vals - 1, 0)
-    temp = pdtr(vals1, mu)
-    x_vals = np.where(temp >= q, vals1, vals)
-    return ppf_bounds_disc(x_vals, q, lower, upper)
+    if not 0 < q < 1:
+        return ppf_bounds_disc(np.nan, q, lower, upper)
+    # Cornish-Fisher starting point, then step to the smallest x with cdf(x) >= q
+    z_val = -(2**0.5) * erfcinv(2 * q)
+    x_val = max(np.floor(mu + mu**0.5 * z_val + (z_val**2 - 1) / 6), 0.0)
+    while gammaincc(x_val + 1, mu) < q:
+        x_val += 1
+    while x_val > 0 and gammaincc(x_val, mu) >= q:
+        x_val -= 1
+    return x_val
 
 
 @nb.njit(cache=True)
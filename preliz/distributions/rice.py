@@ -1,10 +1,19 @@
+import numba as nb
 import numpy as np
-from scipy.special import chndtr, chndtrix, i0, i0e, i1
 
 from preliz.distributions.distributions import Continuous
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml, optimize_moments_rice
-from preliz.internal.special import cdf_bounds, ppf_bounds_cont
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    erfcinv,
+    i0e,
+    i1e,
+    marcumq1,
+    ppf_bounds_cont,
+)
 
 
 class Rice(Continuous):
@@ -121,10 +130,9 @@ class Rice(Continuous):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.nu, self.sigma)
 
+    @cache_method
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
-        return -np.trapz(np.exp(logpdf) * logpdf, x_values)
+        return quad_moments(self, "e")[0]
 
     def mean(self):
         return self.sigma * np.sqrt(np.pi / 2) * _l_half(-(self.nu**2) / (2 * self.sigma**2))
@@ -140,7 +148,7 @@ class Rice(Continuous):
         )
 
     def std(self):
-        return self.var() ** 2
+        return self.var() ** 0.5
 
     def skewness(self):
         return NotImplemented
@@ -148,9 +156,11 @@ class Rice(Continuous):
     def kurtosis(self):
         return NotImplemented
 
-    def rvs(self, size=1, random_state=None):
+    @rvs_method
+    def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
-        t_v = (self.nu / self.sigma) / np.sqrt(2) + random_state.standard_normal(size=(2, size))
+        shape = self.batch_shape if size is None else tuple(np.atleast_1d(size))
+        t_v = self.b / np.sqrt(2) + random_state.standard_normal(size=(2, *shape))
         return np.sqrt((t_v * t_v).sum(axis=0)) * self.sigma
 
     def _fit_moments(self, mean, sigma):
@@ -161,25 +171,60 @@ class Rice(Continuous):
         optimize_ml(self, sample)
 
 
+@nb.vectorize(nopython=True, cache=True)
 def nb_cdf(x, nu, sigma):
-    return cdf_bounds(chndtr((x / sigma) ** 2, 2, (nu / sigma) ** 2), x, 0, np.inf)
+    if x <= 0:
+        return 0.0
+    return marcumq1(nu / sigma, x / sigma)[0]
 
 
+@nb.vectorize(nopython=True, cache=True)
 def nb_ppf(q, nu, sigma):
-    return ppf_bounds_cont(np.sqrt(chndtrix(q, 2, (nu / sigma) ** 2)) * sigma, q, 0, np.inf)
-
-
+    if q <= 0 or q >= 1:
+        return ppf_bounds_cont(np.nan, q, 0, np.inf)
+    b_val = nu / sigma
+    # |b + N| lies between |N| - b and |N| + b, where |N| is Rayleigh distributed
+    rayleigh = np.sqrt(-2 * np.log1p(-q))
+    lower = max(rayleigh - b_val, 0.0)
+    upper = rayleigh + b_val
+    if b_val > 2:
+        y_val = b_val - np.sqrt(2) * erfcinv(2 * q)
+    else:
+        y_val = np.sqrt(rayleigh**2 + b_val**2)
+    y_val = min(max(y_val, lower), upper)
+    for _ in range(100):
+        cdf, sf = marcumq1(b_val, y_val)
+        err = cdf - q if q < 0.5 else (1 - q) - sf
+        if err < 0:
+            lower = y_val
+        else:
+            upper = y_val
+        density = y_val * np.exp(-0.5 * (y_val - b_val) ** 2) * i0e(y_val * b_val)
+        # a vanishing density sends the step to the bracket edge, which triggers bisection
+        y_new = y_val - err / density if density > 0 else upper
+        if abs(y_new - y_val) < 1e-14 * y_val:
+            y_val = y_new
+            break
+        if not lower < y_new < upper:
+            y_new = 0.5 * (lower + upper)
+        y_val = y_new
+    return y_val * sigma
+
+
+@nb.vectorize(nopython=True, cache=True)
 def nb_logpdf(x, nu, sigma):
-    b = nu / sigma
-    x = x / sigma
-    return np.where(
-        x < 0, -np.inf, np.log(x * np.exp((-(x - b) * (x - b)) / 2) * i0e(x * b) / sigma)
-    )
+    if x < 0:
+        return -np.inf
+    b_val = nu / sigma
+    y_val = x / sigma
+    return np.log(y_val) - 0.5 * (y_val - b_val) ** 2 + np.log(i0e(y_val * b_val)) - np.log(sigma)
 
 
+@nb.njit(cache=True)
 def nb_neg_logpdf(x, nu, sigma):
     return -(nb_logpdf(x, nu, sigma)).sum()
 
 
 def _l_half(x):
-    return np.exp(x / 2) * ((1 - x) * i0(-x / 2) - x * i1(-x / 2))
+    # exponentially scaled Bessel functions, exp(x / 2) I_k(-x / 2) = i_ke(-x / 2) for x <= 0
+    return (1 - x) * i0e(-x / 2) - x * i1e(-x / 2)
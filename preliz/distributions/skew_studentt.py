@@ -3,8 +3,11 @@ import numpy as np
 from scipy.special import comb
 
 from preliz.distributions.distributions import Continuous
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, eps, from_precision, to_precision
 from preliz.internal.optimization import optimize_ml, optimize_moments
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import beta, betainc, betaincinv, cdf_bounds, gamma, ppf_bounds_cont
 
 
@@ -117,10 +120,9 @@ class SkewStudentT(Continuous):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.mu, self.sigma, self.a, self.b)
 
+    @cache_method
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
-        return -np.trapz(np.exp(logpdf) * logpdf, x_values)
+        return quad_moments(self, "e")[0]
 
     def mean(self):
         return (
@@ -131,95 +133,52 @@ class SkewStudentT(Continuous):
         return self.ppf(0.5)
 
     def var(self):
-        nu = (
-            (self.a + self.b) ** 0.5
-            / (2 * beta(self.a, self.b))
-            * (
-                comb(1, np.arange(2))
-                * np.where(np.arange(1 + 1) % 2 > 0, -1, 1)
-                * beta(self.a + 0.5 - np.arange(2), self.b - 0.5 + np.arange(2))
-            ).sum()
-        )
-        return (
+        nu = (self.a + self.b) ** 0.5 / (2 * beta(self.a, self.b)) * _beta_sum(self.a, self.b, 1)
+        return np.broadcast_to(
             np.where(
                 np.isfinite(nu),
-                (self.a + self.b)
-                / (4 * beta(self.a, self.b))
-                * (
-                    comb(2, np.arange(3))
-                    * np.where(np.arange(3) % 2 > 0, -1, 1)
-                    * beta(self.a + 1 - np.arange(3), self.b - 1 + np.arange(3))
-                ).sum()
+                (self.a + self.b) / (4 * beta(self.a, self.b)) * _beta_sum(self.a, self.b, 2)
                 - nu**2,
                 np.inf,
             )
-            * self.sigma**2
+            * self.sigma**2,
+            self.batch_shape,
         )
 
     def std(self):
         return self.var() ** 0.5
 
     def skewness(self):
-        nu1 = (
-            (self.a + self.b) ** 0.5
-            / (2 * beta(self.a, self.b))
-            * (
-                comb(1, np.arange(2))
-                * np.where(np.arange(2) % 2 > 0, -1, 1)
-                * beta(self.a + 0.5 - np.arange(2), self.b - 0.5 + np.arange(2))
-            ).sum()
-        )
-        nu2 = ((self.a + self.b) / (4 * beta(self.a, self.b))) * (
-            comb(2, np.arange(3))
-            * np.where(np.arange(3) % 2 > 0, -1, 1)
-            * beta(self.a + 1 - np.arange(3), self.b - 1 + np.arange(3))
-        ).sum() - nu1**2
+        nu1 = (self.a + self.b) ** 0.5 / (2 * beta(self.a, self.b)) * _beta_sum(self.a, self.b, 1)
+        nu2 = ((self.a + self.b) / (4 * beta(self.a, self.b))) * _beta_sum(
+            self.a, self.b, 2
+        ) - nu1**2
         nu3 = (
-            ((self.a + self.b) ** 1.5 / (8 * beta(self.a, self.b)))
-            * (
-                comb(3, np.arange(4))
-                * np.where(np.arange(4) % 2 > 0, -1, 1)
-                * beta(self.a + 1.5 - np.arange(4), self.b - 1.5 + np.arange(4))
-            ).sum()
+            ((self.a + self.b) ** 1.5 / (8 * beta(self.a, self.b))) * _beta_sum(self.a, self.b, 3)
             - nu1**3
             - 3 * nu1 * nu2
         )
-        return nu3 / nu2**1.5
+        return np.broadcast_to(nu3 / nu2**1.5, self.batch_shape)
 
     def kurtosis(self):
-        nu1 = ((self.a + self.b) ** 0.5 / (2 * beta(self.a, self.b))) * (
-            comb(1, np.arange(2))
-            * np.where(np.arange(2) % 2 > 0, -1, 1)
-            * beta(self.a + 0.5 - np.arange(2), self.b - 0.5 + np.arange(2))
-        ).sum()
-        nu2 = ((self.a + self.b) / (4 * beta(self.a, self.b))) * (
-            comb(2, np.arange(3))
-            * np.where(np.arange(3) % 2 > 0, -1, 1)
-            * beta(self.a + 1 - np.arange(3), self.b - 1 + np.arange(3))
-        ).sum() - nu1**2
+        nu1 = ((self.a + self.b) ** 0.5 / (2 * beta(self.a, self.b))) * _beta_sum(self.a, self.b, 1)
+        nu2 = ((self.a + self.b) / (4 * beta(self.a, self.b))) * _beta_sum(
+            self.a, self.b, 2
+        ) - nu1**2
         nu3 = (
-            ((self.a + self.b) ** 1.5 / (8 * beta(self.a, self.b)))
-            * (
-                comb(3, np.arange(4))
-                * np.where(np.arange(4) % 2 > 0, -1, 1)
-                * beta(self.a + 1.5 - np.arange(4), self.b - 1.5 + np.arange(4))
-            ).sum()
+            ((self.a + self.b) ** 1.5 / (8 * beta(self.a, self.b))) * _beta_sum(self.a, self.b, 3)
             - nu1**3
             - 3 * nu1 * nu2
         )
         nu4 = (
-            ((self.a + self.b) ** 2 / (16 * beta(self.a, self.b)))
-            * (
-                comb(4, np.arange(5))
-                * np.where(np.arange(5) % 2 > 0, -1, 1)
-                * beta(self.a + 2 - np.arange(5), self.b - 2 + np.arange(5))
-            ).sum()
+            ((self.a + self.b) ** 2 / (16 * beta(self.a, self.b))) * _beta_sum(self.a, self.b, 4)
             - 4 * nu3 * nu1
             - nu1**4
             - 6 * nu2 * nu1**2
         )
-        return nu4 / nu2**2 - 3
+        return np.broadcast_to(nu4 / nu2**2 - 3, self.batch_shape)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         beta_rng = random_state.beta(self.a, self.b, size)
@@ -266,3 +225,15 @@ def nb_logpdf(x, mu, sigma, a, b):
 @nb.njit(cache=True)
 def nb_neg_logpdf(x, mu, sigma, a, b):
     return -(nb_logpdf(x, mu, sigma, a, b)).sum()
+
+
+def _beta_sum(a, b, order):
+    """Alternating binomial sum of beta functions used by the raw moments, element-wise."""
+    k_vals = np.arange(order + 1)
+    a = np.expand_dims(a, -1)
+    b = np.expand_dims(b, -1)
+    return (
+        comb(order, k_vals)
+        * np.where(k_vals % 2 > 0, -1, 1)
+        * beta(a + order / 2 - k_vals, b - order / 2 + k_vals)
+    ).sum(-1)
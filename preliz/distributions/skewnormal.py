@@ -4,8 +4,11 @@ from scipy.special import owens_t
 from scipy.stats import skew
 
 from preliz.distributions.distributions import Continuous
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, eps, from_precision, to_precision
 from preliz.internal.optimization import find_ppf, optimize_ml, optimize_moments
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import erf, norm_logcdf
 
 
@@ -119,10 +122,9 @@ class SkewNormal(Continuous):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.mu, self.sigma, self.alpha)
 
+    @cache_method
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
-        return -np.trapz(np.exp(logpdf) * logpdf, x_values)
+        return quad_moments(self, "e")[0]
 
     def mean(self):
         return self.mu + self.sigma * np.sqrt(2 / np.pi) * self.alpha / np.sqrt(1 + self.alpha**2)
@@ -132,7 +134,7 @@ class SkewNormal(Continuous):
 
     def var(self):
         delta = self.alpha / (1 + self.alpha**2) ** 0.5
-        return self.sigma**2 * (1 - 2 * delta**2 / np.pi)
+        return np.broadcast_to(self.sigma**2 * (1 - 2 * delta**2 / np.pi), self.batch_shape)
 
     def std(self):
         return self.var() ** 0.5
@@ -140,16 +142,20 @@ class SkewNormal(Continuous):
     def skewness(self):
         delta = self.alpha / (1 + self.alpha**2) ** 0.5
         mean_z = (2 / np.pi) ** 0.5 * delta
-        return ((4 - np.pi) / 2) * (mean_z**3 / (1 - mean_z**2) ** (3 / 2))
+        return np.broadcast_to(
+            ((4 - np.pi) / 2) * (mean_z**3 / (1 - mean_z**2) ** (3 / 2)), self.batch_shape
+        )
 
     def kurtosis(self):
         delta = self.alpha / (1 + self.alpha**2) ** 0.5
-        return (
+        return np.broadcast_to(
             2
             * (np.pi - 3)
-            * ((delta * np.sqrt(2 / np.pi)) ** 4 / (1 - 2 * (delta**2) / np.pi) ** 2)
+            * ((delta * np.sqrt(2 / np.pi)) ** 4 / (1 - 2 * (delta**2) / np.pi) ** 2),
+            self.batch_shape,
         )
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         u_0 = random_state.normal(size=size)
@@ -5,6 +5,7 @@ from preliz.distributions.distributions import Continuous
 from preliz.distributions.normal import Normal
 from preliz.internal.distribution_helper import all_not_none, eps, from_precision, to_precision
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import (
     beta,
     betainc,
@@ -13,6 +14,7 @@ from preliz.internal.special import (
     erf,
     erfinv,
     gammaln,
+    norm_logcdf,
     ppf_bounds_cont,
 )
 
@@ -119,6 +121,14 @@ class StudentT(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.nu, self.mu, self.sigma)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.nu, self.mu, self.sigma)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.nu, self.mu, self.sigma)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.nu, self.mu, self.sigma)
@@ -130,47 +140,40 @@ class StudentT(Continuous):
         return nb_neg_logpdf(x, self.nu, self.mu, self.sigma)
 
     def entropy(self):
-        return nb_entropy(self.nu, self.sigma)
+        return np.broadcast_to(nb_entropy(self.nu, self.sigma), self.batch_shape)
 
     def mean(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def mode(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def median(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def var(self):
-        if self.nu > 2:
-            return self.sigma**2 * self.nu / (self.nu - 2)
-        elif self.nu > 1:
-            return np.inf
-        else:
-            return np.nan
+        return np.broadcast_to(
+            np.where(
+                self.nu > 2,
+                self.sigma**2 * self.nu / (self.nu - 2),
+                np.where(self.nu > 1, np.inf, np.nan),
+            ),
+            self.batch_shape,
+        )
 
     def std(self):
-        if self.nu > 2:
-            return self.var() ** 0.5
-        elif self.nu > 1:
-            return np.inf
-        else:
-            return np.nan
+        return self.var() ** 0.5
 
     def skewness(self):
-        if self.nu > 3:
-            return 0
-        else:
-            return np.nan
+        return np.broadcast_to(np.where(self.nu > 3, 0, np.nan), self.batch_shape)
 
     def kurtosis(self):
-        if self.nu > 4:
-            return 6 / (self.nu - 4)
-        elif self.nu > 2:
-            return np.inf
-        else:
-            return np.nan
+        return np.broadcast_to(
+            np.where(self.nu > 4, 6 / (self.nu - 4), np.where(self.nu > 2, np.inf, np.nan)),
+            self.batch_shape,
+        )
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return np.where(
@@ -204,6 +207,27 @@ def nb_cdf(x, nu, mu, sigma):
     return np.where(nu > 1e10, 0.5 * (1 + erf((x - mu) / (sigma * 2**0.5))), x_vals)
 
 
+@nb.njit(cache=True)
+def nb_logcdf(x, nu, mu, sigma):
+    return _log_std_cdf((x - mu) / sigma, nu)
+
+
+@nb.njit(cache=True)
+def nb_logsf(x, nu, mu, sigma):
+    return _log_std_cdf((mu - x) / sigma, nu)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def _log_std_cdf(t_val, nu):
+    if nu > 1e10:
+        return norm_logcdf(t_val)
+    # mass of the tail beyond |t_val|
+    tail = 0.5 * betainc(0.5 * nu, 0.5, nu / (t_val**2 + nu))
+    if t_val < 0:
+        return np.log(tail)
+    return np.log1p(-tail)
+
+
 @nb.njit(cache=True)
 def nb_ppf(p, nu, mu, sigma):
     q = np.where(p < 0.5, p, 1 - p)
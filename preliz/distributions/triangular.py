@@ -3,6 +3,7 @@ import numpy as np
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none
+from preliz.internal.sampling import rvs_method
 
 
 class Triangular(Continuous):
@@ -81,6 +82,14 @@ class Triangular(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.lower, self.c, self.upper)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.lower, self.c, self.upper)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.lower, self.c, self.upper)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.lower, self.c, self.upper)
@@ -92,13 +101,13 @@ class Triangular(Continuous):
         return nb_neg_logpdf(x, self.lower, self.c, self.upper)
 
     def entropy(self):
-        return nb_entropy(self.lower, self.upper)
+        return np.broadcast_to(nb_entropy(self.lower, self.upper), self.batch_shape)
 
     def mean(self):
         return (self.lower + self.c + self.upper) / 3
 
     def mode(self):
-        return self.c
+        return np.broadcast_to(self.c, self.batch_shape)
 
     def median(self):
         return np.where(
@@ -140,8 +149,9 @@ class Triangular(Continuous):
         )
 
     def kurtosis(self):
-        return -3 / 5
+        return np.full(self.batch_shape, -3 / 5)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         random_samples = random_state.uniform(0, 1, size)
@@ -172,6 +182,28 @@ def nb_cdf(x, lower, c, upper):
     return 1
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, lower, c, upper):
+    if x <= lower:
+        return -np.inf
+    elif x <= c:
+        return 2 * np.log(x - lower) - np.log((upper - lower) * (c - lower))
+    elif x < upper:
+        return np.log1p(-((upper - x) ** 2) / ((upper - lower) * (upper - c)))
+    return 0.0
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, lower, c, upper):
+    if x <= lower:
+        return 0.0
+    elif x <= c:
+        return np.log1p(-((x - lower) ** 2) / ((upper - lower) * (c - lower)))
+    elif x < upper:
+        return 2 * np.log(upper - x) - np.log((upper - lower) * (upper - c))
+    return -np.inf
+
+
 @nb.vectorize(nopython=True, cache=True)
 def nb_ppf(q, lower, c, upper):
     if 0 <= q < (c - lower) / (upper - lower):
@@ -1,7 +1,12 @@
+import numba as nb
 import numpy as np
 
 from preliz.distributions.distributions import DistributionTransformer
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, num_kurtosis, num_skewness
+from preliz.internal.quadrature import quad_moments
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import log1mexp, log_diff_exp
 
 
 class Truncated(DistributionTransformer):
@@ -30,6 +35,13 @@ class Truncated(DistributionTransformer):
         Truncated(Gamma(mu=2, sigma=1), 1, 4.5).plot_pdf()
         Gamma(mu=2, sigma=1).plot_pdf()
 
+    Random samples are drawn by inverting the cdf, unless the base distribution has a ppf
+    without closed form and the truncated interval retains at least 5% of its mass, then
+    samples from the base distribution outside the interval are rejected. For Normal
+    distributions truncated to a low probability interval in one of the tails the
+    exponential rejection sampler of Robert [1]_ is used, which is accurate even where
+    inverting the cdf is not.
+
     Parameters
     ----------
     dist: PreliZ distribution
@@ -38,6 +50,11 @@ class Truncated(DistributionTransformer):
         Lower (left) truncation point. Use np.inf for no truncation.
     upper: float or int
         Upper (right) truncation point. Use np.inf for no truncation.
+
+    References
+    ----------
+    .. [1] Robert, C. P. (1995). Simulation of truncated normal variables.
+       Statistics and Computing, 5(2), 121-125.
     """
 
     def __init__(self, dist, lower=None, upper=None, **kwargs):
@@ -79,13 +96,13 @@ class Truncated(DistributionTransformer):
         )
         self.params_support = (*self.dist.params_support, self.dist.support, self.dist.support)
 
+    @cache_method
     def mean(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
         if self.kind == "discrete":
-            return np.sum(x_values * pdf)
+            x_values = self.xvals("full")
+            return np.sum(x_values * self.pdf(x_values), axis=0)
         else:
-            return np.trapz(x_values * pdf, x_values)
+            return quad_moments(self, "mvske")[0]
 
     def mode(self):
         if self.kind == "discrete":
@@ -100,67 +117,221 @@ class Truncated(DistributionTransformer):
     def median(self):
         return self.ppf(0.5)
 
+    @cache_method
     def var(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
         if self.kind == "discrete":
-            return np.sum((x_values - self.mean()) ** 2 * pdf)
+            x_values = self.xvals("full")
+            return np.sum((x_values - self.mean()) ** 2 * self.pdf(x_values), axis=0)
         else:
-            return np.trapz((x_values - self.mean()) ** 2 * pdf, x_values)
+            return quad_moments(self, "mvske")[1]
 
     def std(self):
         return self.var() ** 0.5
 
+    @cache_method
     def skewness(self):
         return num_skewness(self)
 
+    @cache_method
     def kurtosis(self):
         return num_kurtosis(self)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
+        if not self.batch_shape:
+            norm = self._normalization()[1]
+            name = self.dist.__class__.__name__
+            if name == "Normal" and norm < _TAIL_MASS:
+                lower, upper = (np.array([self.lower, self.upper]) - self.dist.mu) / self.dist.sigma
+                if lower >= 0 or upper <= 0:
+                    samples = _normal_tail_rvs(lower, upper, size, random_state)
+                    return self.dist.mu + self.dist.sigma * samples
+            elif name in _NUMERICAL_PPF and norm >= _TAIL_MASS:
+                return _rejection_rvs(self.dist, self.lower, self.upper, norm, size, random_state)
         return self.ppf(random_state.uniform(size=size))
 
     def pdf(self, x):
         return np.exp(self.logpdf(x))
 
     def cdf(self, x):
+        return np.exp(self.logcdf(x))
+
+    def logcdf(self, x):
+        log_cdf, log_sf = self._log_cdf_sf(x)
+        # each one is precise where it is below log(1/2), above that use the complement of the other
+        with np.errstate(divide="ignore"):
+            return np.where(log_cdf < -np.log(2), log_cdf, log1mexp(log_sf))
+
+    def logsf(self, x):
+        log_cdf, log_sf = self._log_cdf_sf(x)
+        with np.errstate(divide="ignore"):
+            return np.where(log_sf < -np.log(2), log_sf, log1mexp(log_cdf))
+
+    def _log_cdf_sf(self, x):
+        """Return the logcdf and logsf from the differences of the base logcdf or logsf."""
         x = np.asarray(x)
+        upper_tail, log_low, log_up, log_slow, log_sup = self._log_bounds()
+        log_norm = self._normalization()[2]
+
+        def from_sf():
+            base_logsf = self.dist.logsf(x)
+            return log_diff_exp(log_slow, base_logsf), log_diff_exp(base_logsf, log_sup)
+
+        def from_cdf():
+            base_logcdf = self.dist.logcdf(x)
+            return log_diff_exp(base_logcdf, log_low), log_diff_exp(log_up, base_logcdf)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_cdf, log_sf = _select(upper_tail, from_sf, from_cdf)
+        log_cdf = np.minimum(log_cdf - log_norm, 0)
+        log_sf = np.minimum(log_sf - log_norm, 0)
         lower = adjust_lower(self.kind, self.lower)
-        lcdf = self.dist.cdf(lower)
-        vals = (self.dist.cdf(x) - lcdf) / (self.dist.cdf(self.upper) - lcdf)
-        return np.where(x < lower, 0, np.where(x > self.upper, 1, vals))
+        log_cdf = np.where(x < lower, -np.inf, np.where(x > self.upper, 0, log_cdf))
+        log_sf = np.where(x < lower, 0, np.where(x > self.upper, -np.inf, log_sf))
+        return log_cdf, log_sf
 
     def ppf(self, q):
         q = np.asarray(q)
-        lower = adjust_lower(self.kind, self.lower)
-        lcdf = self.dist.cdf(lower)
-        vals = self.dist.ppf(lcdf + q * (self.dist.cdf(self.upper) - lcdf))
+        lcdf, norm, _ = self._normalization()
+        vals = self.dist.ppf(lcdf + q * norm)
         return np.where((q < 0) | (q > 1), np.nan, vals)
 
     def logpdf(self, x):
         x = np.asarray(x)
-        lower = adjust_lower(self.kind, self.lower)
-        vals = self.dist.logpdf(x) - np.log(self.dist.cdf(self.upper) - self.dist.cdf(lower))
-        return np.where((x < self.lower) | (x > self.upper), -np.inf, vals)
+        _, _, log_norm = self._normalization()
+        return nb_truncate_logpdf(self.dist.logpdf(x), x, self.lower, self.upper, log_norm)
 
+    @cache_method
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
         if self.kind == "discrete":
-            return -np.sum(np.exp(logpdf) * logpdf)
+            x_values = self.xvals("restricted")
+            logpdf = self.logpdf(x_values)
+            return -np.sum(np.exp(logpdf) * logpdf, axis=0)
         else:
-            return -np.trapz(np.exp(logpdf) * logpdf, x_values)
+            return quad_moments(self, "mvske")[4]
 
     def _neg_logpdf(self, x):
-        return -self.logpdf(x).sum()
+        x = np.asarray(x)
+        if self.batch_shape or not nb_all_inside(x.ravel(), self.lower, self.upper):
+            return -self.logpdf(x).sum()
+        # every value is inside the bounds, so we can use the compiled kernel of the base
+        return self.dist._neg_logpdf(x) + x.size * self._normalization()[2]
+
+    @cache_method
+    def _normalization(self):
+        """Return the base cdf at the lower bound, the mass between the bounds and its log."""
+        upper_tail, log_low, log_up, log_slow, log_sup = self._log_bounds()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # above the median of the base the survival function keeps the precision
+            log_norm = _select(
+                upper_tail,
+                lambda: log_diff_exp(log_slow, log_sup),
+                lambda: log_diff_exp(log_up, log_low),
+            )
+        return np.exp(log_low), np.exp(log_norm), log_norm
+
+    @cache_method
+    def _log_bounds(self):
+        """Return if the bounds are in the upper tail of the base, its logcdf and logsf at them."""
+        lower = adjust_lower(self.kind, self.lower)
+        log_low = self.dist.logcdf(lower)
+        log_slow = self.dist.logsf(lower)
+        upper_tail = log_low > -np.log(2)
+        return (
+            upper_tail,
+            log_low,
+            self.dist.logcdf(self.upper),
+            log_slow,
+            self.dist.logsf(self.upper),
+        )
 
     def _fit_moments(self, mean, sigma):
         self.dist._fit_moments(mean, sigma)
         self._parametrization(**dict(zip(self.dist.param_names, self.dist.params)))
 
 
+# Families whose ppf is computed by root finding, for them rejection is cheaper than inversion
+_NUMERICAL_PPF = ("ExGaussian", "Mixture", "SkewNormal", "Wald")
+# Mass of the truncated interval below which rejection from the base distribution is not used
+_TAIL_MASS = 0.05
+
+
+def _rejection_rvs(dist, lower, upper, norm, size, random_state):
+    """Draw from the base distribution and keep the values inside the bounds."""
+    n_samples = int(np.prod(size)) if size is not None else 1
+    samples = []
+    n_accepted = 0
+    while n_accepted < n_samples:
+        n_draws = min(int((n_samples - n_accepted) / norm * 1.1) + 10, 10**7)
+        draws = dist.rvs(n_draws, random_state=random_state)
+        draws = draws[(draws >= lower) & (draws <= upper)]
+        samples.append(draws)
+        n_accepted += len(draws)
+    samples = np.concatenate(samples)[:n_samples]
+    if size is None:
+        return samples[0]
+    return samples.reshape(size)
+
+
+def _normal_tail_rvs(lower, upper, size, random_state):
+    """
+    Sample a standard Normal truncated to an interval that does not contain 0.
+
+    Proposals come from an exponential distribution truncated to the interval, with the rate
+    that maximizes the acceptance for one-sided truncations, as in Robert (1995).
+    """
+    flip = upper <= 0
+    if flip:
+        lower, upper = -upper, -lower
+    rate = (lower + (lower**2 + 4) ** 0.5) / 2
+    width_mass = -np.expm1(-rate * (upper - lower))
+
+    n_samples = int(np.prod(size)) if size is not None else 1
+    samples = np.empty(n_samples)
+    n_accepted = 0
+    while n_accepted < n_samples:
+        n_draws = int((n_samples - n_accepted) * 1.3) + 10
+        proposal = lower - np.log1p(-random_state.uniform(size=n_draws) * width_mass) / rate
+        accept = random_state.uniform(size=n_draws) <= np.exp(-0.5 * (proposal - rate) ** 2)
+        proposal = proposal[accept][: n_samples - n_accepted]
+        samples[n_accepted : n_accepted + len(proposal)] = proposal
+        n_accepted += len(proposal)
+
+    if flip:
+        samples = -samples
+    if size is None:
+        return samples[0]
+    return samples.reshape(size)
+
+
+def _select(upper_tail, in_upper_tail, otherwise):
+    """Evaluate the branches needed for bounds in the upper tail of the base and for the rest."""
+    if np.all(upper_tail):
+        return in_upper_tail()
+    if not np.any(upper_tail):
+        return otherwise()
+    return np.where(upper_tail, in_upper_tail(), otherwise())
+
+
 def adjust_lower(kind, lower):
     if kind == "discrete":
         lower -= 1
     return lower
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_truncate_logpdf(logpdf, x, lower, upper, log_norm):
+    if np.isnan(x):
+        return np.nan
+    elif x < lower or x > upper:
+        return -np.inf
+    return logpdf - log_norm
+
+
+@nb.njit(cache=True)
+def nb_all_inside(x, lower, upper):
+    for x_i in x:
+        if not lower <= x_i <= upper:
+            return False
+    return True
@@ -4,7 +4,8 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
-from preliz.internal.special import cdf_bounds, erf, erfinv, ppf_bounds_cont
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import cdf_bounds, erf, erfinv, log1mexp, norm_logcdf, ppf_bounds_cont
 
 
 class TruncatedNormal(Continuous):
@@ -96,6 +97,14 @@ class TruncatedNormal(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.mu, self.sigma, self.lower, self.upper)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.sigma, self.lower, self.upper)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.sigma, self.lower, self.upper)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.mu, self.sigma, self.lower, self.upper)
@@ -124,7 +133,9 @@ class TruncatedNormal(Continuous):
         )
 
     def mode(self):
-        return np.maximum(self.lower, np.minimum(self.upper, self.mu))
+        return np.broadcast_to(
+            np.maximum(self.lower, np.minimum(self.upper, self.mu)), self.batch_shape
+        )
 
     def median(self):
         alpha = (self.lower - self.mu) / self.sigma
@@ -139,8 +150,8 @@ class TruncatedNormal(Continuous):
         beta = (self.upper - self.mu) / self.sigma
         z_val = 0.5 * (1 + erf(beta / 2**0.5)) - 0.5 * (1 + erf(alpha / 2**0.5))
         # Handle for -np.inf or np.inf
-        psi_alpha = (0, 0) if alpha == -np.inf else (1, alpha)
-        psi_beta = (0, 0) if beta == np.inf else (1, beta)
+        psi_alpha = _psi(alpha, -np.inf)
+        psi_beta = _psi(beta, np.inf)
         return self.sigma**2 * (
             1
             - (
@@ -166,8 +177,8 @@ class TruncatedNormal(Continuous):
         beta = (self.upper - self.mu) / self.sigma
         z_val = 0.5 * (1 + erf(beta / 2**0.5)) - 0.5 * (1 + erf(alpha / 2**0.5))
         # Handle for -np.inf or np.inf
-        psi_alpha = (0, 0) if alpha == -np.inf else (1, alpha)
-        psi_beta = (0, 0) if beta == np.inf else (1, beta)
+        psi_alpha = _psi(alpha, -np.inf)
+        psi_beta = _psi(beta, np.inf)
         numerator = (
             (
                 (psi_alpha[1] ** 2 - 1)
@@ -229,8 +240,8 @@ class TruncatedNormal(Continuous):
         beta = (self.upper - self.mu) / self.sigma
         z_val = 0.5 * (1 + erf(beta / 2**0.5)) - 0.5 * (1 + erf(alpha / 2**0.5))
         # Handle for -np.inf or np.inf
-        psi_alpha = (0, 0) if alpha == -np.inf else (1, alpha)
-        psi_beta = (0, 0) if beta == np.inf else (1, beta)
+        psi_alpha = _psi(alpha, -np.inf)
+        psi_beta = _psi(beta, np.inf)
 
         numerator = (
             (
@@ -326,6 +337,7 @@ class TruncatedNormal(Continuous):
 
         return numerator / denominator
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         random_samples = random_state.uniform(0, 1, size)
@@ -340,6 +352,12 @@ class TruncatedNormal(Continuous):
         optimize_ml(self, sample)
 
 
+def _psi(z_val, bound):
+    # Handle for -np.inf or np.inf, element-wise
+    finite = z_val != bound
+    return finite * 1, np.where(finite, z_val, 0)
+
+
 @nb.njit(cache=True)
 def nb_cdf(x, mu, sigma, lower, upper):
     xi = (x - mu) / sigma
@@ -350,6 +368,62 @@ def nb_cdf(x, mu, sigma, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, mu, sigma, lower, upper):
+    if x <= lower:
+        return -np.inf
+    if x >= upper:
+        return 0.0
+    alpha = (lower - mu) / sigma
+    beta = (upper - mu) / sigma
+    z_val = (x - mu) / sigma
+    if alpha > 0:
+        # above the mean, differences of the survival function keep the precision
+        log_sf_alpha = norm_logcdf(-alpha)
+        log_cdf = log1mexp(norm_logcdf(-z_val) - log_sf_alpha) - log1mexp(
+            norm_logcdf(-beta) - log_sf_alpha
+        )
+    else:
+        log_cdf_alpha = norm_logcdf(alpha)
+        log_cdf_z = norm_logcdf(z_val)
+        log_cdf_beta = norm_logcdf(beta)
+        log_cdf = (
+            log_cdf_z
+            + log1mexp(log_cdf_alpha - log_cdf_z)
+            - log_cdf_beta
+            - log1mexp(log_cdf_alpha - log_cdf_beta)
+        )
+    # rounding can push the values next to the bounds above 0
+    return min(log_cdf, 0.0)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, mu, sigma, lower, upper):
+    if x <= lower:
+        return 0.0
+    if x >= upper:
+        return -np.inf
+    alpha = (lower - mu) / sigma
+    beta = (upper - mu) / sigma
+    z_val = (x - mu) / sigma
+    if alpha > 0:
+        log_sf_alpha = norm_logcdf(-alpha)
+        log_sf_z = norm_logcdf(-z_val)
+        log_sf_beta = norm_logcdf(-beta)
+        log_sf = (
+            log_sf_z
+            + log1mexp(log_sf_beta - log_sf_z)
+            - log_sf_alpha
+            - log1mexp(log_sf_beta - log_sf_alpha)
+        )
+    else:
+        log_cdf_beta = norm_logcdf(beta)
+        log_sf = log1mexp(norm_logcdf(z_val) - log_cdf_beta) - log1mexp(
+            norm_logcdf(alpha) - log_cdf_beta
+        )
+    return min(log_sf, 0.0)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, mu, sigma, lower, upper):
     alpha = (lower - mu) / sigma
@@ -365,7 +439,7 @@ def nb_ppf(q, mu, sigma, lower, upper):
     return ppf_bounds_cont(inv_phi * sigma + mu, q, lower, upper)
 
 
-@nb.njit(cache=True)
+@nb.vectorize(nopython=True, cache=True)
 def nb_entropy(mu, sigma, lower, upper):
     alpha = (lower - mu) / sigma
     beta = (upper - mu) / sigma
@@ -397,12 +471,10 @@ def nb_neg_logpdf(x, mu, sigma, lower, upper):
     return -(nb_logpdf(x, mu, sigma, lower, upper)).sum()
 
 
-@nb.njit(cache=True)
+@nb.njit(cache=True, nogil=True)
 def nb_rvs(random_samples, mu, sigma, lower, upper):
     alpha = (lower - mu) / sigma
     beta = (upper - mu) / sigma
     z_val = 0.5 * (1 + erf(beta / 2**0.5)) - 0.5 * (1 + erf(alpha / 2**0.5))
-    inv_phi = 2**0.5 * erfinv(
-        2 * (0.5 * (1 + erf(alpha / 2**0.5)) + random_samples * z_val) - 1
-    )
+    inv_phi = 2**0.5 * erfinv(2 * (0.5 * (1 + erf(alpha / 2**0.5)) + random_samples * z_val) - 1)
     return inv_phi * sigma + mu
@@ -3,6 +3,7 @@ import numpy as np
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import cdf_bounds, ppf_bounds_cont
 
 
@@ -77,6 +78,14 @@ class Uniform(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.lower, self.upper)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.lower, self.upper)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.lower, self.upper)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.lower, self.upper)
@@ -90,6 +99,21 @@ class Uniform(Continuous):
     def entropy(self):
         return nb_entropy(self.lower, self.upper)
 
+    def _entropy_grad(self):
+        width = self.upper - self.lower
+        return np.array([-1 / width, 1 / width])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        width = self.upper - self.lower
+        inside = (x >= self.lower) & (x <= self.upper)
+        return np.stack(
+            [
+                np.where(inside, (x - self.upper) / width**2, 0),
+                np.where(inside, (self.lower - x) / width**2, 0),
+            ]
+        )
+
     def mean(self):
         return (self.upper + self.lower) / 2
 
@@ -106,11 +130,12 @@ class Uniform(Continuous):
         return self.var() ** 0.5
 
     def skewness(self):
-        return 0
+        return np.zeros(self.batch_shape)
 
     def kurtosis(self):
-        return -6 / 5
+        return np.full(self.batch_shape, -6 / 5)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.uniform(self.lower, self.upper, size)
@@ -132,6 +157,24 @@ def nb_cdf(x, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, lower, upper):
+    if x <= lower:
+        return -np.inf
+    if x >= upper:
+        return 0.0
+    return np.log((x - lower) / (upper - lower))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, lower, upper):
+    if x <= lower:
+        return 0.0
+    if x >= upper:
+        return -np.inf
+    return np.log((upper - x) / (upper - lower))
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, lower, upper):
     x_vals = lower + q * (upper - lower)
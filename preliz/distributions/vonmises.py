@@ -1,12 +1,12 @@
+import numba as nb
 import numpy as np
-from scipy.integrate import quad
-from scipy.optimize import bisect
-from scipy.special import i0e, i1e
 from scipy.stats import circmean
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import find_kappa, optimize_moments
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import erfc, erfcinv, i0e, i1e, ppf_bounds_cont
 
 
 class VonMises(Continuous):
@@ -71,10 +71,12 @@ class VonMises(Continuous):
         return np.exp(self.logpdf(x))
 
     def cdf(self, x):
-        return nb_cdf(x, self.pdf)
+        x = np.asarray(x)
+        return nb_cdf(x, self.mu, self.kappa)
 
     def ppf(self, q):
-        return nb_ppf(q, self.pdf)
+        q = np.asarray(q)
+        return nb_ppf(q, self.mu, self.kappa)
 
     def logpdf(self, x):
         return nb_logpdf(x, self.mu, self.kappa)
@@ -86,26 +88,27 @@ class VonMises(Continuous):
         return nb_entropy(self.kappa, self.var())
 
     def mean(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def mode(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def median(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def var(self):
-        return 1 - i1e(self.kappa) / i0e(self.kappa)
+        return np.broadcast_to(1 - i1e(self.kappa) / i0e(self.kappa), self.batch_shape)
 
     def std(self):
         return self.var() ** 0.5
 
     def skewness(self):
-        return 0
+        return np.zeros(self.batch_shape)
 
     def kurtosis(self):
-        return 0
+        return np.zeros(self.batch_shape)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.vonmises(self.mu, self.kappa, size)
@@ -136,44 +139,77 @@ class VonMises(Continuous):
         return _warp_interval(hdi_min, hdi_max, self.mu, fmt)
 
 
-def nb_cdf(x, pdf):
-    if isinstance(x, int | float):
-        x = [x]
-        scalar_input = True
-    else:
-        scalar_input = False
-
-    cdf_values = np.array([quad(pdf, -np.pi, xi)[0] if xi <= np.pi else 1 for xi in x])
-
-    return cdf_values[0] if scalar_input else cdf_values
-
-
-def nb_ppf(q, pdf):
-    def root_func(x, q):
-        return nb_cdf(x, pdf) - q
+@nb.njit(cache=True)
+def _cdf_centered(y, kappa):
+    """
+    Cdf of the VonMises with mu=0, extended to the real line so that F(y + 2π) = F(y) + 1.
 
-    if isinstance(q, int | float):
-        q = [q]
-        scalar_input = True
+    Follows Hill's algorithm (ACM 518), a backward recursion of the Bessel series for small
+    kappa and a normal approximation in sin(y / 2) for large kappa.
+    """
+    turns = np.round(y / (2 * np.pi))
+    y = y - turns * 2 * np.pi
+    if kappa < 50:
+        n_terms = int(np.ceil(28 + 0.5 * kappa - 100 / (kappa + 5)))
+        sin_y, cos_y = np.sin(y), np.cos(y)
+        sin_n, cos_n = np.sin(n_terms * y), np.cos(n_terms * y)
+        r_val = 0.0
+        v_val = 0.0
+        for n in range(n_terms - 1, 0, -1):
+            sin_n, cos_n = sin_n * cos_y - cos_n * sin_y, cos_n * cos_y + sin_n * sin_y
+            r_val = 1 / (2 * n / kappa + r_val)
+            v_val = r_val * (sin_n / n + v_val)
+        prob = min(max(0.5 + y / (2 * np.pi) + v_val / np.pi, 0.0), 1.0)
     else:
-        scalar_input = False
-
-    ppf_values = []
-    for q_i in q:
-        if q_i < 0:
-            val = np.nan
-        elif q_i > 1:
-            val = np.nan
-        elif q_i == 0:
-            val = -np.inf
-        elif q_i == 1:
-            val = np.inf
+        z_val = np.sqrt(2 / np.pi) / i0e(kappa) * np.sin(y / 2)
+        prob = 0.5 * erfc(-z_val / np.sqrt(2))
+    return prob + turns
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_cdf(x, mu, kappa):
+    if x <= -np.pi:
+        return 0.0
+    if x >= np.pi:
+        return 1.0
+    prob = _cdf_centered(x - mu, kappa) - _cdf_centered(-np.pi - mu, kappa)
+    return min(max(prob, 0.0), 1.0)
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_ppf(q, mu, kappa):
+    if q <= 0 or q >= 1:
+        return ppf_bounds_cont(np.nan, q, -np.inf, np.inf)
+
+    # solve on y = x - mu, where the centered cdf is continuous and increasing
+    lower = -np.pi - mu
+    upper = np.pi - mu
+    target = q + _cdf_centered(lower, kappa)
+    norm = 2 * np.pi * i0e(kappa)
+
+    # initial guess from the normal approximation in sin(y / 2)
+    turns = np.floor(target)
+    z_val = -np.sqrt(np.pi) * erfcinv(2 * (target - turns)) * i0e(kappa)
+    y_val = 2 * np.arcsin(min(max(z_val, -1.0), 1.0)) + 2 * np.pi * turns
+    y_val = min(max(y_val, lower), upper)
+
+    for _ in range(100):
+        delta = _cdf_centered(y_val, kappa) - target
+        if delta > 0:
+            upper = y_val
         else:
-            val = bisect(root_func, -np.pi, np.pi, args=(q_i,))
-
-        ppf_values.append(val)
-
-    return ppf_values[0] if scalar_input else np.array(ppf_values)
+            lower = y_val
+        density = np.exp(kappa * (np.cos(y_val) - 1)) / norm
+        # a vanishing density sends the step to the bracket edge, which triggers bisection
+        new_y = y_val - delta / density if density > 0 else upper
+        if not lower < new_y < upper:
+            new_y = 0.5 * (lower + upper)
+        if abs(new_y - y_val) < 1e-14 * max(1.0, abs(y_val)):
+            y_val = new_y
+            break
+        y_val = new_y
+
+    return y_val + mu
 
 
 def nb_entropy(kappa, var):
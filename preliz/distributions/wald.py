@@ -5,7 +5,8 @@ from scipy.special import expi, ndtr
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import find_ppf, optimize_ml
-from preliz.internal.special import cdf_bounds
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import cdf_bounds, log1mexp, norm_logcdf
 
 
 class Wald(Continuous):
@@ -74,11 +75,11 @@ class Wald(Continuous):
 
         if phi is not None:
             self.phi = phi
-            if (mu and phi) is not None:
+            if all_not_none(mu, phi):
                 lam = self._from_mu_phi(mu, phi)
                 self.param_names = ("mu", "phi")
 
-            elif (lam and phi) is not None:
+            elif all_not_none(lam, phi):
                 mu = self._from_lam_phi(lam, phi)
                 self.param_names = ("lam", "phi")
 
@@ -121,6 +122,14 @@ class Wald(Continuous):
         x = np.array(x)
         return nb_cdf(x, self.mu, self.lam)
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.mu, self.lam)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.mu, self.lam)
+
     def ppf(self, q):
         q = np.asarray(q)
         return find_ppf(self, q)
@@ -135,7 +144,7 @@ class Wald(Continuous):
         return nb_entropy(self.mu, self.lam)
 
     def mean(self):
-        return self.mu
+        return np.broadcast_to(self.mu, self.batch_shape)
 
     def mode(self):
         return self.mu * (
@@ -157,6 +166,7 @@ class Wald(Continuous):
     def kurtosis(self):
         return 15 * self.mu / self.lam
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.wald(self.mu, self.lam, size)
@@ -177,6 +187,36 @@ def nb_cdf(x, mu, lam):
     return cdf_bounds(z, x, 0, np.inf)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, mu, lam):
+    if x <= 0:
+        return -np.inf
+    if x == np.inf:
+        return 0.0
+    u = (lam / x) ** 0.5
+    v = x / mu
+    log_first = norm_logcdf(u * (v - 1))
+    log_second = 2 * lam / mu + norm_logcdf(-u * (v + 1))
+    # log(exp(log_first) + exp(log_second)) without overflow
+    log_max = max(log_first, log_second)
+    if log_max == -np.inf:
+        return -np.inf
+    return log_max + np.log1p(np.exp(min(log_first, log_second) - log_max))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, mu, lam):
+    if x <= 0:
+        return 0.0
+    if x == np.inf:
+        return -np.inf
+    u = (lam / x) ** 0.5
+    v = x / mu
+    log_first = norm_logcdf(-u * (v - 1))
+    log_second = 2 * lam / mu + norm_logcdf(-u * (v + 1))
+    return log_first + log1mexp(min(log_second - log_first, 0.0))
+
+
 def nb_entropy(mu, lam):
     return 0.5 * np.log((2 * np.pi * np.e * mu**3) / lam) + 3 / 2 * np.exp(2 * lam / mu) * expi(
         -2 * lam / mu
@@ -4,10 +4,12 @@ import numpy as np
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.sampling import rvs_method
 from preliz.internal.special import (
     cdf_bounds,
     gamma,
     garcia_approximation,
+    log1mexp,
     mean_and_std,
     ppf_bounds_cont,
     xlogy,
@@ -79,6 +81,14 @@ class Weibull(Continuous):
         x = np.asarray(x)
         return nb_cdf(x, self.alpha, self.beta, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.alpha, self.beta)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.alpha, self.beta)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.alpha, self.beta, self.support[0], self.support[1])
@@ -92,6 +102,15 @@ class Weibull(Continuous):
     def entropy(self):
         return nb_entropy(self.alpha, self.beta)
 
+    def _entropy_grad(self):
+        return np.array([np.euler_gamma / self.alpha**2 - 1 / self.alpha, 1 / self.beta])
+
+    def _cdf_grad(self, x):
+        x = np.asarray(x)
+        x_pdf = np.nan_to_num(x * self.pdf(x))
+        log_x = np.log(np.where(x > 0, x / self.beta, 1))
+        return np.stack([x_pdf * np.nan_to_num(log_x) / self.alpha, -x_pdf / self.beta])
+
     def mean(self):
         return self.beta * gamma(1 + 1 / self.alpha)
 
@@ -128,6 +147,7 @@ class Weibull(Continuous):
             - 3
         )
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         return random_state.weibull(self.alpha, size) * self.beta
@@ -148,6 +168,20 @@ def nb_cdf(x, alpha, beta, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, alpha, beta):
+    if x <= 0:
+        return -np.inf
+    return log1mexp(-((x / beta) ** alpha))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, alpha, beta):
+    if x <= 0:
+        return 0.0
+    return -((x / beta) ** alpha)
+
+
 @nb.njit(cache=True)
 def nb_ppf(q, alpha, beta, lower, upper):
     x_val = beta * (-np.log(1 - q)) ** (1 / alpha)
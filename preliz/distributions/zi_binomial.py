@@ -5,7 +5,15 @@ from scipy.special import bdtr, bdtrik
 from preliz.distributions.distributions import Discrete
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import find_discrete_mode, optimize_ml, optimize_moments
-from preliz.internal.special import cdf_bounds, gammaln, ppf_bounds_disc
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    cdf_bounds,
+    gammaln,
+    log1mexp,
+    log_betainc,
+    ppf_bounds_disc,
+    xlogy,
+)
 
 
 class ZeroInflatedBinomial(Discrete):
@@ -68,10 +76,7 @@ class ZeroInflatedBinomial(Discrete):
         self.n = np.int64(n)
         self.p = np.float64(p)
         self.params = (self.psi, self.n, self.p)
-        if self.psi == 0:
-            self.support = (0, 0)
-        else:
-            self.support = (0, self.n)
+        self.support = (0, np.where(self.psi == 0, 0, self.n))
         self.is_frozen = True
 
     def pdf(self, x):
@@ -81,6 +86,14 @@ class ZeroInflatedBinomial(Discrete):
     def cdf(self, x):
         return nb_cdf(x, self.psi, self.n, self.p, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.psi, self.n, self.p)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.psi, self.n, self.p)
+
     def ppf(self, q):
         return nb_ppf(q, self.psi, self.n, self.p, self.support[0], self.support[1])
 
@@ -92,11 +105,8 @@ class ZeroInflatedBinomial(Discrete):
 
     def entropy(self):
         binomial_entropy = 0.5 * np.log(2 * np.pi * np.e * self.n * self.p * (1 - self.p))
-        if self.psi == 1:
-            return binomial_entropy
-        else:
-            zero_entropy = -(1 - self.psi) * np.log(1 - self.psi) - self.psi * np.log(self.psi)
-            return (1 - self.psi) * zero_entropy + self.psi * binomial_entropy
+        zero_entropy = -xlogy(1 - self.psi, 1 - self.psi) - xlogy(self.psi, self.psi)
+        return (1 - self.psi) * zero_entropy + self.psi * binomial_entropy
 
     def mean(self):
         return self.psi * self.n * self.p
@@ -115,12 +125,13 @@ class ZeroInflatedBinomial(Discrete):
 
     def skewness(self):
         # implement skewness
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
     def kurtosis(self):
         # implement kurtosis
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         zeros = random_state.uniform(size=size) > (1 - self.psi)
@@ -143,6 +154,26 @@ def nb_cdf(x, psi, n, p, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, psi, n, p):
+    if x < 0:
+        return -np.inf
+    x = np.floor(x)
+    if x >= n:
+        return 0.0
+    return log1mexp(np.log(psi) + log_betainc(x + 1, n - x, p))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, psi, n, p):
+    if x < 0:
+        return 0.0
+    x = np.floor(x)
+    if x >= n:
+        return -np.inf
+    return np.log(psi) + log_betainc(x + 1, n - x, p)
+
+
 # @nb.jit
 def nb_ppf(q, psi, n, p, lower, upper):
     q = np.asarray(q)
@@ -3,9 +3,19 @@ import numpy as np
 from scipy.special import nbdtrik
 
 from preliz.distributions.distributions import Discrete
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, any_not_none, eps
 from preliz.internal.optimization import find_discrete_mode, optimize_ml, optimize_moments
-from preliz.internal.special import betainc, cdf_bounds, gammaln, ppf_bounds_disc, xlogy
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    betainc,
+    cdf_bounds,
+    gammaln,
+    log1mexp,
+    log_betaincc,
+    ppf_bounds_disc,
+    xlogy,
+)
 
 
 class ZeroInflatedNegativeBinomial(Discrete):
@@ -133,6 +143,14 @@ class ZeroInflatedNegativeBinomial(Discrete):
         x = np.asarray(x)
         return nb_cdf(x, self.psi, self.n, self.p, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.psi, self.n, self.p)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.psi, self.n, self.p)
+
     def ppf(self, q):
         q = np.asarray(q)
         return nb_ppf(q, self.psi, self.n, self.p, self.support[0], self.support[1])
@@ -143,13 +161,14 @@ class ZeroInflatedNegativeBinomial(Discrete):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.psi, self.n, self.p, self.mu)
 
+    @cache_method
     def entropy(self):
         x = self.xvals("full", 5000)
         logpdf = self.logpdf(x)
-        return -np.sum(np.exp(logpdf) * logpdf)
+        return -np.sum(np.exp(logpdf) * logpdf, axis=0)
 
     def mean(self):
-        return self.psi * self.mu
+        return np.broadcast_to(self.psi * self.mu, self.batch_shape)
 
     def mode(self):
         return find_discrete_mode(self)
@@ -167,12 +186,13 @@ class ZeroInflatedNegativeBinomial(Discrete):
 
     def skewness(self):
         # implement skewness
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
     def kurtosis(self):
         # implement kurtosis
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         zeros = random_state.uniform(size=size) > (1 - self.psi)
@@ -193,6 +213,24 @@ def nb_cdf(x, psi, n, p, lower, upper):
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, psi, n, p):
+    if x < 0:
+        return -np.inf
+    if x == np.inf:
+        return 0.0
+    return log1mexp(np.log(psi) + log_betaincc(n, np.floor(x) + 1, p))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, psi, n, p):
+    if x < 0:
+        return 0.0
+    if x == np.inf:
+        return -np.inf
+    return np.log(psi) + log_betaincc(n, np.floor(x) + 1, p)
+
+
 # @nb.jit
 # bdtrik not supported by numba
 def nb_ppf(q, psi, n, p, lower, upper):
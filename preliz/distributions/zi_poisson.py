@@ -1,11 +1,21 @@
 import numba as nb
 import numpy as np
-from scipy.special import pdtr, pdtrik
+from scipy.special import pdtrik
 
 from preliz.distributions.distributions import Discrete
+from preliz.internal.cache import cache_method
 from preliz.internal.distribution_helper import all_not_none, eps
 from preliz.internal.optimization import find_discrete_mode, optimize_ml, optimize_moments
-from preliz.internal.special import cdf_bounds, gammaln, ppf_bounds_disc, xlogy
+from preliz.internal.sampling import rvs_method
+from preliz.internal.special import (
+    cdf_bounds,
+    gammaincc,
+    gammaln,
+    log1mexp,
+    log_gammainc,
+    ppf_bounds_disc,
+    xlogy,
+)
 
 
 class ZeroInflatedPoisson(Discrete):
@@ -79,8 +89,17 @@ class ZeroInflatedPoisson(Discrete):
         return np.exp(nb_logpdf(x, self.psi, self.mu))
 
     def cdf(self, x):
+        x = np.asarray(x)
         return nb_cdf(x, self.psi, self.mu, self.support[0], self.support[1])
 
+    def logcdf(self, x):
+        x = np.asarray(x)
+        return nb_logcdf(x, self.psi, self.mu)
+
+    def logsf(self, x):
+        x = np.asarray(x)
+        return nb_logsf(x, self.psi, self.mu)
+
     def ppf(self, q):
         return nb_ppf(q, self.psi, self.mu, self.support[0], self.support[1])
 
@@ -90,25 +109,23 @@ class ZeroInflatedPoisson(Discrete):
     def _neg_logpdf(self, x):
         return nb_neg_logpdf(x, self.psi, self.mu)
 
+    @cache_method
     def entropy(self):
-        if self.mu < 50:
-            x = self.xvals("full", 5000)
-            logpdf = self.logpdf(x)
-            return -np.sum(np.exp(logpdf) * logpdf)
-        else:
-            poisson_entropy = (
-                0.5 * np.log(2 * np.pi * np.e * self.mu)
-                - 1 / (12 * self.mu)
-                - 1 / (24 * self.mu**2)
-                - 19 / (360 * self.mu**3)
-            )
-            if self.psi == 1:
-                return poisson_entropy
-            else:
-                # The var can be 0 with probability 1-psi or something else with probability psi
-                zero_entropy = -(1 - self.psi) * np.logp(1 - self.psi) - self.psi * np.log(self.psi)
-                # The total entropy is the weighted sum of the two entropies
-                return (1 - self.psi) * zero_entropy + self.psi * poisson_entropy
+        x = self.xvals("full", 5000)
+        logpdf = self.logpdf(x)
+        entropy = -np.sum(np.exp(logpdf) * logpdf, axis=0)
+        poisson_entropy = (
+            0.5 * np.log(2 * np.pi * np.e * self.mu)
+            - 1 / (12 * self.mu)
+            - 1 / (24 * self.mu**2)
+            - 19 / (360 * self.mu**3)
+        )
+        # The var can be 0 with probability 1-psi or something else with probability psi
+        zero_entropy = -xlogy(1 - self.psi, 1 - self.psi) - xlogy(self.psi, self.psi)
+        # The total entropy is the weighted sum of the two entropies
+        return np.where(
+            self.mu < 50, entropy, (1 - self.psi) * zero_entropy + self.psi * poisson_entropy
+        )
 
     def mean(self):
         return self.psi * self.mu
@@ -126,11 +143,12 @@ class ZeroInflatedPoisson(Discrete):
         return self.var() ** 0.5
 
     def skewness(self):
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
     def kurtosis(self):
-        return np.nan
+        return np.full(self.batch_shape, np.nan)
 
+    @rvs_method
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
         zeros = random_state.uniform(size=size) > (1 - self.psi)
@@ -138,21 +156,34 @@ class ZeroInflatedPoisson(Discrete):
         return zeros * poisson
 
 
-# @nb.jit
-# pdtr not supported by numba
+@nb.njit(cache=True)
 def nb_cdf(x, psi, mu, lower, upper):
-    p_prob = pdtr(x, mu)
+    p_prob = gammaincc(np.floor(x) + 1, mu)
     prob = (1 - psi) + psi * p_prob
     return cdf_bounds(prob, x, lower, upper)
 
 
+@nb.vectorize(nopython=True, cache=True)
+def nb_logcdf(x, psi, mu):
+    if x < 0:
+        return -np.inf
+    return log1mexp(np.log(psi) + log_gammainc(np.floor(x) + 1, mu))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_logsf(x, psi, mu):
+    if x < 0:
+        return 0.0
+    return np.log(psi) + log_gammainc(np.floor(x) + 1, mu)
+
+
 # @nb.jit
 # pdtr not supported by numba
 def nb_ppf(q, psi, mu, lower, upper):
     q = np.asarray(q)
     vals = np.ceil(pdtrik(q, mu))
     vals1 = np.maximum(vals - 1, 0)
-    temp = pdtr(vals1, mu)
+    temp = gammaincc(vals1 + 1, mu)
     p_vals = np.where(temp >= q, vals1, vals)
     x_vals = (1 - psi) + psi * p_vals
     return ppf_bounds_disc(x_vals, q, lower, upper)
@@ -0,0 +1,83 @@
+"""
+Build the tables of initial guesses used by the maxent and quartile optimizations.
+
+Run with ``python -m preliz.internal.build_init_tables`` after changing the families or the grids
+in ``preliz.internal.init_tables``, or the distributions they tabulate.
+"""
+
+import sys
+import warnings
+
+import numpy as np
+from scipy.interpolate import NearestNDInterpolator
+from scipy.special import expit
+
+from preliz import distributions
+from preliz.internal.init_tables import (
+    SCALE_FAMILIES,
+    SCALE_GRID,
+    TABLES_PATH,
+    UNIT_FAMILIES,
+    UNIT_GRID,
+    _load_tables,
+)
+from preliz.unidimensional.maxent import _fit_maxent
+
+
+def build_tables(passes=2):
+    """
+    Solve the maxent problems on the grids and save the tables.
+
+    Every grid point is solved from the initial guess used by ``maxent``, which after the first
+    pass includes the tables of the previous one, and from the solution of the previous point
+    along the mass axis, keeping the solution with the largest entropy. Points where all the
+    optimizations fail are filled with the closest point that was solved.
+    """
+    for _ in range(passes):
+        # single precision is more than enough for an initial guess and halves the size
+        tables = {
+            name: _build_table(name).astype(np.float32)
+            for name in (*SCALE_FAMILIES, *UNIT_FAMILIES)
+        }
+        np.savez_compressed(TABLES_PATH, **tables)
+        _load_tables.cache_clear()
+
+
+def _build_table(name):
+    grid = SCALE_GRID if name in SCALE_FAMILIES else UNIT_GRID
+    shape = tuple(len(axis) for axis in grid)
+    table = np.full((*shape, 2), np.nan)
+    for idx in np.ndindex(shape[:-1]):
+        previous = None
+        for jdx in range(shape[-1]):
+            point = [axis[i] for axis, i in zip(grid, (*idx, jdx))]
+            if name in SCALE_FAMILIES:
+                lower, upper = 1, np.exp(np.exp(point[0]))
+            else:
+                lower = point[0]
+                upper = lower + point[1] * (1 - lower)
+            mass = expit(point[-1])
+
+            best = None
+            for init_params in [None] if previous is None else [None, previous]:
+                dist = getattr(distributions, name)()
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    r_error, _ = _fit_maxent(dist, lower, upper, mass, (), init_params)
+                if not (dist.opt.success and r_error <= 0.01):
+                    continue
+                if best is None or dist.entropy() > best.entropy():
+                    best = dist
+            if best is not None:
+                previous = dict(zip(best.param_names, best.params))
+                table[(*idx, jdx)] = np.log(best.params)
+
+    solved = np.all(np.isfinite(table), axis=-1)
+    fill = NearestNDInterpolator(np.argwhere(solved), table[solved])
+    table[~solved] = fill(np.argwhere(~solved))
+    print(f"{name}: {solved.sum()} of {solved.size} points solved", file=sys.stdout)
+    return table
+
+
+if __name__ == "__main__":
+    build_tables()
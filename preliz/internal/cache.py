@@ -0,0 +1,106 @@
+"""Process-wide cache for expensive quantities derived from frozen distributions."""
+
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+
+from preliz.internal.rcparams import rcParams
+
+_cache = OrderedDict()
+
+
+def clear_cache():
+    """Remove every entry from the cache of derived quantities.
+
+    Quantities such as the hdi, eti or numerically computed moments are cached per family and
+    parameter values. The maximum number of entries is controlled by
+    ``rcParams["stats.cache_size"]``, set it to 0 to disable the cache.
+    """
+    _cache.clear()
+
+
+def cache_info():
+    """Return the number of entries in the cache and its maximum size."""
+    return len(_cache), rcParams["stats.cache_size"]
+
+
+def dist_key(dist):
+    """
+    Key identifying a frozen distribution by its family and exact parameter values.
+
+    Returns None if the distribution is not frozen.
+    """
+    if not getattr(dist, "is_frozen", False):
+        return None
+
+    base = getattr(dist, "dist", None)
+    if isinstance(base, list | tuple):
+        base_key = tuple(dist_key(b_dist) for b_dist in base)
+        if None in base_key:
+            return None
+    elif base is not None and hasattr(base, "params"):
+        base_key = dist_key(base)
+        if base_key is None:
+            return None
+    else:
+        base_key = None
+
+    params_key = []
+    for param in dist.params:
+        if isinstance(param, float | int):
+            # fast path for scalars, the most common case inside optimization loops
+            params_key.append((type(param), param))
+        else:
+            value = np.asarray(param)
+            params_key.append((value.dtype.str, value.shape, value.tobytes()))
+
+    return (dist.__class__, tuple(dist.param_names), tuple(params_key), base_key)
+
+
+def cached(dist, name, func, *args):
+    """
+    Return ``func(*args)``, reusing the result stored for the same distribution, name and args.
+
+    Arrays are copied on the way in and out so cached values can not be modified by the caller.
+    """
+    size = rcParams["stats.cache_size"]
+    key = dist_key(dist) if size else None
+    if key is None:
+        return func(*args)
+
+    key = (key, name, args)
+    try:
+        hash(key)
+    except TypeError:
+        return func(*args)
+
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _copy(_cache[key])
+
+    value = func(*args)
+    _cache[key] = _copy(value)
+    while len(_cache) > size:
+        _cache.popitem(last=False)
+    return value
+
+
+def cache_method(method):
+    """Decorate a distribution method so its result is cached per parameter values."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if kwargs:
+            return method(self, *args, **kwargs)
+        return cached(self, method.__name__, lambda *args_: method(self, *args_), *args)
+
+    return wrapper
+
+
+def _copy(value):
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy(val) for val in value)
+    return value
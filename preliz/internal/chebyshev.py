@@ -0,0 +1,115 @@
+"""Piecewise Chebyshev interpolation used to build fast surrogates of expensive functions."""
+
+import numba as nb
+import numpy as np
+
+# Degree of the polynomial on each piece
+DEGREE = 16
+# Chebyshev points of the second kind on [-1, 1], the even ones are the interpolation nodes and the
+# odd ones, halfway between them, are used to check the error of the interpolant
+_CHECK_POINTS = -np.cos(np.pi * np.arange(2 * DEGREE + 1) / (2 * DEGREE))
+_NODES = _CHECK_POINTS[::2]
+_VALUES_TO_COEFFS = np.linalg.inv(np.polynomial.chebyshev.chebvander(_NODES, DEGREE))
+
+
+def fit_piecewise(func, lower, upper, tolerance, max_pieces=2000, max_depth=52):
+    """
+    Fit a piecewise Chebyshev interpolant of ``func`` on the interval [lower, upper].
+
+    Every piece is interpolated with a polynomial of degree ``DEGREE`` and bisected until the
+    interpolant agrees with ``func`` to within ``tolerance`` halfway between the interpolation
+    nodes. Pieces that do not converge, because ``func`` is not smooth there or because the
+    maximum depth or number of pieces is reached, are flagged so ``func`` is used instead.
+    All pieces at the same level of bisection are evaluated with a single call to ``func``.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized function to interpolate.
+    lower, upper : float
+        Finite limits of the interval.
+    tolerance : callable
+        Function of the points and the values of ``func`` returning the allowed absolute error.
+    max_pieces : int
+        Maximum number of pieces.
+    max_depth : int
+        Maximum number of bisections of the initial interval.
+
+    Returns
+    -------
+    pieces : tuple
+        The edges of the pieces, the Chebyshev coefficients of each piece and a boolean array
+        flagging the pieces that should be evaluated with ``func``.
+    """
+    pending = np.array([[lower, upper]], dtype=float)
+    done = []
+    depth = 0
+    while len(pending):
+        centers = pending.mean(1, keepdims=True)
+        half_widths = np.diff(pending, axis=1) / 2
+        points = centers + half_widths * _CHECK_POINTS
+        values = np.asarray(func(points.ravel()), dtype=float).reshape(points.shape)
+        allowed = np.broadcast_to(tolerance(points, values), points.shape)
+
+        coeffs = values[:, ::2] @ _VALUES_TO_COEFFS.T
+        errors = np.abs(
+            np.polynomial.chebyshev.chebval(_CHECK_POINTS[1::2], coeffs.T) - values[:, 1::2]
+        )
+        converged = np.all(np.isfinite(values), axis=1) & np.all(errors <= allowed[:, 1::2], axis=1)
+
+        too_narrow = half_widths[:, 0] < 64 * np.finfo(float).eps * np.abs(pending).max(1)
+        n_pieces = sum(len(piece[0]) for piece in done) + len(pending)
+        final = converged | too_narrow | (depth == max_depth) | (n_pieces >= max_pieces)
+        done.append((pending[final], coeffs[final], ~converged[final]))
+
+        split = pending[~final]
+        pending = np.concatenate(
+            [
+                np.column_stack([split[:, 0], centers[~final, 0]]),
+                np.column_stack([centers[~final, 0], split[:, 1]]),
+            ]
+        )
+        depth += 1
+
+    intervals = np.concatenate([piece[0] for piece in done])
+    order = np.argsort(intervals[:, 0])
+    edges = np.append(intervals[order, 0], intervals[order[-1], 1])
+    coeffs = np.concatenate([piece[1] for piece in done])[order]
+    exact = np.concatenate([piece[2] for piece in done])[order]
+    return edges, coeffs, exact
+
+
+def eval_piecewise(pieces, x):
+    """
+    Evaluate a piecewise Chebyshev interpolant built with ``fit_piecewise``.
+
+    Returns the values and a boolean array marking the points outside the interpolated interval,
+    or inside pieces flagged as exact, that have to be computed with the original function.
+    """
+    x = np.asarray(x, dtype=float)
+    values, missing = _eval_piecewise(x.ravel(), *pieces)
+    return values.reshape(x.shape), missing.reshape(x.shape)
+
+
+@nb.njit(cache=True)
+def _eval_piecewise(x, edges, coeffs, exact):
+    n_pieces = len(exact)
+    values = np.full(len(x), np.nan)
+    missing = np.zeros(len(x), dtype=np.bool_)
+    for i in range(len(x)):
+        x_i = x[i]
+        if not edges[0] <= x_i <= edges[-1]:
+            missing[i] = True
+            continue
+        k = min(np.searchsorted(edges, x_i, side="right") - 1, n_pieces - 1)
+        if exact[k]:
+            missing[i] = True
+            continue
+        t = (2 * x_i - edges[k] - edges[k + 1]) / (edges[k + 1] - edges[k])
+        # Clenshaw recurrence
+        b_1 = 0.0
+        b_2 = 0.0
+        for j in range(coeffs.shape[1] - 1, 0, -1):
+            b_1, b_2 = coeffs[k, j] + 2 * t * b_1 - b_2, b_1
+        values[i] = coeffs[k, 0] + t * b_1 - b_2
+    return values, missing
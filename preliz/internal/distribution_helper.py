@@ -3,6 +3,8 @@ from sys import modules
 
 import numpy as np
 
+from preliz.internal.quadrature import quad_moments
+
 eps = np.finfo(float).eps
 
 
@@ -44,7 +46,7 @@ def valid_scalar_params(self, check_frozen=True):
 
     if all(
         isinstance(param, int | float | np.int64) for param in self.params
-    ) or self.__class__.__name__ in ["Categorical", "Mixture"]:
+    ) or self.__class__.__name__ in ["Approximated", "Categorical", "Mixture"]:
         return True
 
     raise ValueError("parameters must be integers or floats")
@@ -76,25 +78,97 @@ def process_extra(input_string):
 
 
 def num_skewness(dist):
+    if dist.kind != "discrete":
+        return quad_moments(dist, "mvske")[2]
     mean = dist.mean()
     std = dist.std()
     x_values = dist.xvals("full")
     pdf = dist.pdf(x_values)
-    if dist.kind == "discrete":
-        return np.sum(((x_values - mean) / std) ** 3 * pdf)
-    else:
-        return np.trapz(((x_values - mean) / std) ** 3 * pdf, x_values)
+    return np.sum(((x_values - mean) / std) ** 3 * pdf, axis=0)
 
 
 def num_kurtosis(dist):
+    if dist.kind != "discrete":
+        return quad_moments(dist, "mvske")[3]
     mean = dist.mean()
     std = dist.std()
     x_values = dist.xvals("full")
     pdf = dist.pdf(x_values)
-    if dist.kind == "discrete":
-        return np.sum(((x_values - mean) / std) ** 4 * pdf) - 3
+    return np.sum(((x_values - mean) / std) ** 4 * pdf, axis=0) - 3
+
+
+# Largest number of entries, values in the support times batch elements, of a cumulative pmf table
+MAX_TABLE_SIZE = 2**20
+# Largest mass left out on each side of a table that only covers part of the support
+TABLE_TAIL_MASS = 1e-14
+
+
+def cdf_table(dist, window=None):
+    """
+    Cumulative pmf over the support of a bounded discrete distribution.
+
+    When the support is too large, the table only covers ``window``, the lower and upper values
+    beyond which each tail holds at most ``TABLE_TAIL_MASS``. The cdf is 0 below the table and 1
+    above it.
+
+    Returns the first value of the table and the table, of shape ``(n_values, *batch_shape)``,
+    or None if the table has more than ``MAX_TABLE_SIZE`` entries.
+    """
+    lower = np.min(dist.support[0])
+    upper = np.max(dist.support[1])
+    n_batch = np.prod(dist.batch_shape, dtype=float)
+    if (upper - lower + 1) * n_batch > MAX_TABLE_SIZE and window is not None:
+        lower = max(lower, int(np.min(window[0])))
+        upper = min(upper, int(np.max(window[1])))
+    if (upper - lower + 1) * n_batch > MAX_TABLE_SIZE:
+        return None
+    x_vals = np.arange(lower, upper + 1).reshape(-1, *(1,) * len(dist.batch_shape))
+    table = np.cumsum(np.exp(dist.logpdf(x_vals)), axis=0)
+    return lower, table / table[-1]
+
+
+def binomial_tail_bounds(n_trials, prob, tail_mass):
+    """
+    Values beyond which each tail of a Binomial(n_trials, prob) holds at most ``tail_mass``.
+
+    Solves Bernstein's inequality, P(X - n p >= t) <= exp(-t**2 / (2 n p (1 - p) + 2 t / 3)),
+    which bounds the lower tail in the same way.
+    """
+    log_mass = -np.log(tail_mass)
+    var = n_trials * prob * (1 - prob)
+    width = log_mass / 3 + np.sqrt((log_mass / 3) ** 2 + 2 * log_mass * var)
+    return np.floor(n_trials * prob - width), np.ceil(n_trials * prob + width)
+
+
+def cdf_from_table(lower, table, x):
+    """Gather the cdf at ``x`` from a table computed with ``cdf_table``."""
+    x = np.asarray(x, dtype=float)
+    batch_shape = table.shape[1:]
+    shape = np.broadcast_shapes(x.shape, batch_shape)
+    idx = np.broadcast_to(np.nan_to_num(np.floor(x) - lower, nan=-1), shape)
+    idx = np.clip(idx, -1, len(table) - 1).astype(int)
+    flat_table = table.reshape(len(table), -1)
+    batch_idx = np.broadcast_to(np.arange(flat_table.shape[1]).reshape(batch_shape), shape)
+    cdf = np.where(idx < 0, 0, flat_table[np.maximum(idx, 0), batch_idx])
+    return np.where(np.isnan(x), np.nan, cdf)
+
+
+def ppf_from_table(lower, table, q):
+    """Smallest value with cdf >= q, from a table computed with ``cdf_table``."""
+    q = np.asarray(q, dtype=float)
+    if table.ndim == 1:
+        idx = np.searchsorted(table, q, side="left")
     else:
-        return np.trapz(((x_values - mean) / std) ** 4 * pdf, x_values) - 3
+        # search each batch element on its own column, without comparing q against the whole table
+        batch_shape = table.shape[1:]
+        shape = np.broadcast_shapes(q.shape, batch_shape)
+        flat_table = table.reshape(len(table), -1)
+        flat_q = np.broadcast_to(q, shape).reshape(-1, flat_table.shape[1])
+        idx = np.empty(flat_q.shape, dtype=int)
+        for col in range(flat_table.shape[1]):
+            idx[:, col] = np.searchsorted(flat_table[:, col], flat_q[:, col], side="left")
+        idx = idx.reshape(shape)
+    return np.where(np.isnan(q), np.nan, lower + np.minimum(idx, len(table) - 1))
 
 
 init_vals = {
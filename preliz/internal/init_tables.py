@@ -0,0 +1,85 @@
+"""
+Initial guesses for the maxent and quartile optimizations, interpolated from precomputed tables.
+
+The tables hold the logarithm of the maximum entropy parameters of some families with positive or
+unit interval support on a grid of normalized constraints. They are stored in ``init_tables.npz``,
+next to this module, and are rebuilt with ``python -m preliz.internal.build_init_tables``.
+"""
+
+import os
+from functools import lru_cache
+
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+from scipy.special import logit
+
+TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "init_tables.npz")
+
+# Families with positive support that are closed under rescaling. The tables are built with
+# lower = 1 and the parameters, in the order of the _update method, are rescaled to other values
+# of lower according to their kind: "shape" ones do not change, "scale" ones are multiplied by
+# lower and "rate" ones divided by it
+SCALE_FAMILIES = {
+    "Gamma": ("shape", "rate"),
+    "InverseGamma": ("shape", "scale"),
+    "LogLogistic": ("scale", "shape"),
+    "Weibull": ("shape", "scale"),
+}
+_POWERS = {"shape": 0, "scale": 1, "rate": -1}
+# Families with support on the unit interval, their tables depend on both end-points
+UNIT_FAMILIES = ("Beta", "Kumaraswamy")
+
+# Grids of the tables. Scale families: log(log(upper / lower)) and logit(mass)
+SCALE_GRID = (
+    np.linspace(np.log(0.01), np.log(10), 25),
+    np.linspace(logit(0.1), logit(0.995), 12),
+)
+# Unit families: lower, (upper - lower) / (1 - lower) and logit(mass)
+UNIT_GRID = (
+    np.linspace(0, 0.95, 20),
+    np.linspace(0.05, 0.95, 19),
+    np.linspace(logit(0.1), logit(0.99), 8),
+)
+
+
+def table_guess(dist, lower, upper, mass):
+    """
+    Interpolate the maximum entropy parameters of ``dist`` for ``mass`` between the end-points.
+
+    Returns the parameters in the order of the ``_update`` method of ``dist``, or None when there
+    is no table for its family or the constraint is not one the table can be rescaled to.
+    Constraints outside the grid of the table are moved to its closest edge.
+    """
+    name = dist.__class__.__name__
+    interpolator = _load_tables().get(name)
+    if interpolator is None or not 0 < mass < 1:
+        return None
+
+    if name in SCALE_FAMILIES:
+        if not 0 < lower < upper < np.inf:
+            return None
+        point = (np.log(np.log(upper / lower)), logit(mass))
+    elif 0 <= lower < upper <= 1:
+        point = (lower, (upper - lower) / (1 - lower), logit(mass))
+    else:
+        return None
+
+    grid = SCALE_GRID if name in SCALE_FAMILIES else UNIT_GRID
+    point = [np.clip(value, axis[0], axis[-1]) for value, axis in zip(point, grid)]
+    values = interpolator(point)[0]
+    if name in SCALE_FAMILIES:
+        values += np.array([_POWERS[kind] for kind in SCALE_FAMILIES[name]]) * np.log(lower)
+    return np.exp(values)
+
+
+@lru_cache
+def _load_tables():
+    """Interpolators of the stored tables, by family name."""
+    if not os.path.exists(TABLES_PATH):
+        return {}
+    interpolators = {}
+    with np.load(TABLES_PATH) as tables:
+        for name in tables.files:
+            grid = SCALE_GRID if name in SCALE_FAMILIES else UNIT_GRID
+            interpolators[name] = RegularGridInterpolator(grid, tables[name].astype(float))
+    return interpolators
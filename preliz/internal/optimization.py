@@ -2,49 +2,238 @@
 
 import warnings
 from copy import copy
+from functools import lru_cache, partial
+from inspect import signature
 
+import numba as nb
 import numpy as np
-from scipy.optimize import brentq, least_squares, minimize, minimize_scalar, root_scalar
-from scipy.special import i0, i0e, i1, i1e, logit
+from scipy.optimize import (
+    OptimizeResult,
+    brentq,
+    least_squares,
+    minimize,
+    minimize_scalar,
+    root_scalar,
+)
+from scipy.special import logit, ndtri
 
 from preliz.internal.distribution_helper import init_vals as default_vals
+from preliz.internal.init_tables import table_guess
+from preliz.internal.special import i0e, i1e
+
+# Mass outside the interval below which optimize_max_ent matches its logarithm
+_SMALL_TAIL_MASS = 1e-3
+# Log of the smallest normal float, the log of the mass outside the interval is clipped there
+_LOG_TINY = np.log(np.finfo(float).tiny)
 
 
 def optimize_max_ent(dist, lower, upper, mass, none_idx, fixed_params, fixed_stat):
+    native = dist.param_names == _update_names(dist.__class__)
+    solver = MAXENT_SOLVERS.get(dist.__class__.__name__)
+    if solver is not None and native and not fixed_stat:
+        # the initial guess can overwrite the fixed parameters
+        set_params(dist, np.array(dist.params)[none_idx], none_idx, fixed_params)
+        solution = solver(dist, lower, upper, mass, none_idx)
+        if solution is not None:
+            x_vals, nfev = solution
+            params = get_params(dist, x_vals, none_idx, fixed_params)
+            dist._parametrization(**params)
+            return OptimizeResult(
+                x=x_vals,
+                fun=-dist.entropy(),
+                success=True,
+                status=0,
+                message="Solved without numerical optimization",
+                nfev=nfev,
+                nit=0,
+            )
+
+    # the optimization runs on the free parameters divided by scale
+    scale = np.ones(len(none_idx))
+    if native and not fixed_stat and len(none_idx) == len(dist.params):
+        if _start_from_table(
+            dist,
+            table_guess(dist, lower, upper, mass),
+            lambda: abs(dist.cdf(upper) - dist.cdf(lower) - mass),
+        ):
+            # close to the solution the first steps of SLSQP, taken with an identity Hessian,
+            # barely change the entropy along parameters with large values and it stops early
+            scale = np.array(dist.params)
+
+    bounds = np.array(dist.params_support)[none_idx]
+
+    def update(params, dist):
+        # SLSQP can step slightly outside the bounds, like to a scale of exactly zero
+        params = np.clip(params * scale, bounds[:, 0], bounds[:, 1])
+        set_params(dist, params, none_idx, fixed_params)
+
     def prob_bound(params, dist, lower, upper, mass):
-        params = get_params(dist, params, none_idx, fixed_params)
-        dist._parametrization(**params)
+        update(params, dist)
         if dist.kind == "discrete":
             lower -= 1
-        cdf0 = dist.cdf(lower)
-        cdf1 = dist.cdf(upper)
-        loss = (cdf1 - cdf0) - mass
+        if 0 < 1 - mass < _SMALL_TAIL_MASS:
+            # match the log of the mass outside the interval, otherwise any value below the
+            # tolerance of the optimizer satisfies the constraint
+            with np.errstate(divide="ignore"):
+                log_out = np.logaddexp(dist.logcdf(lower), dist.logsf(upper))
+            loss = max(log_out, _LOG_TINY) - np.log1p(-mass)
+        else:
+            cdf0 = dist.cdf(lower)
+            cdf1 = dist.cdf(upper)
+            loss = (cdf1 - cdf0) - mass
         if fixed_stat:
             loss = loss - abs(getattr(dist, fixed_stat[0])() - fixed_stat[1])
         return loss
 
+    def prob_bound_grad(params, dist, lower, upper, mass):
+        update(params, dist)
+        if dist.kind == "discrete":
+            lower -= 1
+        grad_lower, grad_upper = np.moveaxis(dist._cdf_grad(np.array([lower, upper])), -1, 0)
+        if 0 < 1 - mass < _SMALL_TAIL_MASS:
+            with np.errstate(divide="ignore"):
+                log_out = np.logaddexp(dist.logcdf(lower), dist.logsf(upper))
+            if log_out < _LOG_TINY:
+                return np.zeros(len(none_idx))
+            return (grad_lower - grad_upper)[none_idx] * np.exp(-log_out) * scale
+        return (grad_upper - grad_lower)[none_idx] * scale
+
     def entropy_loss(params, dist):
-        params = get_params(dist, params, none_idx, fixed_params)
-        dist._parametrization(**params)
+        update(params, dist)
         return -dist.entropy()
 
+    def entropy_loss_grad(params, dist):
+        update(params, dist)
+        return -dist._entropy_grad()[none_idx] * scale
+
+    # the gradients are with respect to the arguments of _update and ignore the fixed statistic.
+    # With a single free parameter the constraint alone fixes the solution, and the exact
+    # gradients can make SLSQP collapse to the lower bound, like the rate of an Exponential
+    analytic = not fixed_stat and native and len(none_idx) > 1
+
     cons = {
         "type": "eq",
         "fun": prob_bound,
         "args": (dist, lower, upper, mass),
     }
+    if analytic and hasattr(dist, "_cdf_grad"):
+        cons["jac"] = prob_bound_grad
+    jac = None
+    options = {}
+    if analytic and hasattr(dist, "_entropy_grad"):
+        jac = entropy_loss_grad
+        # without finite differences an iteration costs a single evaluation of the gradients
+        options["maxiter"] = 200
     init_vals = np.array(dist.params)[none_idx]
-    bounds = np.array(dist.params_support)[none_idx]
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message="Values in x were outside bounds")
-        opt = minimize(entropy_loss, x0=init_vals, bounds=bounds, args=(dist), constraints=cons)
+        opt = minimize(
+            entropy_loss,
+            x0=init_vals / scale,
+            bounds=bounds / scale[:, None],
+            args=(dist),
+            constraints=cons,
+            jac=jac,
+            options=options,
+        )
+    opt.x = opt.x * scale
+    opt.jac = opt.jac / scale
 
-    params = get_params(dist, opt["x"], none_idx, fixed_params)
+    params = get_params(dist, np.clip(opt["x"], bounds[:, 0], bounds[:, 1]), none_idx, fixed_params)
     dist._parametrization(**params)
 
     return opt
 
 
+def _maxent_location_scale(dist, lower, upper, mass, none_idx, loc_idx, scale_idx):
+    """
+    Maxent solution of a symmetric location-scale family, with its other parameters fixed.
+
+    The entropy only grows with the scale and, for a given scale, the mass inside the interval is
+    largest with the location at its midpoint. So the solution is centered in the interval, with
+    the scale given by the standard quantile of ``(1 + mass) / 2``. With the location fixed inside
+    the interval the mass decreases with the scale, which is found by root finding.
+    """
+    if scale_idx not in none_idx or not set(none_idx) <= {loc_idx, scale_idx}:
+        return None
+    if not 0 < mass < 1:
+        return None
+
+    params = list(dist.params)
+    loc = params[loc_idx]
+    params[loc_idx], params[scale_idx] = 0, 1
+    dist._update(*params)
+    quantile = dist.ppf((1 + mass) / 2)
+    nfev = 0
+
+    if loc_idx in none_idx:
+        params[loc_idx] = (lower + upper) / 2
+        params[scale_idx] = (upper - lower) / 2 / quantile
+    elif lower < loc < upper:
+
+        def mass_error(scale):
+            params[scale_idx] = scale
+            dist._update(*params)
+            return dist.cdf(upper) - dist.cdf(lower) - mass
+
+        # the interval centered at loc that fits inside (lower, upper) has less mass than
+        # ``mass`` with the smallest scale, the one centered at the midpoint with the largest
+        params[loc_idx] = loc
+        small = min(upper - loc, loc - lower) / quantile
+        large = (upper - lower) / 2 / quantile
+        if mass_error(small) <= 0:
+            params[scale_idx] = small
+        elif mass_error(large) >= 0:
+            params[scale_idx] = large
+        else:
+            params[scale_idx], info = brentq(mass_error, small, large, full_output=True)
+            nfev = info.function_calls
+        nfev += 2
+    else:
+        return None
+
+    return np.array(params, dtype=float)[none_idx], nfev
+
+
+def _maxent_uniform(dist, lower, upper, mass, none_idx):
+    """Maxent Uniform with both bounds free, extending the interval equally on both sides."""
+    if len(none_idx) != 2:
+        return None
+    margin = (upper - lower) * (1 / mass - 1) / 2
+    return np.array([lower - margin, upper + margin]), 0
+
+
+# Solvers used by optimize_max_ent instead of the numerical optimization, by distribution name.
+# They receive the distribution in the parametrization of its _update method and return the free
+# parameters and the number of evaluations of the cdf, or None when they do not apply
+MAXENT_SOLVERS = {
+    "Cauchy": partial(_maxent_location_scale, loc_idx=0, scale_idx=1),
+    "Laplace": partial(_maxent_location_scale, loc_idx=0, scale_idx=1),
+    "Logistic": partial(_maxent_location_scale, loc_idx=0, scale_idx=1),
+    "Normal": partial(_maxent_location_scale, loc_idx=0, scale_idx=1),
+    "StudentT": partial(_maxent_location_scale, loc_idx=1, scale_idx=2),
+    "Uniform": _maxent_uniform,
+}
+
+
+def _start_from_table(dist, guess, error):
+    """
+    Move ``dist`` to the tabulated ``guess`` when it has a smaller ``error`` than the current one.
+
+    The current parameters can be a better start than the table, for example when warm starting
+    from the solution of a similar problem. Returns whether the guess was taken.
+    """
+    if guess is None:
+        return False
+    params = dist.params
+    current = error()
+    dist._update(*guess)
+    if error() < current or np.isnan(current):
+        return True
+    dist._update(*params)
+    return False
+
+
 def get_params(dist, params, none_idx, fixed):
     params_ = {}
     pdx = 0
@@ -61,13 +250,51 @@ def get_params(dist, params, none_idx, fixed):
     return params_
 
 
+def set_params(dist, params, none_idx, fixed):
+    """
+    Set the free parameters of a distribution inside an optimization loop.
+
+    When the distribution uses the parametrization expected by its ``_update`` method, the values
+    are passed to it directly, avoiding the keyword bookkeeping of ``_parametrization``.
+    """
+    if dist.param_names == _update_names(dist.__class__):
+        values = []
+        pdx = 0
+        fdx = 0
+        for idx in range(len(dist.param_names)):
+            if idx in none_idx:
+                values.append(params[pdx])
+                pdx += 1
+            else:
+                values.append(fixed[fdx])
+                fdx += 1
+        dist._update(*values)
+    else:
+        dist._parametrization(**get_params(dist, params, none_idx, fixed))
+
+
+@lru_cache
+def _update_names(cls):
+    """Names of the arguments of the ``_update`` method of a distribution class."""
+    if hasattr(cls, "_update"):
+        return tuple(signature(cls._update).parameters)[1:]
+    return None
+
+
 def optimize_quartile(dist, x_vals, none_idx, fixed):
     def func(params, dist, x_vals):
-        params = get_params(dist, params, none_idx, fixed)
-        dist._parametrization(**params)
+        set_params(dist, params, none_idx, fixed)
         loss = dist.cdf(x_vals) - [0.25, 0.5, 0.75]
         return loss
 
+    if dist.param_names == _update_names(dist.__class__) and len(none_idx) == len(dist.params):
+        # the maxent solution for half of the mass between q1 and q3 is usually close
+        _start_from_table(
+            dist,
+            table_guess(dist, x_vals[0], x_vals[2], 0.5),
+            lambda: np.sum((dist.cdf(x_vals) - [0.25, 0.5, 0.75]) ** 2),
+        )
+
     init_vals = np.array(dist.params)[none_idx]
     bounds = np.array(dist.params_support)[none_idx]
     bounds = list(zip(*bounds))
@@ -80,8 +307,7 @@ def optimize_quartile(dist, x_vals, none_idx, fixed):
 
 def optimize_pdf(dist, x_vals, epdf, none_idx, fixed):
     def func(params, dist, x_vals, epdf):
-        params = get_params(dist, params, none_idx, fixed)
-        dist._parametrization(**params)
+        set_params(dist, params, none_idx, fixed)
         loss = dist.pdf(x_vals) - epdf
         return loss
 
@@ -98,8 +324,7 @@ def optimize_pdf(dist, x_vals, epdf, none_idx, fixed):
 
 def optimize_moments(dist, mean, sigma, params=None):
     def func(params, dist, mean, sigma):
-        params = get_params(dist, params, none_idx, fixed)
-        dist._parametrization(**params)
+        set_params(dist, params, none_idx, fixed)
         loss = abs(dist.mean() - mean) + abs(dist.std() - sigma)
         return loss
 
@@ -148,31 +373,48 @@ def optimize_moments_rice(mean, std_dev):
         nu = np.finfo(float).eps
         sigma = 0.655 * std_dev
     else:
-
-        def xi(theta):
-            return (
-                2
-                + theta**2
-                - np.pi
-                / 8
-                * np.exp(-(theta**2) / 2)
-                * ((2 + theta**2) * i0(theta**2 / 4) + theta**2 * i1(theta**2 / 4)) ** 2
-            )
-
-        def fpf(theta):
-            return (xi(theta) * (1 + ratio**2) - 2) ** 0.5
-
-        def func(theta):
-            return np.abs(fpf(theta) - theta)
-
-        theta = minimize(func, x0=fpf(1), bounds=[(0, None)]).x
-        xi_theta = xi(theta)
+        xi_theta = _koay_xi(_koay_theta(ratio))[0]
         sigma = std_dev / xi_theta**0.5
         nu = (mean**2 + (xi_theta - 2) * sigma**2) ** 0.5
 
     return nu, sigma
 
 
+@nb.njit(cache=True)
+def _koay_xi(theta):
+    """Correction factor of Koay and Basser and its derivative with respect to theta."""
+    theta_sq = theta * theta
+    u_val = theta_sq / 4
+    # exp(-theta**2 / 4) I_k(theta**2 / 4), so large values of theta do not overflow
+    i0_val = i0e(u_val)
+    i1_val = i1e(u_val)
+    h_val = (2 + theta_sq) * i0_val + theta_sq * i1_val
+    di0 = i1_val - i0_val
+    di1 = i0_val - i1_val - (i1_val / u_val if u_val > 0 else 0.5)
+    dh = 2 * theta * (i0_val + i1_val) + theta / 2 * ((2 + theta_sq) * di0 + theta_sq * di1)
+    xi_val = 2 + theta_sq - np.pi / 8 * h_val**2
+    dxi = 2 * theta - np.pi / 4 * h_val * dh
+    return xi_val, dxi
+
+
+@nb.vectorize(nopython=True, cache=True)
+def _koay_theta(ratio):
+    """Solve the fixed point theta = g(theta) of the Koay inversion with Newton's method."""
+    r_sq = 1 + ratio**2
+    theta = max(ratio - np.sqrt(np.pi / (4 - np.pi)), 1e-3)
+    for _ in range(100):
+        xi_val, dxi = _koay_xi(theta)
+        g_val = np.sqrt(max(xi_val * r_sq - 2, 0.0))
+        if g_val == 0:
+            return 0.0
+        dg_val = dxi * r_sq / (2 * g_val)
+        theta_new = max(theta - (g_val - theta) / (dg_val - 1), 0.5 * theta)
+        if abs(theta_new - theta) < 1e-14 * theta_new:
+            return theta_new
+        theta = theta_new
+    return theta
+
+
 def optimize_ml(dist, sample):
     def negll(params, dist, sample):
         dist._update(*params)
@@ -228,6 +470,11 @@ def optimize_beta_mode(lower, upper, tau_not, mode, dist, mass, prob):
 
 
 def optimize_hdi(dist, mass):
+    if dist.kind == "discrete":
+        return _hdi_discrete(dist, mass)
+    if dist.__class__.__name__ not in ["Censored", "Hurdle", "Mixture"]:
+        return _hdi_unimodal(dist, mass)
+
     def interval_loss(params):
         cdf = dist.cdf(params)
         loss = (cdf[1] - cdf[0] + mass_at_boundaries) - mass
@@ -249,13 +496,60 @@ def optimize_hdi(dist, mass):
     opt = minimize(interval_short, x0=init_vals, bounds=bounds, constraints=cons)
 
     lower, upper = opt.x
-    if dist.kind == "discrete":
-        upper = np.floor(upper - 1).astype(int)
-        lower = np.ceil(lower).astype(int)
+    return lower, upper
+
 
+def _hdi_unimodal(dist, mass):
+    """
+    HDI of a unimodal continuous distribution.
+
+    The HDI is the interval ``[ppf(p), ppf(p + mass)]`` with the same density at both ends.
+    For a unimodal density the difference between those densities increases with the lower
+    tail mass ``p``, so we look for its root in ``[0, 1 - mass]``. If there is no sign change
+    the density is monotonic and the HDI starts or ends at the boundary of the support.
+    """
+
+    def density_diff(tail):
+        x_vals = dist.ppf([tail, tail + mass])
+        pdf = np.where(np.isfinite(x_vals), dist.pdf(x_vals), 0)
+        return pdf[0] - pdf[1]
+
+    max_tail = 1 - mass
+    if density_diff(0) >= 0:
+        tail = 0
+    elif density_diff(max_tail) <= 0:
+        tail = max_tail
+    else:
+        tail = brentq(density_diff, 0, max_tail)
+
+    lower, upper = dist.ppf([tail, tail + mass])
     return lower, upper
 
 
+def _hdi_discrete(dist, mass):
+    """
+    Exact HDI of a discrete distribution.
+
+    From the cumulative pmf over the support, we find for every lower bound the smallest upper
+    bound containing at least ``mass``. The HDI is the shortest of those intervals, ties are
+    broken in favor of the one with more mass.
+    """
+    lower_ep, upper_ep = dist._finite_endpoints("full")
+    x_vals = np.arange(lower_ep, upper_ep + 1)
+    cum_pmf = np.concatenate(([0], np.cumsum(dist.pdf(x_vals))))
+
+    # index of the first cumulative value reaching the mass required for each lower bound
+    end_idx = np.searchsorted(cum_pmf, cum_pmf[:-1] + mass * (1 - 1e-12), side="left")
+    valid = end_idx < len(cum_pmf)
+    start_idx = np.arange(len(x_vals))[valid]
+    end_idx = end_idx[valid] - 1
+
+    widths = x_vals[end_idx] - x_vals[start_idx]
+    masses = cum_pmf[end_idx + 1] - cum_pmf[start_idx]
+    best = np.lexsort((-masses, widths))[0]
+    return int(x_vals[start_idx[best]]), int(x_vals[end_idx[best]])
+
+
 def optimize_pymc_model(
     fmodel,
     target,
@@ -455,6 +749,17 @@ def find_kappa(data, mu):
 
 
 def find_mode_logitnormal(distribution):
+    if distribution.batch_shape:
+        # the roots are bracketed separately for every element of the batch
+        params = np.broadcast_arrays(*distribution.params)
+        modes = np.empty(distribution.batch_shape)
+        for idx in np.ndindex(modes.shape):
+            element = distribution.__class__(
+                **{name: param[idx] for name, param in zip(distribution.param_names, params)}
+            )
+            modes[idx] = find_mode_logitnormal(element)
+        return modes
+
     eps = np.finfo(float).eps
 
     def mode_equation(x):
@@ -499,18 +804,43 @@ def find_mode(distribution):
 
     Returns
     -------
-    float
-        Mode of the distribution
+    float or ndarray
+        Mode of the distribution, with the shape of its batch
     """
+    bounds = distribution._finite_endpoints("full")
+    if distribution.batch_shape:
+        return _golden_section_mode(distribution, *bounds)
 
     def negative_pdf(x):
         return -distribution.pdf(x)
 
-    bounds = distribution._finite_endpoints("full")
     result = minimize_scalar(negative_pdf, bounds=bounds, method="bounded")
     return result.x
 
 
+def _golden_section_mode(distribution, lower, upper, xatol=1e-5, max_iter=100):
+    """Maximize the pdf of every batch element at once with a golden-section search."""
+    ratio = (5**0.5 - 1) / 2
+    lower = np.broadcast_to(np.asarray(lower, dtype=float), distribution.batch_shape)
+    upper = np.broadcast_to(np.asarray(upper, dtype=float), distribution.batch_shape)
+    x_1 = upper - ratio * (upper - lower)
+    x_2 = lower + ratio * (upper - lower)
+    pdf_1 = distribution.pdf(x_1)
+    pdf_2 = distribution.pdf(x_2)
+    for _ in range(max_iter):
+        if np.all(upper - lower <= xatol):
+            break
+        # keep the side of the bracket with the larger density, one new point per iteration
+        left = pdf_1 >= pdf_2
+        upper = np.where(left, x_2, upper)
+        lower = np.where(left, lower, x_1)
+        x_new = np.where(left, upper - ratio * (upper - lower), lower + ratio * (upper - lower))
+        pdf_new = distribution.pdf(x_new)
+        x_1, x_2 = np.where(left, x_new, x_2), np.where(left, x_1, x_new)
+        pdf_1, pdf_2 = np.where(left, pdf_new, pdf_2), np.where(left, pdf_1, pdf_new)
+    return (lower + upper) / 2
+
+
 def find_discrete_mode(dist):
     """
     Find mode for a discrete distribution from its pmf.
@@ -522,53 +852,123 @@ def find_discrete_mode(dist):
 
     Returns
     -------
-    int
-        Mode of the distribution
+    int or ndarray
+        Mode of the distribution, with the shape of its batch
     """
     x_vals = dist.xvals("full")
     pmf_vals = dist.pdf(x_vals)
+    if dist.batch_shape:
+        # the values are shared by all batch elements, along the first axis
+        return x_vals.ravel()[np.argmax(pmf_vals, axis=0)].astype(int)
     return int(x_vals[np.argmax(pmf_vals)])
 
 
-def find_ppf(dist, q):
-    q = np.atleast_1d(q)
-    ppf = np.zeros_like(q)
-    lower, upper = dist.support
-    for idx, q_i in enumerate(q):
-        if q_i < 0:
-            ppf[idx] = np.nan
-        elif q_i > 1:
-            ppf[idx] = np.nan
-        elif q_i == 0:
-            if dist.kind == "discrete":
-                ppf[idx] = lower - 1
-            else:
-                ppf[idx] = lower
-        elif q_i == 1:
-            ppf[idx] = upper
-        elif dist.__class__.__name__ in ["HyperGeometric", "BetaBinomial"]:
-            ppf[idx] = _ppf_single(dist, q_i) + 1
-        else:
-            ppf[idx] = _ppf_single(dist, q_i)
-    return ppf[0] if len(ppf) == 1 else ppf
-
+def find_ppf(dist, q, tol=1e-12, max_iter=200):
+    """
+    Invert the cdf of a distribution numerically.
 
-def _ppf_single(dist, q):
-    def func(x, dist, q):
-        return dist.cdf(x) - q
+    All quantiles (and batch elements) are solved at once. Continuous distributions use
+    Newton's method with the pdf as derivative, safeguarded by bisection inside a bracket that
+    always contains the root. Discrete distributions use a bisection over the integers.
 
-    factor = 10.0
-    left, right = dist.support
+    Parameters
+    ----------
+    dist : Distribution
+        PreliZ distribution object with cdf (and pdf for continuous distributions) methods.
+    q : float or array_like
+        Quantiles.
+    tol : float
+        Relative tolerance for the solution (continuous distributions).
+    max_iter : int
+        Maximum number of iterations.
 
-    left = min(-factor, right)
-    while func(left, dist, q) > 0.0:
-        left, right = left * factor, left
+    Returns
+    -------
+    ppf : float or ndarray
+        Values of the ppf.
+    """
+    q = np.asarray(q, dtype=float)
+    shape = np.broadcast_shapes(q.shape, dist.batch_shape)
+    q = np.broadcast_to(q, shape)
+    lower = np.broadcast_to(np.asarray(dist.support[0], dtype=float), shape)
+    upper = np.broadcast_to(np.asarray(dist.support[1], dtype=float), shape)
+    is_discrete = dist.kind == "discrete"
+
+    inside = (q > 0) & (q < 1)
+    q_in = np.where(inside, q, 0.5)
+
+    # starting guess from the moments, assuming the distribution is not too far from normal
+    mean = np.asarray(dist.mean(), dtype=float)
+    std = np.asarray(dist.std(), dtype=float)
+    finite_moments = np.isfinite(mean) & np.isfinite(std) & (std > 0)
+    mean = np.where(finite_moments, mean, 0.0)
+    std = np.where(finite_moments, std, 1.0)
+    x_0 = np.clip(mean + std * ndtri(q_in), lower, upper)
+
+    if is_discrete:
+        lower_b = np.where(np.isfinite(lower), lower - 1, np.floor(x_0 - std))
+        upper_b = np.where(np.isfinite(upper), upper, np.ceil(x_0 + std))
+    else:
+        lower_b = np.where(np.isfinite(lower), lower, x_0 - std)
+        upper_b = np.where(np.isfinite(upper), upper, x_0 + std)
 
-    right = max(factor, left)
-    while func(right, dist, q) < 0.0:
-        left, right = right, right * factor
+    lower_b, upper_b = _expand_bracket(dist, q_in, lower_b, upper_b, std, is_discrete, max_iter)
 
-    return brentq(func, left, right, args=(dist, q))
+    if is_discrete:
+        ppf = _bisect_discrete(dist, q_in, lower_b, upper_b, max_iter)
+    else:
+        ppf = _newton_bisect(dist, q_in, x_0, lower_b, upper_b, tol, max_iter)
+
+    ppf = np.where(q == 0, lower - 1 if is_discrete else lower, ppf)
+    ppf = np.where(q == 1, upper, ppf)
+    ppf = np.where((q < 0) | (q > 1) | np.isnan(q), np.nan, ppf)
+    return ppf[()]
+
+
+def _expand_bracket(dist, q, lower_b, upper_b, width, is_discrete, max_iter):
+    """Move the endpoints of the bracket outward until they contain the quantiles."""
+    for _ in range(max_iter):
+        cdf_lower = dist.cdf(lower_b)
+        move_lower = (cdf_lower >= q) if is_discrete else (cdf_lower > q)
+        move_upper = dist.cdf(upper_b) < q
+        if not (np.any(move_lower) or np.any(move_upper)):
+            break
+        width = width * 2
+        lower_b = np.where(move_lower, lower_b - width, lower_b)
+        upper_b = np.where(move_upper, upper_b + width, upper_b)
+        if is_discrete:
+            lower_b, upper_b = np.floor(lower_b), np.ceil(upper_b)
+    return lower_b, upper_b
+
+
+def _newton_bisect(dist, q, x_0, lower_b, upper_b, tol, max_iter):
+    """Newton's method with a bisection fallback whenever the step leaves the bracket."""
+    x_val = np.where((x_0 > lower_b) & (x_0 < upper_b), x_0, 0.5 * (lower_b + upper_b))
+    for _ in range(max_iter):
+        func = dist.cdf(x_val) - q
+        lower_b = np.where(func < 0, x_val, lower_b)
+        upper_b = np.where(func > 0, x_val, upper_b)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_new = x_val - func / dist.pdf(x_val)
+        outside = ~np.isfinite(x_new) | (x_new <= lower_b) | (x_new >= upper_b)
+        x_new = np.where(func == 0, x_val, np.where(outside, 0.5 * (lower_b + upper_b), x_new))
+        converged = np.abs(x_new - x_val) <= tol * (1 + np.abs(x_val))
+        x_val = x_new
+        if np.all(converged | (upper_b - lower_b <= tol * (1 + np.abs(x_val)))):
+            break
+    return x_val
+
+
+def _bisect_discrete(dist, q, lower_b, upper_b, max_iter):
+    """Find the smallest integer with cdf >= q, given cdf(lower_b) < q <= cdf(upper_b)."""
+    for _ in range(max_iter):
+        if np.all(upper_b - lower_b <= 1):
+            break
+        mid = np.floor(0.5 * (lower_b + upper_b))
+        above = dist.cdf(mid) >= q
+        upper_b = np.where(above, mid, upper_b)
+        lower_b = np.where(above, lower_b, mid)
+    return upper_b
 
 
 def get_weighted_rvs(target, size, rng):
@@ -0,0 +1,340 @@
+"""Adaptive Gauss-Kronrod quadrature for numerical moments and entropy."""
+
+import numba as nb
+import numpy as np
+
+from preliz.internal.cache import cached
+
+# Nodes and weights of the 15-point Kronrod rule and of the 7-point Gauss rule embedded in it
+_XGK = np.array(
+    [
+        0.991455371120812639206854697526329,
+        0.949107912342758524526189684047851,
+        0.864864423359769072789712788640926,
+        0.741531185599394439863864773280788,
+        0.586087235467691130294144845693013,
+        0.405845151377397166906606412076961,
+        0.207784955007898467600689403773245,
+        0.000000000000000000000000000000000,
+    ]
+)
+_WGK = np.array(
+    [
+        0.022935322010529224963732008058970,
+        0.063092092629978553290700663189204,
+        0.104790010322250183839876322541518,
+        0.140653259715525918745189590510238,
+        0.169004726639267902826583426598550,
+        0.190350578064785409913256402421014,
+        0.204432940075298892414161999234649,
+        0.209482141084727828012999174891714,
+    ]
+)
+_WG = np.array(
+    [
+        0.129484966168869693270611432679082,
+        0.279705391489276667901467771423780,
+        0.381830050505118944950369775488975,
+        0.417959183673469387755102040816327,
+    ]
+)
+NODES = np.concatenate([-_XGK[:-1], _XGK[::-1]])
+KRONROD_WEIGHTS = np.concatenate([_WGK[:-1], _WGK[::-1]])
+GAUSS_WEIGHTS = np.zeros(15)
+GAUSS_WEIGHTS[1:14:2] = np.concatenate([_WG[:-1], _WG[::-1]])
+
+# Power of (x - center) / scale needed for each moment, the entropy only needs the mass
+_ORDERS = {"m": 1, "v": 2, "s": 3, "k": 4, "e": 0}
+
+
+def quad_moments(dist, types="mvsk", lower=None, upper=None, rtol=1e-10, max_intervals=1000):
+    """
+    Compute moments and entropy of a continuous distribution by adaptive quadrature.
+
+    All requested quantities are computed from a single set of pdf evaluations, the nodes are
+    refined until every one of them has converged. Results are cached per distribution and
+    ``types``, so calling with the same ``types`` for each moment reuses the evaluations.
+
+    Parameters
+    ----------
+    dist : PreliZ distribution
+        Frozen continuous distribution, the parameters can be batched.
+    types : str
+        Any subset of 'mvske' where 'm' = mean, 'v' = variance, 's' = skewness,
+        'k' = excess kurtosis and 'e' = entropy.
+    lower, upper : float or array
+        Integration bounds. Defaults to the support of the distribution.
+    rtol : float
+        Relative tolerance, with respect to the total mass, of each integral.
+    max_intervals : int
+        Maximum number of subintervals.
+
+    Returns
+    -------
+    list
+        The requested quantities, in the same order as ``types``. The moments are those of the
+        pdf normalized by its integral, the entropy uses the pdf as it is.
+    """
+    for m_t in types:
+        if m_t not in _ORDERS:
+            raise ValueError(
+                "The input string should only contain the letters 'm', 'v', 's', 'k', or 'e'."
+            )
+    return cached(
+        dist,
+        "quad_moments",
+        lambda *args: _quad_moments(dist, *args),
+        types,
+        lower,
+        upper,
+        rtol,
+        max_intervals,
+    )
+
+
+def _quad_moments(dist, types, lower, upper, rtol, max_intervals):
+    batch_shape = dist.batch_shape
+    if lower is None:
+        lower = dist.support[0]
+    if upper is None:
+        upper = dist.support[1]
+    lower = np.broadcast_to(np.asarray(lower, dtype=float), batch_shape).ravel()
+    upper = np.broadcast_to(np.asarray(upper, dtype=float), batch_shape).ravel()
+    center, scale = _center_scale(dist, batch_shape)
+    bounds = (
+        center,
+        scale,
+        lower,
+        upper,
+        _to_unit(lower, center, scale),
+        _to_unit(upper, center, scale),
+    )
+
+    order = max(_ORDERS[m_t] for m_t in types)
+    std_vals, weights, pdf = _adaptive_rule(
+        dist, batch_shape, bounds, order, "e" in types, rtol, max_intervals
+    )
+
+    # moments are computed in the standardized variable to avoid cancellation when the
+    # location is large compared to the scale
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w_pdf = np.where(pdf > 0, weights * pdf, 0)
+        std_vals = np.where(w_pdf > 0, std_vals, 0)
+        mass = np.sum(w_pdf, axis=0)
+        mean = np.sum(w_pdf * std_vals, axis=0) / mass
+        dev = std_vals - mean
+        var = np.sum(w_pdf * dev**2, axis=0) / mass
+        std = var**0.5
+        results = {
+            "m": center + scale * mean,
+            "v": scale**2 * var,
+            "s": np.sum(w_pdf * (dev / std) ** 3, axis=0) / mass,
+            "k": np.sum(w_pdf * (dev / std) ** 4, axis=0) / mass - 3,
+            "e": -np.sum(np.where(pdf > 0, w_pdf * np.log(pdf), 0), axis=0),
+        }
+    return [results[m_t].reshape(batch_shape)[()] for m_t in types]
+
+
+def _center_scale(dist, batch_shape):
+    """Median and half the interquartile range, used to map the real line into (-1, 1)."""
+    center = np.broadcast_to(dist.ppf(0.5), batch_shape).astype(float).ravel()
+    scale = (
+        np.broadcast_to(dist.ppf(0.75), batch_shape) - np.broadcast_to(dist.ppf(0.25), batch_shape)
+    ).ravel() / 2
+    bad = ~(scale > 0) | ~np.isfinite(scale)
+    if np.any(bad):
+        wide = (
+            np.broadcast_to(dist.ppf(0.9999), batch_shape)
+            - np.broadcast_to(dist.ppf(0.0001), batch_shape)
+        ).ravel() / 2
+        scale = np.where(bad, wide, scale)
+        scale = np.where(~(scale > 0) | ~np.isfinite(scale), 1.0, scale)
+    center = np.where(np.isfinite(center), center, 0.0)
+    return center, scale
+
+
+def _to_unit(x_val, center, scale):
+    """Inverse of x = center + scale * t / (1 - t**2)."""
+    u_val = (x_val - center) / scale
+    with np.errstate(invalid="ignore"):
+        t_val = 2 * u_val / (1 + np.sqrt(1 + 4 * u_val**2))
+    return np.where(np.isinf(u_val), np.sign(u_val), t_val)
+
+
+def _adaptive_rule(dist, batch_shape, bounds, order, entropy, rtol, max_intervals):
+    """
+    Composite G7K15 rule on [0, 1], shared by all the distributions in the batch.
+
+    ``bounds`` holds the center, scale, lower and upper bounds of the integral and the bounds
+    mapped to (-1, 1), see `_map_nodes`.
+
+    Returns the standardized nodes, the weights including the jacobian of the mapping, and the
+    pdf at the nodes, each with shape ``(n_nodes, n_batch)``.
+    """
+    edges = np.linspace(0, 1, 11)
+    left, right = edges[:-1], edges[1:]
+    std_vals, weights, pdf, result, error, splittable = _evaluate(
+        dist, batch_shape, left, right, bounds, order, entropy
+    )
+    for _ in range(50):
+        total = result.sum(axis=0)
+        tolerance = rtol * np.maximum(np.abs(total), np.abs(total[0]))
+        # the error of the subintervals that can not be refined is accepted as it is
+        pending = error[splittable].sum(axis=0) > tolerance
+        n_intervals = len(left)
+        if not np.any(pending) or n_intervals >= max_intervals:
+            break
+        # bisect the intervals whose error is larger than their share of the tolerance
+        excess = np.where(pending, error / (tolerance / n_intervals), 0).max(axis=(1, 2))
+        split = np.flatnonzero((excess > 1) & splittable)
+        if not split.size:
+            break
+        split = split[np.argsort(excess[split])[::-1][: max_intervals - n_intervals]]
+        keep = np.ones(n_intervals, dtype=bool)
+        keep[split] = False
+        middle = (left[split] + right[split]) / 2
+        new_left = np.concatenate([left[split], middle])
+        new_right = np.concatenate([middle, right[split]])
+        new_vals = _evaluate(dist, batch_shape, new_left, new_right, bounds, order, entropy)
+        left = np.concatenate([left[keep], new_left])
+        right = np.concatenate([right[keep], new_right])
+        std_vals, weights, pdf, result, error, splittable = (
+            np.concatenate([old[keep], new])
+            for old, new in zip((std_vals, weights, pdf, result, error, splittable), new_vals)
+        )
+
+    n_batch = len(bounds[0])
+    return (
+        std_vals.reshape(-1, n_batch),
+        weights.reshape(-1, n_batch),
+        pdf.reshape(-1, n_batch),
+    )
+
+
+def _evaluate(dist, batch_shape, left, right, bounds, order, entropy):
+    x_vals, std_vals, weights, noise = _map_nodes(left, right, *bounds)
+    n_intervals, n_batch = len(left), len(bounds[0])
+    with np.errstate(all="ignore"):
+        pdf = np.asarray(dist.pdf(x_vals.reshape(-1, *batch_shape)), dtype=float)
+    pdf = np.broadcast_to(pdf.reshape(-1, n_batch), (n_intervals * 15, n_batch))
+    pdf = np.where(np.isfinite(pdf), pdf, 0).reshape(n_intervals, 15, n_batch)
+    result, error, at_floor = _gk15(pdf, weights, std_vals, noise, order, entropy)
+    # bisecting is pointless once the error is at the roundoff floor or the nodes are a few
+    # ulps apart
+    spread = np.abs(x_vals[:, -1] - x_vals[:, 0])
+    ulps = 64 * np.finfo(float).eps * np.maximum(np.abs(x_vals[:, -1]), np.abs(x_vals[:, 0]))
+    splittable = np.any(spread > ulps, axis=1) & ~at_floor
+    return std_vals, weights, pdf, result, error, splittable
+
+
+@nb.njit(cache=True)
+def _map_nodes(left, right, center, scale, lower, upper, t_lower, t_upper):
+    """
+    Nodes, standardized nodes and weights, including the jacobian, of each subinterval of [0, 1].
+
+    The subinterval variable v is mapped to r = v**3 (10 - 15 v + 6 v**2), which clusters the nodes
+    at both ends to weaken endpoint singularities of the pdf, then to t in [t_lower, t_upper]
+    and finally to the standardized variable u = t / (1 - t**2), with x = center + scale * u.
+    Close to a finite bound x is computed from its distance to the bound, so singularities at
+    the bounds can be resolved. Also returns the relative resolution of each node, the spacing
+    of floats around x compared to the scale or to the distance to the bound if smaller.
+    """
+    n_intervals, n_batch = len(left), len(center)
+    x_vals = np.empty((n_intervals, 15, n_batch))
+    std_vals = np.empty((n_intervals, 15, n_batch))
+    weights = np.empty((n_intervals, 15, n_batch))
+    noise = np.empty((n_intervals, 15, n_batch))
+    for i in range(n_intervals):
+        half = (right[i] - left[i]) / 2
+        mid = (right[i] + left[i]) / 2
+        for j in range(15):
+            v_val = mid + half * NODES[j]
+            dr_dv = 30 * (v_val * (1 - v_val)) ** 2
+            for k in range(n_batch):
+                width = t_upper[k] - t_lower[k]
+                if v_val < 0.5:
+                    bound = lower[k]
+                    t_bound = t_lower[k]
+                    dist_t = width * v_val**3 * (10 - 15 * v_val + 6 * v_val * v_val)
+                    t_val = t_bound + dist_t
+                else:
+                    w_val = 1 - v_val
+                    bound = upper[k]
+                    t_bound = t_upper[k]
+                    dist_t = -width * w_val**3 * (10 - 15 * w_val + 6 * w_val * w_val)
+                    t_val = t_bound + dist_t
+                den = 1 - t_val * t_val
+                if den <= 0:
+                    x_vals[i, j, k] = np.nan
+                    std_vals[i, j, k] = 0.0
+                    weights[i, j, k] = 0.0
+                    noise[i, j, k] = 0.0
+                    continue
+                u_val = t_val / den
+                if np.isfinite(bound):
+                    # u - u_bound, without cancellation
+                    dist_u = dist_t * (1 + t_val * t_bound) / (den * (1 - t_bound * t_bound))
+                    x_vals[i, j, k] = bound + scale[k] * dist_u
+                    local_scale = scale[k] * min(abs(dist_u), 1.0)
+                else:
+                    x_vals[i, j, k] = center[k] + scale[k] * u_val
+                    local_scale = scale[k]
+                noise[i, j, k] = 2.220446049250313e-16 * (1 + abs(x_vals[i, j, k]) / local_scale)
+                std_vals[i, j, k] = u_val
+                jac = (1 + t_val * t_val) / (den * den)
+                weights[i, j, k] = KRONROD_WEIGHTS[j] * half * dr_dv * width * scale[k] * jac
+    return x_vals, std_vals, weights, noise
+
+
+@nb.njit(cache=True)
+def _gk15(pdf, weights, std_vals, noise, order, entropy):
+    """
+    Kronrod estimate and QUADPACK error estimate of each integral on each subinterval.
+
+    Also returns whether the error of every integral on the subinterval is at the roundoff
+    floor.
+
+    The integrals are those of the pdf times (x - center)**k / scale**k for k up to ``order``,
+    followed by the one of -pdf * log(pdf) if ``entropy`` is True. The roundoff floor of the
+    error accounts for the relative resolution of the nodes, ``noise``.
+    """
+    n_intervals, _, n_batch = pdf.shape
+    n_funcs = order + 2 if entropy else order + 1
+    result = np.zeros((n_intervals, n_funcs, n_batch))
+    error = np.zeros((n_intervals, n_funcs, n_batch))
+    at_floor = np.ones(n_intervals, dtype=np.bool_)
+    values = np.empty(15)
+    for i in range(n_intervals):
+        for k in range(n_batch):
+            for func in range(n_funcs):
+                for j in range(15):
+                    p_val = pdf[i, j, k]
+                    if p_val <= 0 or weights[i, j, k] == 0:
+                        values[j] = 0.0
+                    elif func <= order:
+                        values[j] = p_val * std_vals[i, j, k] ** func
+                    else:
+                        values[j] = -p_val * np.log(p_val)
+                    # weights includes the Kronrod weight, remove it to get the integrand
+                    values[j] *= weights[i, j, k] / KRONROD_WEIGHTS[j]
+                res_k = 0.0
+                res_g = 0.0
+                roundoff = 0.0
+                for j in range(15):
+                    res_k += KRONROD_WEIGHTS[j] * values[j]
+                    res_g += GAUSS_WEIGHTS[j] * values[j]
+                    roundoff += 50 * KRONROD_WEIGHTS[j] * abs(values[j]) * noise[i, j, k]
+                mean_val = res_k / 2
+                res_asc = 0.0
+                for j in range(15):
+                    res_asc += KRONROD_WEIGHTS[j] * abs(values[j] - mean_val)
+                err = abs(res_k - res_g)
+                if res_asc != 0 and err != 0:
+                    err = res_asc * min(1.0, (200 * err / res_asc) ** 1.5)
+                if err > roundoff:
+                    at_floor[i] = False
+                else:
+                    err = roundoff
+                result[i, func, k] = res_k
+                error[i, func, k] = err
+    return result, error, at_floor
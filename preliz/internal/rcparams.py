@@ -59,6 +59,17 @@ def _validate_positive_int(value):
     raise ValueError("Only positive values are valid")
 
 
+def _validate_non_negative_int(value):
+    """Validate value is a non-negative integer."""
+    try:
+        value = int(value)
+    except ValueError as err:
+        raise ValueError("Could not convert to int") from err
+    if value >= 0:
+        return value
+    raise ValueError("Only non-negative values are valid")
+
+
 def _validate_float(value):
     """Validate value is a float."""
     try:
@@ -122,6 +133,7 @@ def make_iterable_validator(scalar_validator, length=None, allow_none=False, all
 defaultParams = {
     "stats.ci_kind": ("hdi", _make_validate_choice({"eti", "hdi"})),
     "stats.ci_prob": (0.94, _validate_probability),
+    "stats.cache_size": (256, _validate_non_negative_int),
     "plots.show_plot": (True, _validate_boolean),
 }
 
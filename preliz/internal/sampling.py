@@ -0,0 +1,165 @@
+"""Sampling options shared by the ``rvs`` method of all distributions."""
+
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+import numpy as np
+from scipy.stats import qmc
+
+# Maximum number of draws generated at once when filling an output buffer
+CHUNK_SIZE = 2**16
+
+
+def rvs_method(rvs):
+    """Decorate the ``rvs`` method of a distribution to add sampling options.
+
+    ``method="random"`` calls the decorated method, ``method="qmc"`` pushes scrambled Sobol points
+    through the ppf of the distribution. ``out`` is filled in place and ``workers`` splits the
+    draws across threads, see ``Distribution.rvs``.
+    """
+
+    @wraps(rvs)
+    def wrapper(self, *args, method="random", out=None, workers=None, **kwargs):
+        if method == "random":
+            sampler = rvs
+        elif method == "qmc":
+            sampler = _qmc_rvs
+        else:
+            raise ValueError(f"method must be 'random' or 'qmc', not {method!r}")
+
+        if workers == -1:
+            workers = os.cpu_count()
+        if workers is not None and workers != 1:
+            if not isinstance(workers, int) or workers < 1:
+                raise ValueError("workers must be a positive integer or -1")
+            if sampler is _qmc_rvs:
+                raise ValueError("workers is only supported for method='random'")
+            return _parallel(self, sampler, out, workers, *args, **kwargs)
+        if out is None:
+            return sampler(self, *args, **kwargs)
+        return _fill(self, sampler, out, *args, **kwargs)
+
+    return wrapper
+
+
+def _fill(dist, sampler, out, size=None, random_state=None):
+    """Write the draws into ``out``, in chunks along the first axis taken from a single stream."""
+    _check_out(size, out)
+
+    # the quasi-random points have to be generated together to keep their balance, and the
+    # axes of the batch have to be drawn together to broadcast against the parameters
+    if sampler is _qmc_rvs or not _n_draw_axes(out.shape, dist.batch_shape):
+        out[...] = sampler(dist, out.shape, random_state)
+        return out
+
+    random_state = np.random.default_rng(random_state)
+    n_rows = max(1, CHUNK_SIZE // int(np.prod(out.shape[1:])))
+    for start in range(0, len(out), n_rows):
+        chunk = out[start : start + n_rows]
+        chunk[...] = sampler(dist, chunk.shape, random_state)
+    return out
+
+
+def _parallel(dist, sampler, out, workers, size=None, random_state=None):
+    """
+    Split the draws along the first axis across threads.
+
+    Every thread uses its own stream, spawned from ``random_state``, so the draws only depend on
+    the seed and the number of workers.
+    """
+    if out is not None:
+        _check_out(size, out)
+        shape = out.shape
+    elif size is None:
+        shape = dist.batch_shape
+    else:
+        shape = tuple(np.atleast_1d(size))
+
+    # the axes of the batch have to be drawn together to broadcast against the parameters
+    if not _n_draw_axes(shape, dist.batch_shape) or shape[0] < 2:
+        if out is None:
+            return sampler(dist, size, random_state)
+        return _fill(dist, sampler, out, None, random_state)
+
+    workers = min(workers, shape[0])
+    bounds = np.linspace(0, shape[0], workers + 1).astype(int)
+    streams = [np.random.default_rng(seed) for seed in _seed_sequence(random_state).spawn(workers)]
+
+    def draw(idx):
+        start, stop = bounds[idx], bounds[idx + 1]
+        if out is None:
+            return sampler(dist, (stop - start, *shape[1:]), streams[idx])
+        return _fill(dist, sampler, out[start:stop], None, streams[idx])
+
+    with ThreadPoolExecutor(workers) as executor:
+        parts = list(executor.map(draw, range(workers)))
+
+    if out is None:
+        return np.concatenate(parts)
+    return out
+
+
+def _seed_sequence(random_state):
+    """Seed sequence to spawn the streams of the workers from."""
+    if random_state is None or isinstance(random_state, int | np.integer):
+        return np.random.SeedSequence(random_state)
+    if isinstance(random_state, np.random.SeedSequence):
+        return random_state
+    # a generator is advanced, so repeated calls spawn different streams
+    return np.random.SeedSequence(np.random.default_rng(random_state).integers(2**63, size=4))
+
+
+def _n_draw_axes(shape, batch_shape):
+    """Count the leading axes of ``shape``, in front of ``batch_shape``, that index the draws."""
+    n_batch = len(batch_shape)
+    if n_batch and tuple(shape[-n_batch:]) != tuple(batch_shape):
+        return 0
+    return len(shape) - n_batch
+
+
+def _check_out(size, out):
+    if size is not None and tuple(np.atleast_1d(size)) != out.shape:
+        raise ValueError(f"size {size} does not match the shape of out {out.shape}")
+
+
+def _qmc_rvs(dist, size=None, random_state=None):
+    return dist.ppf(sobol_uniform(size, dist.batch_shape, random_state))
+
+
+def sobol_uniform(size, batch_shape=(), random_state=None):
+    """
+    Scrambled Sobol points in the unit hypercube.
+
+    Every element of ``batch_shape`` gets its own dimension of the sequence, and the leading
+    dimensions of ``size`` index the points. The balance properties of the sequence are best when
+    the number of points is a power of 2.
+
+    Parameters
+    ----------
+    size : int or tuple of ints
+        Shape of the output. Defaults to ``batch_shape``.
+    batch_shape : tuple of ints
+        Trailing dimensions of ``size`` that are treated as dimensions of the sequence.
+    random_state : {None, int, numpy.random.Generator}
+        Seed for the scrambling.
+    """
+    if size is None:
+        shape = tuple(batch_shape)
+    else:
+        shape = tuple(np.atleast_1d(size))
+
+    n_dims = len(batch_shape)
+    if n_dims and shape[-n_dims:] == tuple(batch_shape):
+        n_points = int(np.prod(shape[:-n_dims]))
+        dim = int(np.prod(batch_shape))
+    else:
+        n_points = int(np.prod(shape))
+        dim = 1
+
+    sampler = qmc.Sobol(dim, scramble=True, seed=np.random.default_rng(random_state))
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "The balance properties", UserWarning)
+        points = sampler.random(n_points)
+    return points.reshape(shape)
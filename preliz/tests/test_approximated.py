@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from preliz import clear_cache
+from preliz.distributions import (
+    Approximated,
+    Beta,
+    Cauchy,
+    Censored,
+    Gamma,
+    Mixture,
+    Normal,
+    Poisson,
+    SkewNormal,
+    SkewStudentT,
+    Truncated,
+    Wald,
+)
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Normal(0, 1),
+        Gamma(0.5, 1),
+        Beta(0.5, 0.5),
+        Cauchy(0, 1),
+        Wald(1, 3),
+        Truncated(SkewNormal(0, 1, 4), -1, 4),
+        Censored(SkewStudentT(0, 1, 2, 3), -2, 2),
+        Mixture([Normal(-2, 1), Normal(3, 0.5)], [0.4, 0.6]),
+    ],
+)
+def test_approximate(dist):
+    tol = 1e-10
+    approx = dist.approximate(tol)
+    q_vals = np.linspace(0, 1, 2001)
+    x_vals = dist.ppf(q_vals)
+    iqr = dist.ppf(0.75) - dist.ppf(0.25)
+    assert_allclose(approx.cdf(x_vals), dist.cdf(x_vals), rtol=0, atol=2 * tol)
+    assert_allclose(approx.ppf(q_vals), x_vals, rtol=2 * tol, atol=2 * tol * iqr)
+    assert np.isnan(approx.ppf([-0.1, 1.1])).all()
+    assert_allclose(approx.pdf(x_vals[1:-1]), dist.pdf(x_vals[1:-1]))
+    assert approx.rvs(10, random_state=1).shape == (10,)
+
+
+def test_approximate_reuse():
+    clear_cache()
+    dist = Wald(1, 3)
+    approx = dist.approximate()
+    assert approx.dist is dist
+    assert approx._cdf_pieces[0] is not dist.approximate()._cdf_pieces[0]
+    assert_allclose(approx._cdf_pieces[1], dist.approximate()._cdf_pieces[1])
+    assert approx.median() == approx.ppf(0.5)
+
+
+def test_approximate_mixture_summaries():
+    dist = Mixture([Normal(0, 1), Normal(5, 1)], [0.3, 0.7])
+    approx = dist.approximate()
+    assert_allclose(approx.eti(), dist.eti(), atol=1e-6)
+    assert_allclose(approx.hdi(), dist.hdi(), atol=1e-6)
+    assert approx.summary().mean == dist.summary().mean
+    assert approx.batch_shape == ()
+
+
+def test_approximate_invalid():
+    with pytest.raises(ValueError):
+        Poisson(3).approximate()
+    with pytest.raises(ValueError):
+        Normal([0, 1], 1).approximate()
+    with pytest.raises(ValueError):
+        Approximated(Normal(0, 1), tol=0)
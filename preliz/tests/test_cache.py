@@ -0,0 +1,47 @@
+import numpy as np
+from numpy.testing import assert_almost_equal
+
+from preliz import clear_cache, rc_context
+from preliz.distributions import Gamma, Normal, Truncated
+from preliz.internal.cache import cache_info, dist_key
+
+
+def test_dist_key():
+    assert dist_key(Normal()) is None
+    assert dist_key(Normal(0, 1)) == dist_key(Normal(0, 1))
+    assert dist_key(Normal(0, 1)) != dist_key(Normal(0, 2))
+    assert dist_key(Normal(0, 1)) != dist_key(Normal(mu=0, tau=1))
+    assert dist_key(Truncated(Normal(0, 1), -1, 1)) != dist_key(Truncated(Gamma(0, 1), -1, 1))
+
+
+def test_cache_reuse():
+    clear_cache()
+    dist = Gamma(2, 1)
+    hdi = dist.hdi(fmt="none")
+    n_entries, _ = cache_info()
+    assert n_entries > 0
+    assert Gamma(2, 1).hdi(fmt="none") == hdi
+    assert cache_info()[0] == n_entries
+    dist._parametrization(3, 1)
+    assert dist.hdi(fmt="none") != hdi
+    clear_cache()
+    assert cache_info()[0] == 0
+
+
+def test_cache_copies_arrays():
+    dist = Normal(np.array([0.0, 1.0]), 1)
+    lower, _ = dist._finite_endpoints("full")
+    lower[:] = 10
+    assert_almost_equal(dist._finite_endpoints("full")[0], [-3.719, -2.719], 3)
+
+
+def test_cache_size():
+    clear_cache()
+    with rc_context({"stats.cache_size": 2}):
+        for mu in range(5):
+            Normal(mu, 1).eti()
+        assert cache_info() == (2, 2)
+    clear_cache()
+    with rc_context({"stats.cache_size": 0}):
+        Normal(0, 1).eti()
+        assert cache_info()[0] == 0
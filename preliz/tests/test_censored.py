@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
-from scipy.stats import kurtosis, skew
+from numpy.testing import assert_allclose, assert_almost_equal
+from scipy.stats import kurtosis, norm, skew, truncnorm
 
 from preliz.distributions import Censored, Normal, Poisson
 
@@ -53,3 +53,13 @@ def test_censored(dist, lower, upper):
     assert c_l >= d_l
     assert c_u <= d_u
     assert_almost_equal(cen_dist_inf.hdi(), dist.hdi())
+
+
+def test_censored_entropy():
+    dist = Censored(Normal(0, 1), -1, 1)
+    p_low = norm.cdf(-1)
+    p_int = 1 - 2 * p_low
+    trunc_entropy = truncnorm(-1, 1).entropy()
+    expected = p_int * trunc_entropy - p_int * np.log(p_int) - 2 * p_low * np.log(p_low)
+    # the mass at the bounds comes from the Normal cdf, which is accurate to ~1e-8
+    assert_allclose(dist.entropy(), expected, rtol=1e-7)
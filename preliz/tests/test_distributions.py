@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal
+from scipy import stats
 
 try:
     from pymc import Model
@@ -291,6 +292,47 @@ def test_ppf(a_few_poissons):
     assert result2 == 4.0
 
 
+@pytest.mark.parametrize("kappa", [0.01, 2, 49, 50, 1000])
+@pytest.mark.parametrize("mu", [0, 1, -2.5])
+def test_vonmises_cdf_ppf(mu, kappa):
+    dist = VonMises(mu, kappa)
+    sp_dist = stats.vonmises(kappa, loc=mu)
+    x_vals = np.linspace(-np.pi, np.pi, 101)
+    assert_allclose(dist.cdf(x_vals), sp_dist.cdf(x_vals) - sp_dist.cdf(-np.pi), atol=1e-10)
+    q_vals = np.linspace(0.001, 0.999, 101)
+    assert_allclose(dist.cdf(dist.ppf(q_vals)), q_vals, atol=1e-10)
+
+
+@pytest.mark.parametrize("alpha, beta", [(0.5, 1), (1, 2), (3, 1)])
+def test_inversegamma_ppf_tiny_q(alpha, beta):
+    q_vals = np.array([1e-300, 1e-20, 1e-17, 1e-10])
+    assert_allclose(
+        InverseGamma(alpha, beta).ppf(q_vals), stats.invgamma(alpha, scale=beta).ppf(q_vals)
+    )
+
+
+@pytest.mark.parametrize("nu", [0, 0.5, 3, 30])
+@pytest.mark.parametrize("sigma", [0.5, 2])
+def test_rice_cdf_ppf(nu, sigma):
+    dist = Rice(nu, sigma)
+    sp_dist = stats.rice(nu / sigma, scale=sigma)
+    x_vals = np.linspace(0, sp_dist.ppf(0.9999), 101)
+    assert_allclose(dist.cdf(x_vals), sp_dist.cdf(x_vals), atol=1e-10)
+    q_vals = np.linspace(0.001, 0.999, 101)
+    assert_allclose(dist.cdf(dist.ppf(q_vals)), q_vals, atol=1e-12)
+    # scipy takes the log of the pdf, which underflows far in the left tail
+    normal = sp_dist.pdf(x_vals) > 1e-300
+    assert_allclose(dist.logpdf(x_vals[normal]), sp_dist.logpdf(x_vals[normal]), rtol=1e-10)
+
+
+@pytest.mark.parametrize("mean, std", [(2, 1), (5, 2), (10, 1), (100, 1)])
+def test_rice_fit_moments(mean, std):
+    dist = Rice()
+    dist._fit_moments(mean, std)
+    assert_allclose(dist.mean(), mean, rtol=1e-10)
+    assert_allclose(dist.var(), std**2, rtol=1e-8)
+
+
 def test_to_pymc():
     with Model() as model:
         Gamma(1, 1).to_pymc("a", shape=(2, 2))
@@ -312,3 +354,58 @@ def test_to_bambi():
     assert bambi_prior.name == "Gamma"
     assert bambi_prior.args["mu"] == 2
     assert bambi_prior.args["sigma"] == 1
+
+
+@pytest.mark.parametrize(
+    "distribution, params",
+    [
+        (AsymmetricLaplace, ([1, 2, 3], 0, 1)),
+        (Beta, ([2, 3, 4], 5)),
+        (Cauchy, ([0, 1, 2], 1)),
+        (ExGaussian, (0, [1, 2, 3], 1)),
+        (Gamma, ([1, 2, 3], 0.5)),
+        (HalfStudentT, ([1.5, 3, 100], 1)),
+        (Kumaraswamy, ([2, 3, 5], 2)),
+        (LogitNormal, ([0, 0.5, 1], 0.5)),
+        (Normal, ([0, 1, 2], [1, 2, 3])),
+        (Rice, ([1, 2, 3], 1)),
+        (SkewNormal, (0, 1, [-1, 0, 1])),
+        (StudentT, ([1.5, 3, 100], 0, 1)),
+        (TruncatedNormal, (0, 1, [-1, -2, -np.inf], 2)),
+        (VonMises, (0, [1, 2, 3])),
+        (Wald, ([1, 2, 3], 1)),
+        (BetaBinomial, (2, 2, [8, 10, 12])),
+        (Binomial, ([2, 4, 6], 0.5)),
+        (Poisson, ([1, 4.5, 10],)),
+        (NegativeBinomial, ([4, 8, 12], 4)),
+        # only the scale is batched
+        (Cauchy, (0, [1, 2, 3])),
+        (Gumbel, (0, [1, 2, 3])),
+        (Laplace, (0, [1, 2, 3])),
+        (Logistic, (0, [1, 2, 3])),
+        (Normal, (0, [1, 2, 3])),
+        (SkewNormal, (0, [1, 2, 3], 1)),
+        (StudentT, (3, 0, [1, 2, 3])),
+    ],
+)
+def test_batched_params(distribution, params):
+    params = [np.asarray(param) for param in params]
+    dist = distribution(*params)
+    dists = [distribution(*p) for p in zip(*np.broadcast_arrays(*params))]
+    assert dist.batch_shape == (3,)
+    assert dists[0].batch_shape == ()
+
+    x_vals = np.array([d.ppf(0.3) for d in dists])
+    assert_almost_equal(dist.pdf(x_vals), [d.pdf(x) for d, x in zip(dists, x_vals)])
+    assert_almost_equal(dist.cdf(x_vals), [d.cdf(x) for d, x in zip(dists, x_vals)])
+    assert_almost_equal(dist.ppf(0.7), [d.ppf(0.7) for d in dists], 4)
+    assert_almost_equal(dist.mean(), [d.mean() for d in dists])
+    assert_almost_equal(dist.var(), [d.var() for d in dists])
+    assert_almost_equal(dist.entropy(), [d.entropy() for d in dists], 2)
+    assert_almost_equal(dist.median(), [d.median() for d in dists], 4)
+    assert_almost_equal(dist.mode(), [d.mode() for d in dists], 3)
+    for stat in ["mean", "median", "mode", "var", "std", "skewness", "kurtosis", "entropy"]:
+        value = getattr(dist, stat)()
+        if value is not NotImplemented:
+            assert np.shape(value) == (3,), stat
+    assert dist.rvs(random_state=0).shape == (3,)
@@ -1,3 +1,10 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal
+from scipy import stats
+
+from preliz.distributions import BetaBinomial, HyperGeometric
+from preliz.internal import distribution_helper
 from preliz.internal.distribution_helper import process_extra
 
 
@@ -7,3 +14,55 @@ def test_process_extra():
 
     assert process_extra("TruncatedNormal(lower=-3, upper=3)") == ref0
     assert process_extra("StudentT(nu=3.4),Normal(mu=3)") == ref1
+
+
+@pytest.mark.parametrize(
+    "p_dist, sp_dist",
+    [
+        (BetaBinomial(2, 3, 20), stats.betabinom(20, 2, 3)),
+        (HyperGeometric(50, 10, 20), stats.hypergeom(50, 10, 20)),
+    ],
+)
+@pytest.mark.parametrize("max_table_size", [2**20, 10])
+def test_cdf_table(p_dist, sp_dist, max_table_size, monkeypatch):
+    monkeypatch.setattr(distribution_helper, "MAX_TABLE_SIZE", max_table_size)
+    p_dist._update(*p_dist.params)
+    x_vals = np.arange(-1, 22)
+    assert_almost_equal(p_dist.cdf(x_vals), sp_dist.cdf(x_vals))
+    q_vals = np.linspace(0, 1, 21)
+    assert_almost_equal(p_dist.ppf(q_vals), sp_dist.ppf(q_vals))
+
+
+@pytest.mark.parametrize("max_table_size", [2**20, 100])
+def test_cdf_table_batch(max_table_size, monkeypatch):
+    monkeypatch.setattr(distribution_helper, "MAX_TABLE_SIZE", max_table_size)
+    alpha = np.array([[1.0, 2.0, 5.0], [0.5, 3.0, 8.0]])
+    p_dist = BetaBinomial(alpha, 3, 20)
+    sp_dist = stats.betabinom(20, alpha, 3)
+    # a table of 21 values for each of the 6 batch elements is only built under the larger cap
+    assert (p_dist._get_cdf_table() is None) == (max_table_size < 21 * 6)
+    q_vals = np.linspace(0, 1, 21).reshape(-1, 1, 1)
+    assert_almost_equal(p_dist.ppf(q_vals), sp_dist.ppf(q_vals))
+    assert_almost_equal(p_dist.ppf(0.3), sp_dist.ppf(0.3))
+    x_vals = np.arange(-1, 22).reshape(-1, 1, 1)
+    assert_almost_equal(p_dist.cdf(x_vals), sp_dist.cdf(x_vals))
+
+
+@pytest.mark.parametrize(
+    "p_dist, sp_dist",
+    [
+        (HyperGeometric(10**9, 5 * 10**8, 10**7), stats.hypergeom(10**9, 5 * 10**8, 10**7)),
+        (BetaBinomial(2e4, 3e4, 2 * 10**6), stats.betabinom(2 * 10**6, 2e4, 3e4)),
+    ],
+)
+def test_cdf_table_window(p_dist, sp_dist):
+    # the supports are above MAX_TABLE_SIZE, the tables only cover the values with some mass
+    lower, table = p_dist._get_cdf_table()
+    assert len(table) < distribution_helper.MAX_TABLE_SIZE
+    q_vals = np.array([1e-6, 0.01, 0.3, 0.5, 0.9, 0.99])
+    x_vals = p_dist.ppf(q_vals)
+    # smallest values with cdf >= q, checked against the cdf of scipy
+    assert np.all(sp_dist.cdf(x_vals) >= q_vals)
+    assert np.all(sp_dist.cdf(x_vals - 1) < q_vals)
+    assert_almost_equal(p_dist.cdf(x_vals), sp_dist.cdf(x_vals), 6)
+    assert_almost_equal(p_dist.cdf([lower - 1, lower + len(table)]), [0, 1])
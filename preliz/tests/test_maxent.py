@@ -1,8 +1,10 @@
+from copy import deepcopy
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose, assert_almost_equal
 
-from preliz import maxent
+from preliz import maxent, maxent_batch, maxent_rank
 from preliz.distributions import (
     AsymmetricLaplace,
     Beta,
@@ -49,6 +51,8 @@ from preliz.distributions import (
     ZeroInflatedNegativeBinomial,
     ZeroInflatedPoisson,
 )
+from preliz.internal import init_tables
+from preliz.internal.optimization import MAXENT_SOLVERS
 
 
 @pytest.mark.parametrize(
@@ -104,12 +108,12 @@ from preliz.distributions import (
         (Pareto(), 1, 4, 0.9, (1, np.inf), (1.660, 1)),
         (Pareto(m=2), 1, 4, 0.9, (2, np.inf), (3.321)),
         (Rice(), 0, 4, 0.7, (0, np.inf), (0, 2.577)),
-        (Rice(), 1, 10, 0.9, (0, np.inf), (3.454, 3.734)),
+        (Rice(), 1, 10, 0.9, (0, np.inf), (3.453, 3.735)),
         (Rice(nu=4), 0, 6, 0.9, (0, np.inf), (1.402)),
         (SkewNormal(), -2, 10, 0.9, (-np.inf, np.inf), (4, 3.647, 0)),
-        (SkewNormal(mu=-1), -2, 10, 0.9, (-np.inf, np.inf), (6.293, 4.908)),
-        (SkewStudentT(), -1, 1, 0.9, (-np.inf, np.inf), (0.010, 0.522, 3.264, 3.305)),
-        (SkewStudentT(mu=0.7, sigma=0.4), -1, 1, 0.9, (-np.inf, np.inf), (2.004, 5.214)),
+        (SkewNormal(mu=-1), -2, 10, 0.9, (-np.inf, np.inf), (6.293, 4.905)),
+        (SkewStudentT(), -1, 1, 0.9, (-np.inf, np.inf), (0.009, 0.521, 3.192, 3.225)),
+        (SkewStudentT(mu=0.7, sigma=0.4), -1, 1, 0.9, (-np.inf, np.inf), (2.004, 5.212)),
         (StudentT(), -1, 1, 0.683, (-np.inf, np.inf), (99.999, 0, 0.994)),
         (StudentT(nu=7), -1, 1, 0.683, (-np.inf, np.inf), (0, 0.928)),
         (
@@ -199,5 +203,158 @@ def test_maxent_fixed_stats():
         maxent(dist, 0, 3, 0.8, fixed_stat=("bad", 2))
 
 
+@pytest.mark.parametrize(
+    "dist, lower, upper",
+    [
+        (Normal(), -1, 1),
+        (Gamma(), 1, 10),
+        (StudentT(nu=7), -1, 1),
+        (LogNormal(), 1, 10),
+    ],
+)
+def test_maxent_extreme_mass(dist, lower, upper):
+    for mass in [1 - 1e-6, 1 - 1e-12]:
+        fitted = deepcopy(dist)
+        maxent(fitted, lower, upper, mass)
+        assert fitted.opt.success
+        # the mass outside the interval is too small to be resolved from the cdf
+        log_out = np.logaddexp(fitted.logcdf(lower), fitted.logsf(upper))
+        assert_allclose(log_out, np.log1p(-mass), rtol=1e-4)
+
+
+@pytest.mark.parametrize(
+    "dist, lower, upper, mass",
+    [
+        (Normal(), -1, 3, 0.9),
+        (Normal(mu=0.5), -1, 1, 0.8),
+        (Logistic(), 2, 5, 0.5),
+        (Laplace(mu=-1), -2, 1, 0.9),
+        (Cauchy(), -1, 1, 0.6),
+        (StudentT(nu=4), 0, 10, 0.99),
+        (StudentT(nu=4, mu=9), 0, 10, 0.99),
+        (Uniform(), -2, 10, 0.9),
+    ],
+)
+def test_maxent_closed_form(monkeypatch, dist, lower, upper, mass):
+    fitted = maxent(deepcopy(dist), lower, upper, mass, plot=False)
+    assert fitted.opt.success
+    assert fitted.opt.nit == 0
+    assert_allclose(fitted.cdf(upper) - fitted.cdf(lower), mass, rtol=1e-10)
+
+    monkeypatch.delitem(MAXENT_SOLVERS, dist.__class__.__name__)
+    expected = maxent(deepcopy(dist), lower, upper, mass, plot=False)
+    assert expected.opt.nit > 0
+    assert_allclose(fitted.params, expected.params, rtol=1e-3, atol=1e-3)
+    # the optimizer satisfies the constraint only to its tolerance
+    assert fitted.entropy() >= expected.entropy() - 1e-5
+
+
+def test_maxent_closed_form_fallback():
+    dist = maxent(StudentT(), -1, 1, 0.683, plot=False)
+    assert dist.opt.nit > 0
+    dist = maxent(Normal(), -1, 1, 0.9, fixed_stat=("mean", 0.2), plot=False)
+    assert dist.opt.nit > 0
+
+
+@pytest.mark.parametrize(
+    "dist, lower, upper, mass",
+    [
+        (Gamma(), 2, 11, 0.9),
+        (InverseGamma(), 0.5, 4, 0.7),
+        (LogLogistic(), 1, 3, 0.8),
+        (Weibull(), 3, 9, 0.9),
+        (Beta(), 0.2, 0.6, 0.8),
+        (Kumaraswamy(), 0.1, 0.4, 0.6),
+    ],
+)
+def test_maxent_table_guess(monkeypatch, dist, lower, upper, mass):
+    guess = init_tables.table_guess(dist, lower, upper, mass)
+    fitted = maxent(deepcopy(dist), lower, upper, mass, plot=False)
+    assert fitted.opt.success
+    assert_allclose(guess, fitted.params, rtol=0.05)
+
+    monkeypatch.setattr(init_tables, "_load_tables", dict)
+    assert init_tables.table_guess(dist, lower, upper, mass) is None
+    expected = maxent(deepcopy(dist), lower, upper, mass, plot=False)
+    assert_allclose(fitted.params, expected.params, rtol=1e-2)
+    assert fitted.entropy() >= expected.entropy() - 1e-5
+
+
+def test_maxent_table_guess_none():
+    # the moment matching guess does not converge for this one
+    dist = maxent(LogLogistic(), 0.1, 0.3, 0.5, plot=False)
+    assert_allclose(dist.cdf(0.3) - dist.cdf(0.1), 0.5, rtol=1e-4)
+
+    assert init_tables.table_guess(Normal(), -1, 1, 0.9) is None
+    assert init_tables.table_guess(Gamma(), 0, 1, 0.9) is None
+    assert init_tables.table_guess(Gamma(), 1, 2, 1) is None
+    assert init_tables.table_guess(Beta(), 0.5, 2, 0.9) is None
+
+
+@pytest.mark.parametrize(
+    "lower, upper, mass",
+    [(2.584, 44.836, 0.398), (1.742, 9.105, 0.433), (2.493, 46.052, 0.494)],
+)
+def test_maxent_exponential(lower, upper, mass):
+    dist = maxent(Exponential(), lower, upper, mass, plot=False)
+    assert dist.opt.success
+    assert_allclose(dist.cdf(upper) - dist.cdf(lower), mass, rtol=1e-4)
+
+
 def test_maxent_plot():
     maxent(Normal(), plot_kwargs={"support": "restricted", "pointinterval": True})
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_maxent_batch(workers):
+    specs = [
+        (Normal(), -1, 1, 0.9),
+        (Gamma(), 1, 10, 0.9),
+        (Gamma(), 1.1, 10.5, 0.9),
+        (Normal(), -1, 1, 0.9),
+        (StudentT(nu=4), -2, 3),
+        (Poisson(), 1, 6, 0.8),
+        (Gamma(mu=4), 1, 10, 0.9),
+    ]
+    results = maxent_batch(specs, workers=workers)
+    assert len(results) == len(specs)
+    for (dist, lower, upper, *mass), result in zip(specs, results):
+        assert not dist.is_frozen
+        expected = maxent(deepcopy(dist), lower, upper, *mass, plot=False)
+        assert result.success
+        assert result.dist.__class__ is dist.__class__
+        assert_allclose(list(result.params.values()), expected.params, rtol=1e-2)
+        assert_allclose(
+            result.mass, expected.cdf(upper) - expected.cdf(lower - (dist.kind == "discrete"))
+        )
+    assert results[0].params == results[3].params
+    assert results[1].nfev > 0
+    assert results[-1].params["mu"] == 4
+
+
+def test_maxent_batch_invalid():
+    with pytest.raises(ValueError, match="workers"):
+        maxent_batch([(Normal(), -1, 1)], workers=0)
+    with pytest.raises(ValueError, match="upper should be larger than lower"):
+        maxent_batch([(Normal(), -1, 1), (Normal(), 1, -1)])
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_maxent_rank(workers):
+    families = [Exponential(), Gamma(), Beta(), LogNormal(), InverseGamma(), Weibull()]
+    ranked = maxent_rank(families, 1, 10, 0.9, workers=workers)
+    assert [result.dist.__class__ for result in ranked[:4]] == [
+        Gamma,
+        Weibull,
+        LogNormal,
+        InverseGamma,
+    ]
+    assert all(result.success for result in ranked[:4])
+    entropies = [result.dist.entropy() for result in ranked[:4]]
+    assert entropies == sorted(entropies, reverse=True)
+    assert ranked[-1].dist.__class__ is Exponential
+    assert not ranked[-1].success
+    assert not any(dist.is_frozen for dist in families)
+
+    with pytest.raises(ValueError, match="outside the domain of all"):
+        maxent_rank([Beta(), Exponential()], -1, 2)
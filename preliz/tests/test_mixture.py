@@ -1,9 +1,9 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal
 from scipy.stats import kurtosis, skew
 
-from preliz.distributions import Mixture, Normal, Poisson
+from preliz.distributions import Gamma, Mixture, Normal, Poisson, Truncated
 
 
 @pytest.mark.parametrize(
@@ -62,3 +62,30 @@ def test_mixture(dist0, dist1, weights):
     # assert c_l >= d_l
     # assert c_u <= d_u
     # assert_almost_equal(cen_dist_inf.hdi(), dist.hdi())
+
+
+def test_mixture_stacked_components():
+    dists = [Normal(-2, 1), Gamma(2, 1), Normal(3, 0.5), Truncated(Normal(0, 1), -1, 1)]
+    weights = np.array([0.1, 0.3, 0.4, 0.2])
+    mix_dist = Mixture(dists, weights)
+    assert len(mix_dist._groups) == 3
+
+    x_vals = np.linspace(-4, 6, 11)
+    expected_pdf = np.sum([w * dist.pdf(x_vals) for dist, w in zip(dists, weights)], axis=0)
+    expected_cdf = np.sum([w * dist.cdf(x_vals) for dist, w in zip(dists, weights)], axis=0)
+    assert_allclose(mix_dist.pdf(x_vals), expected_pdf)
+    assert_allclose(mix_dist.cdf(x_vals), expected_cdf)
+    assert_allclose(mix_dist.logpdf(x_vals), np.log(expected_pdf))
+    assert_allclose(mix_dist.logpdf(-50), np.log(0.1) + dists[0].logpdf(-50))
+    assert_allclose(mix_dist.mean(), np.sum([w * d.mean() for d, w in zip(dists, weights)]))
+
+
+def test_mixture_rvs():
+    mix_dist = Mixture([Normal(-100, 1), Normal(0, 1), Normal(100, 1)], [0.2, 0.3, 0.5])
+    samples = mix_dist.rvs(10000, random_state=1)
+    components = np.round(samples / 100).astype(int) + 1
+    assert_allclose(np.bincount(components) / 10000, [0.2, 0.3, 0.5], atol=0.02)
+    # samples are not sorted by component
+    assert np.any(np.diff(components) < 0)
+    assert mix_dist.rvs((2, 3), random_state=1).shape == (2, 3)
+    assert np.ndim(mix_dist.rvs(random_state=1)) == 0
@@ -4,16 +4,29 @@ from numpy.testing import assert_almost_equal
 
 from preliz.distributions import (
     Beta,
+    BetaBinomial,
+    Cauchy,
     Exponential,
+    Gamma,
     Geometric,
+    Gumbel,
     HalfNormal,
+    Kumaraswamy,
     Laplace,
+    Logistic,
+    LogLogistic,
+    LogNormal,
+    Moyal,
+    NegativeBinomial,
     Normal,
+    Pareto,
     Poisson,
     StudentT,
+    Truncated,
+    Uniform,
     Weibull,
 )
-from preliz.internal.optimization import find_ppf
+from preliz.internal.optimization import find_ppf, optimize_hdi, set_params
 
 
 @pytest.mark.parametrize(
@@ -26,6 +39,7 @@ from preliz.internal.optimization import find_ppf
         (Normal, {"mu": 0, "sigma": 2}),
         (StudentT, {"nu": 5, "mu": 0, "sigma": 2}),
         (Weibull, {"alpha": 5.0, "beta": 2.0}),
+        (Normal, {"mu": np.linspace(-1, 1, 10), "sigma": 2}),
         (Geometric, {"p": 0.4}),
         (Poisson, {"mu": 3.5}),
     ],
@@ -36,3 +50,106 @@ def test_find_ppf(p_dist, p_params):
     actual_ppf = preliz_dist.ppf(x_vals)
     expected_ppf = find_ppf(preliz_dist, x_vals)
     assert_almost_equal(actual_ppf, expected_ppf, decimal=4)
+
+
+def test_find_ppf_edges():
+    dist = Normal(0, 1)
+    assert_almost_equal(
+        find_ppf(dist, [-0.1, 0, 0.5, 1, 1.1]), [np.nan, -np.inf, 0, np.inf, np.nan]
+    )
+    dist = Poisson(3.5)
+    assert_almost_equal(find_ppf(dist, [0, 1]), [-1, np.inf])
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [Normal(0, 1), Normal(mu=0, tau=1), Beta(2, 5), Beta(mu=0.5, sigma=0.1), Poisson(3)],
+)
+def test_set_params(dist):
+    values = np.array(dist.params) * 0.9
+    expected = dist.__class__(**dict(zip(dist.param_names, values)))
+    set_params(dist, values[:1], [0], values[1:])
+    assert dist.param_names == expected.param_names
+    assert_almost_equal(dist.params, expected.params)
+    assert_almost_equal(dist.mean(), expected.mean())
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Normal(1, 2),
+        Cauchy(0.5, 1.5),
+        Logistic(1, 2),
+        Laplace(-1, 0.7),
+        Gumbel(1, 2),
+        Moyal(0.3, 1.2),
+        LogNormal(0.2, 0.6),
+        Weibull(1.5, 2.2),
+        Uniform(-1, 3),
+        Pareto(2.5, 1.2),
+        LogLogistic(1.4, 3.1),
+        Kumaraswamy(2.1, 3.3),
+    ],
+)
+def test_gradients(dist):
+    x_vals = np.array([-np.inf, -0.5, 0, 0.3, 0.7, 1.5, 2.5, 4, np.inf])
+    params = np.array(dist.params, dtype=float)
+    step = 1e-6
+    entropy_grad = []
+    cdf_grad = []
+    for idx in range(len(params)):
+        shift = step * np.eye(len(params))[idx]
+        plus = dist.__class__(**dict(zip(dist.param_names, params + shift)))
+        minus = dist.__class__(**dict(zip(dist.param_names, params - shift)))
+        entropy_grad.append((plus.entropy() - minus.entropy()) / (2 * step))
+        cdf_grad.append((plus.cdf(x_vals) - minus.cdf(x_vals)) / (2 * step))
+
+    if hasattr(dist, "_entropy_grad"):
+        assert_almost_equal(dist._entropy_grad(), entropy_grad, 6)
+    assert_almost_equal(dist._cdf_grad(x_vals), cdf_grad, 6)
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Normal(0, 1),
+        Gamma(2, 5),
+        Beta(2, 5),
+        Weibull(1.5, 2),
+        StudentT(3, 0, 1),
+        Truncated(Normal(0, 1), -1, 2),
+    ],
+)
+@pytest.mark.parametrize("mass", [0.5, 0.94])
+def test_optimize_hdi(dist, mass):
+    lower, upper = optimize_hdi(dist, mass)
+    assert_almost_equal(dist.cdf(upper) - dist.cdf(lower), mass, 6)
+    if not np.isclose(lower, dist.support[0]):
+        assert_almost_equal(dist.pdf(lower), dist.pdf(upper), 6)
+
+
+@pytest.mark.parametrize("mass", [0.5, 0.94])
+def test_optimize_hdi_monotonic(mass):
+    assert_almost_equal(optimize_hdi(Exponential(1), mass), (0, -np.log(1 - mass)))
+    assert_almost_equal(optimize_hdi(Beta(3, 1), mass), ((1 - mass) ** (1 / 3), 1))
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Poisson(4.5),
+        NegativeBinomial(8, 4),
+        BetaBinomial(2, 3, 20),
+        Truncated(Poisson(4.5), 2, 8),
+    ],
+)
+@pytest.mark.parametrize("mass", [0.5, 0.94])
+def test_optimize_hdi_discrete(dist, mass):
+    lower, upper = optimize_hdi(dist, mass)
+    x_vals = np.arange(0, 100)
+    pmf = dist.pdf(x_vals)
+    assert pmf[lower : upper + 1].sum() >= mass
+    width = upper - lower
+    # no interval of the same width or shorter contains the required mass
+    for start in x_vals[:-width]:
+        assert pmf[start : start + width].sum() < mass
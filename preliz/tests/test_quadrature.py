@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from scipy import stats
+
+from preliz import clear_cache
+from preliz.distributions import (
+    Beta,
+    Gamma,
+    Hurdle,
+    LogNormal,
+    Normal,
+    StudentT,
+    Truncated,
+    Weibull,
+)
+from preliz.internal.quadrature import quad_moments
+
+
+@pytest.mark.parametrize(
+    "dist, sp_dist",
+    [
+        (Normal(1e6, 1e-3), stats.norm(1e6, 1e-3)),
+        (Gamma(0.5, 1), stats.gamma(0.5)),
+        (Beta(2, 5), stats.beta(2, 5)),
+        (StudentT(5, 0, 1), stats.t(5)),
+        (LogNormal(0, 1), stats.lognorm(1)),
+        (Weibull(0.5, 1), stats.weibull_min(0.5)),
+    ],
+)
+def test_quad_moments(dist, sp_dist):
+    expected = [*sp_dist.stats("mvsk"), sp_dist.entropy()]
+    assert_allclose(quad_moments(dist, "mvske"), expected, rtol=1e-9, atol=1e-7)
+
+
+def test_quad_moments_batched():
+    mus = np.array([0.0, 1.0, 10.0])
+    sigmas = np.array([1.0, 0.5, 3.0])
+    actual = quad_moments(Normal(mus, sigmas), "mve")
+    expected = [quad_moments(Normal(mu, sigma), "mve") for mu, sigma in zip(mus, sigmas)]
+    assert_allclose(actual, np.transpose(expected), rtol=1e-12, atol=1e-14)
+
+
+def test_quad_moments_reuse():
+    clear_cache()
+    dist = Truncated(Normal(0, 2), -1, 5)
+    n_evals = []
+    pdf = dist.pdf
+
+    def counted_pdf(x):
+        n_evals.append(np.size(x))
+        return pdf(x)
+
+    dist.pdf = counted_pdf
+    moments = dist.moments("mvsk")
+    entropy = dist.entropy()
+    n_total = sum(n_evals)
+    assert n_total < 1000
+    dist.moments("mvsk")
+    assert sum(n_evals) == n_total
+
+    a, b = -1 / 2, 5 / 2
+    sp_dist = stats.truncnorm(a, b, scale=2)
+    assert_allclose(moments, sp_dist.stats("mvsk"), rtol=1e-10, atol=1e-12)
+    # the normalizing constant comes from the Normal cdf, which is accurate to ~1e-8
+    assert_allclose(entropy, sp_dist.entropy(), rtol=1e-7)
+
+
+def test_hurdle_var():
+    dist = Hurdle(Gamma(3, 5), 0.7)
+    mean, var = 3 / 5, 3 / 25
+    assert_allclose(dist.mean(), 0.7 * mean, rtol=1e-12)
+    assert_allclose(dist.var(), 0.7 * (var + mean**2) - (0.7 * mean) ** 2, rtol=1e-12)
+
+
+def test_quad_moments_invalid():
+    with pytest.raises(ValueError):
+        quad_moments(Normal(0, 1), "mvd")
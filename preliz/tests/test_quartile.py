@@ -112,3 +112,10 @@ def test_quartile(distribution, q1, q2, q3, result):
     quartile(distribution, q1, q2, q3)
 
     assert_allclose(distribution.opt.x, result, atol=0.01)
+
+
+def test_quartile_table_guess():
+    # the moment matching guess of Weibull is outside the bounds for these quartiles
+    quartiles = Weibull(0.5, 1).ppf([0.25, 0.5, 0.75])
+    dist = quartile(Weibull(), *quartiles, plot=False)
+    assert_allclose(dist.params, (0.5, 1), rtol=1e-5)
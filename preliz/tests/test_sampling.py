@@ -0,0 +1,168 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from preliz.distributions import (
+    Dirichlet,
+    Gamma,
+    Mixture,
+    MvNormal,
+    Normal,
+    Poisson,
+    Rice,
+    Truncated,
+    TruncatedNormal,
+)
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Normal(1, 2),
+        Gamma(2, 1),
+        Poisson(3),
+        Rice(1, 1),
+        Truncated(Normal(0, 1), -1, 2),
+        Mixture([Normal(-2, 1), Normal(3, 0.5)], [0.4, 0.6]),
+    ],
+)
+def test_rvs_qmc(dist):
+    sample = dist.rvs(1024, random_state=1, method="qmc")
+    assert sample.shape == (1024,)
+    # the error of iid draws would be about dist.std() / 32
+    assert_allclose(sample.mean(), dist.mean(), atol=dist.std() / 300)
+    assert np.ndim(dist.rvs(method="qmc")) == 0
+    assert dist.rvs((4, 3), random_state=1, method="qmc").shape == (4, 3)
+    assert_allclose(
+        dist.rvs(8, random_state=2, method="qmc"), dist.rvs(8, random_state=2, method="qmc")
+    )
+
+
+def test_rvs_qmc_batched():
+    dist = Normal(np.array([0.0, 1.0, 2.0]), 1)
+    assert dist.rvs(method="qmc").shape == (3,)
+    sample = dist.rvs((256, 3), random_state=0, method="qmc")
+    assert_allclose(sample.mean(0), dist.mu, atol=0.01)
+    # every element of the batch uses its own dimension of the sequence
+    assert not np.allclose(sample[:, 0], sample[:, 1] - 1)
+
+
+def test_rvs_qmc_multivariate():
+    mvnormal = MvNormal([0, 1], [[2, 1], [1, 2]])
+    sample = mvnormal.rvs(1024, random_state=1, method="qmc")
+    assert sample.shape == (1024, 2)
+    assert_allclose(sample.mean(0), mvnormal.mu, atol=0.01)
+    assert_allclose(np.cov(sample.T), mvnormal.cov, atol=0.05)
+    assert mvnormal.rvs(method="qmc").shape == (2,)
+
+    dirichlet = Dirichlet([0.5, 2, 3])
+    sample = dirichlet.rvs((2, 512), random_state=1, method="qmc")
+    assert sample.shape == (2, 512, 3)
+    assert_allclose(sample.sum(-1), 1)
+    assert_allclose(sample.reshape(-1, 3).mean(0), dirichlet.alpha / 5.5, atol=0.005)
+
+
+def test_rvs_invalid_method():
+    with pytest.raises(ValueError):
+        Normal(0, 1).rvs(method="sobol")
+    with pytest.raises(ValueError):
+        Dirichlet([1, 1]).rvs(method="sobol")
+
+
+def test_rvs_out():
+    dist = Normal(1, 2)
+    expected = dist.rvs(200_000, random_state=3)
+    out = np.empty(200_000)
+    assert dist.rvs(random_state=3, out=out) is out
+    # the chunks are drawn from the same stream
+    assert_allclose(out, expected, rtol=0)
+
+    out = np.empty((2**14, 3))
+    Gamma(np.array([1.0, 2.0, 3.0]), 1).rvs(out=out, random_state=0)
+    assert_allclose(out.mean(0), [1, 2, 3], rtol=0.05)
+
+    # a batch larger than a chunk is drawn at once
+    out = np.empty(200_000)
+    Normal(np.arange(200_000), 1).rvs(out=out, random_state=0)
+    assert_allclose(out - np.arange(200_000), 0, atol=6)
+
+    out = np.empty(1024)
+    Poisson(3).rvs(out=out, random_state=0, method="qmc")
+    assert_allclose(out.mean(), 3, atol=0.01)
+
+    with pytest.raises(ValueError):
+        dist.rvs(5, out=np.empty(4))
+
+
+SHAPED_FAMILIES = [
+    Normal(1, 2),
+    Gamma(2, 1),
+    Poisson(3),
+    Rice(2, 1),
+    TruncatedNormal(0, 1, -1, 2),
+]
+
+
+@pytest.mark.parametrize("dist", SHAPED_FAMILIES)
+def test_rvs_out_shapes(dist):
+    out = np.empty((10, 2))
+    assert dist.rvs(out=out, random_state=3) is out
+    assert_allclose(out, dist.rvs((10, 2), random_state=3), rtol=0)
+
+
+@pytest.mark.parametrize("dist", SHAPED_FAMILIES)
+def test_iter_rvs(dist):
+    chunks = list(dist.iter_rvs(300, 1000, random_state=3))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    # the chunks are consecutive draws from the same stream
+    rng = np.random.default_rng(3)
+    expected = [dist.rvs(n_draws, random_state=rng) for n_draws in [300, 300, 300, 100]]
+    assert_allclose(np.concatenate(chunks), np.concatenate(expected), rtol=0)
+    batched = dist.__class__(*(np.full(2, param) for param in dist.params))
+    assert [chunk.shape for chunk in batched.iter_rvs(4, 6)] == [(4, 2), (2, 2)]
+    with pytest.raises(ValueError):
+        next(dist.iter_rvs(0, 10))
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Normal(1, 2),
+        TruncatedNormal(0, 1, -1, 2),
+        Truncated(Gamma(2, 1), 1, 3),
+        Poisson(3),
+        Rice(2, 1),
+    ],
+)
+def test_rvs_workers(dist):
+    sample = dist.rvs(10_001, random_state=5, workers=4)
+    assert sample.shape == (10_001,)
+    assert_allclose(sample, dist.rvs(10_001, random_state=5, workers=4), rtol=0)
+    assert not np.array_equal(sample, dist.rvs(10_001, random_state=5, workers=3))
+    assert_allclose(sample.mean(), dist.mean(), atol=4 * dist.std() / 100)
+
+    out = np.empty((1000, 2))
+    dist.rvs(out=out, random_state=5, workers=4)
+    assert_allclose(out, dist.rvs((1000, 2), random_state=5, workers=4), rtol=0)
+    assert np.ndim(dist.rvs(random_state=5, workers=4)) == 0
+
+
+def test_rvs_workers_batch():
+    dist = Normal(np.zeros(4), 1)
+    assert dist.rvs(random_state=5, workers=2).shape == (4,)
+    out = np.empty(4)
+    dist.rvs(out=out, random_state=5, workers=2)
+    assert_allclose(out, dist.rvs(random_state=5), rtol=0)
+    assert dist.rvs((10, 4), random_state=5, workers=2).shape == (10, 4)
+    rng = np.random.default_rng(5)
+    assert not np.array_equal(
+        dist.rvs((10, 4), random_state=rng, workers=2),
+        dist.rvs((10, 4), random_state=rng, workers=2),
+    )
+
+
+def test_rvs_workers_invalid():
+    with pytest.raises(ValueError):
+        Normal(0, 1).rvs(10, workers=0)
+    with pytest.raises(ValueError):
+        Normal(0, 1).rvs(10, workers=2, method="qmc")
@@ -1,6 +1,6 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal
 from scipy import stats
 
 from preliz import (
@@ -365,3 +365,29 @@ def test_match_scipy(p_dist, sp_dist, p_params, sp_params):
         assert_almost_equal(actual_mode, expected_mode, decimal=0)
     except NotImplementedError:
         pass
+
+
+@pytest.mark.parametrize(
+    "p_dist, sp_dist, x_vals",
+    [
+        (Normal(0, 1), stats.norm(), [-40, -10, 10, 40]),
+        (HalfNormal(2), stats.halfnorm(scale=2), [1e-12, 30, 70]),
+        (LogNormal(0, 1), stats.lognorm(1), [1e-15, 1e15]),
+        (StudentT(3, 0, 1), stats.t(3), [-1e8, 1e8]),
+        (Cauchy(0, 1), stats.cauchy(), [-1e12, 1e12]),
+        (Gamma(2, 1), stats.gamma(2), [1e-20, 100, 600]),
+        (Beta(2, 5), stats.beta(2, 5), [1e-12, 1 - 1e-12]),
+        (Exponential(2), stats.expon(scale=0.5), [1e-18, 300]),
+        (Weibull(2, 1), stats.weibull_min(2), [1e-10, 20]),
+        (Gumbel(0, 1), stats.gumbel_r(), [-3, 30, 500]),
+        (Logistic(0, 1), stats.logistic(), [-600, 600]),
+        (Laplace(0, 1), stats.laplace(), [-600, 600]),
+        (InverseGamma(3, 1), stats.invgamma(3), [1e-2, 1e9]),
+        (Binomial(100, 0.3), stats.binom(100, 0.3), [5, 60]),
+        (NegativeBinomial(10, 5), stats.nbinom(5, 1 / 3), [0, 150]),
+    ],
+)
+def test_logcdf_logsf_tails(p_dist, sp_dist, x_vals):
+    # far in the tails the cdf or the sf underflow, or round to 1, but their logs do not
+    assert_allclose(p_dist.logcdf(x_vals), sp_dist.logcdf(x_vals), rtol=1e-8, atol=1e-12)
+    assert_allclose(p_dist.logsf(x_vals), sp_dist.logsf(x_vals), rtol=1e-8, atol=1e-12)
@@ -1,6 +1,8 @@
 import numpy as np
-from numpy.testing import assert_almost_equal
+import pytest
+from numpy.testing import assert_allclose, assert_almost_equal
 from scipy import special as sc_special
+from scipy import stats
 
 from preliz.internal import special as pz_special
 
@@ -43,6 +45,19 @@ def test_betaincinv():
     assert_almost_equal(sc_special.betaincinv(a, b, x), pz_special.betaincinv(a, b, x))
 
 
+@pytest.mark.parametrize("a", [0.01, 0.5, 1, 3.5, 20, 500])
+@pytest.mark.parametrize("b", [0.01, 0.5, 1, 3.5, 20, 500])
+def test_betainc_precision(a, b):
+    x = np.concatenate([np.geomspace(1e-10, 0.5, 30), 1 - np.geomspace(1e-10, 0.5, 30)])
+    expected = sc_special.betainc(a, b, x)
+    # close to x=1 scipy itself is only accurate to a few 1e-12
+    assert_allclose(pz_special.betainc(a, b, x), expected, rtol=1e-12, atol=5e-12)
+    expected = sc_special.betaincinv(a, b, x)
+    # scipy clips roots that underflow to the smallest normal float
+    mask = expected > 1e-300
+    assert_allclose(pz_special.betaincinv(a, b, x)[mask], expected[mask], rtol=1e-10)
+
+
 def test_gammaln():
     x = np.linspace(0.1, 10, 100)
     assert_almost_equal(sc_special.gammaln(x), pz_special.gammaln(x))
@@ -58,6 +73,43 @@ def test_digamma():
     assert_almost_equal(sc_special.digamma(x), pz_special.digamma(x))
 
 
+@pytest.mark.parametrize("func", ["gammainc", "gammaincc"])
+def test_gammainc(func):
+    a_vals, x_vals = np.meshgrid(np.geomspace(1e-3, 1e4, 50), np.geomspace(1e-4, 1e4, 50))
+    expected = getattr(sc_special, func)(a_vals, x_vals)
+    actual = getattr(pz_special, func)(a_vals, x_vals)
+    mask = expected > 1e-200
+    assert_allclose(actual[mask], expected[mask], rtol=5e-12)
+    assert_allclose(actual, expected, atol=1e-15)
+
+
+@pytest.mark.parametrize("func", ["gammaincinv", "gammainccinv"])
+def test_gammaincinv(func):
+    p_vals = np.concatenate([np.geomspace(1e-10, 0.5, 30), 1 - np.geomspace(1e-10, 0.5, 30)])
+    a_vals, p_vals = np.meshgrid(np.geomspace(0.1, 1e4, 30), p_vals)
+    expected = getattr(sc_special, func)(a_vals, p_vals)
+    actual = getattr(pz_special, func)(a_vals, p_vals)
+    assert_allclose(actual, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("func", ["gammaincinv", "gammainccinv"])
+def test_gammaincinv_tails(func):
+    a_vals, p_vals = np.meshgrid([0.05, 0.5, 1, 1.5, 5, 50], np.geomspace(1e-300, 1e-11, 30))
+    expected = getattr(sc_special, func)(a_vals, p_vals)
+    actual = getattr(pz_special, func)(a_vals, p_vals)
+    assert_allclose(actual, expected, rtol=1e-12)
+
+
+def test_i0e():
+    x = np.concatenate([np.linspace(-40, 40, 401), np.geomspace(1e-8, 1e6, 100)])
+    assert_allclose(sc_special.i0e(x), pz_special.i0e(x), rtol=1e-13)
+
+
+def test_i1e():
+    x = np.concatenate([np.linspace(-40, 40, 401), np.geomspace(1e-8, 1e6, 100)])
+    assert_allclose(sc_special.i1e(x), pz_special.i1e(x), rtol=1e-13)
+
+
 def test_logit():
     x = np.linspace(-0.1, 1.1, 100)
     assert_almost_equal(sc_special.logit(x), pz_special.logit(x))
@@ -83,3 +135,12 @@ def test_xlog1py():
 def test_xlogx():
     x = np.linspace(0.0, 10, 10)
     assert_almost_equal(pz_special.xlogy(x, x), pz_special.xlogx(x))
+
+
+def test_marcumq1():
+    b_vals = np.array([0, 1e-10, 0.5, 1, 3, 10, 40])[:, None]
+    y_vals = np.array([1e-3, 0.5, 1, 2, 5, 12, 45])
+    expected = stats.ncx2(2, b_vals**2).sf(y_vals**2)
+    cdf, sf = np.vectorize(pz_special.marcumq1)(b_vals, y_vals)
+    assert_allclose(sf, expected, rtol=1e-5, atol=1e-300)
+    assert_allclose(cdf, 1 - expected, rtol=1e-8, atol=1e-15)
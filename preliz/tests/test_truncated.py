@@ -1,7 +1,10 @@
 import numpy as np
-from numpy.testing import assert_almost_equal
+import pytest
+from numpy.testing import assert_allclose, assert_almost_equal
+from scipy.stats import kstest, truncnorm
 
-from preliz.distributions import Normal, Truncated, TruncatedNormal
+from preliz import clear_cache
+from preliz.distributions import Normal, Poisson, Truncated, TruncatedNormal, Wald
 
 
 def test_truncated():
@@ -61,3 +64,80 @@ def test_truncated():
     actual_entropy = custom_truncnorm_dist.entropy()
     expected_entropy = genera_truncnorm_dist.entropy()
     assert_almost_equal(actual_entropy, expected_entropy, decimal=2)
+
+
+@pytest.mark.parametrize(
+    "dist, lower, upper",
+    [
+        (Normal(0, 2), -1, 3),
+        (Poisson(3.5), 1, 6),
+    ],
+)
+def test_truncated_normalization(dist, lower, upper):
+    clear_cache()
+    trunc_dist = Truncated(dist, lower, upper)
+    n_evals = []
+
+    def counted(method):
+        def counted_method(x):
+            n_evals.append(np.size(x))
+            return method(x)
+
+        return counted_method
+
+    dist.logcdf = counted(dist.logcdf)
+    dist.logsf = counted(dist.logsf)
+    x_vals = trunc_dist.rvs(100, random_state=1)
+    n_total = sum(n_evals)
+    trunc_dist.logpdf(x_vals)
+    trunc_dist.ppf([0.1, 0.5])
+    assert sum(n_evals) == n_total
+
+    expected = -trunc_dist.logpdf(x_vals).sum()
+    assert_allclose(trunc_dist._neg_logpdf(x_vals), expected)
+    assert trunc_dist._neg_logpdf(np.append(x_vals, upper + 1)) == np.inf
+
+
+@pytest.mark.parametrize(
+    "lower, upper",
+    [
+        (-1, 2),
+        (10, 12),
+        (-40, -38),
+        (30, np.inf),
+    ],
+)
+def test_truncated_tails(lower, upper):
+    # the mass between the bounds is computed from the tail that keeps the precision
+    trunc_dist = Truncated(Normal(0, 1), lower, upper)
+    sp_dist = truncnorm(lower, upper)
+    x_vals = np.linspace(lower, min(upper, lower + 3), 7)[1:-1]
+    assert_allclose(trunc_dist.logpdf(x_vals), sp_dist.logpdf(x_vals), rtol=1e-10)
+    assert_allclose(trunc_dist.logcdf(x_vals), sp_dist.logcdf(x_vals), rtol=1e-6)
+    assert_allclose(trunc_dist.logsf(x_vals), sp_dist.logsf(x_vals), rtol=1e-6)
+    assert_allclose(trunc_dist.cdf(x_vals), sp_dist.cdf(x_vals), rtol=1e-6)
+    assert trunc_dist.logcdf(lower - 1) == -np.inf
+    assert trunc_dist.logsf(lower - 1) == 0
+
+
+@pytest.mark.parametrize(
+    "dist, lower, upper, sp_dist",
+    [
+        # rejection from the base distribution
+        (Wald(1, 3), 0.5, 3, None),
+        # exponential tail sampler
+        (Normal(0, 1), 8, 9, truncnorm(8, 9)),
+        (Normal(1, 2), -np.inf, -20, truncnorm(-np.inf, -10.5, 1, 2)),
+        (Normal(0, 1), 5, 5.001, truncnorm(5, 5.001)),
+    ],
+)
+def test_truncated_rvs(dist, lower, upper, sp_dist):
+    trunc_dist = Truncated(dist, lower, upper)
+    samples = trunc_dist.rvs(100000, random_state=1)
+    assert samples.min() >= lower
+    assert samples.max() <= upper
+    # the Normal cdf can not be evaluated accurately that far in the tails
+    cdf = trunc_dist.cdf if sp_dist is None else sp_dist.cdf
+    assert kstest(samples, cdf).pvalue > 0.01
+    assert trunc_dist.rvs((2, 3)).shape == (2, 3)
+    assert np.ndim(trunc_dist.rvs()) == 0
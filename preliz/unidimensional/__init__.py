@@ -1,6 +1,7 @@
 from preliz.unidimensional.combine import combine
 from preliz.unidimensional.combine_roulette import combine_roulette
 from preliz.unidimensional.maxent import maxent
+from preliz.unidimensional.maxent_batch import maxent_batch, maxent_rank
 from preliz.unidimensional.mle import mle
 from preliz.unidimensional.quartile import quartile
 from preliz.unidimensional.quartile_int import QuartileInt
@@ -10,6 +11,8 @@ __all__ = [
     "combine",
     "combine_roulette",
     "maxent",
+    "maxent_batch",
+    "maxent_rank",
     "mle",
     "quartile",
     "QuartileInt",
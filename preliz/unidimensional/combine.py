@@ -8,7 +8,7 @@ def combine(
     distributions,
     weights=None,
     dist_names=None,
-    sample_size=10_000,
+    sample_size=1_000,
     rng=0,
     plot=1,
     plot_kwargs=None,
@@ -34,7 +34,9 @@ def combine(
         List of distributions to fit the weighted sample.
         Defaults to ``["Normal", "Gamma", "LogNormal", "StudentT"]``.
     sample_size : int
-        Number of total samples to generate for the fit.
+        Number of total samples to generate for the fit. The samples are quasi-random draws,
+        see the ``method`` argument of ``rvs``, so a thousand is usually enough for an accurate fit.
+        Defaults to 1_000.
     rng : int or numpy.random.Generator, optional
         Random number generator or seed. Defaults to ``0``.
     plot : int
@@ -73,7 +75,7 @@ def combine(
 
     sample = []
     for dist, n in zip(distributions, n_size):
-        sample.append(dist.rvs(n, random_state=rng))
+        sample.append(dist.rvs(n, random_state=rng, method="qmc"))
 
     distributions = get_distributions(dist_names)
 
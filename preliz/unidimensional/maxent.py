@@ -103,6 +103,35 @@ def maxent(
     if plot is None:
         plot = rcParams["plots.show_plot"]
 
+    if plot_kwargs is None:
+        plot_kwargs = {}
+
+    if distribution is None:
+        distribution = Normal()
+
+    fixed_stat = _check_maxent(distribution, lower, upper, mass, fixed_stat)
+    r_error, computed_mass = _fit_maxent(distribution, lower, upper, mass, fixed_stat)
+
+    if r_error > 0.01:
+        warnings.warn(
+            f"\nThe requested mass is {mass:.3g},\nbut the computed one is {computed_mass:.3g}",
+            stacklevel=2,
+        )
+
+    if plot:
+        ax = distribution.plot_pdf(**plot_kwargs)
+        if plot_kwargs.get("pointinterval"):
+            cid = -4
+        else:
+            cid = -1
+        ax.plot([lower, upper], [0, 0], "o", color=ax.get_lines()[cid].get_c(), alpha=0.5)
+        return distribution, ax
+
+    return distribution
+
+
+def _check_maxent(distribution, lower, upper, mass, fixed_stat):
+    """Validate the arguments of maxent and return ``fixed_stat`` as a tuple."""
     if fixed_stat is None:
         fixed_stat = ()
     else:
@@ -116,12 +145,6 @@ def maxent(
     if upper <= lower:
         raise ValueError("upper should be larger than lower")
 
-    if plot_kwargs is None:
-        plot_kwargs = {}
-
-    if distribution is None:
-        distribution = Normal()
-
     if distribution.is_frozen:
         raise ValueError("All parameters are fixed, at least one should be free")
 
@@ -134,16 +157,24 @@ def maxent(
                 "but the provided bounds are not integers"
             )
 
+    return fixed_stat
+
+
+def _fit_maxent(distribution, lower, upper, mass, fixed_stat, init_params=None):
+    """
+    Update ``distribution`` inplace with the maximum entropy solution.
+
+    The optimization starts from ``init_params``, a dict with all the parameters of the
+    distribution, or from a moment matching heuristic when it is None. Returns the relative
+    error of the mass, in percent, and the computed mass.
+    """
     # Find which parameters has been fixed
     none_idx, fixed_params = get_fixed_params(distribution)
 
-    # Heuristic to provide an initial guess for the optimization step
-    # We obtain those guesses by first approximating the mean and standard deviation
-    # from intervals and mass and then use those values for moment matching
-    if distribution.__class__.__name__ == "Uniform":
-        distribution._fit_moments(mean=(lower + upper) / 2, sigma=((upper - lower) / 3.4) / mass)
+    if init_params is None:
+        _init_guess(distribution, lower, upper, mass)
     else:
-        distribution._fit_moments(mean=(lower + upper) / 2, sigma=((upper - lower) / 4) / mass)
+        distribution._parametrization(**init_params)
 
     if "mode" in fixed_stat:
         try:
@@ -156,24 +187,17 @@ def maxent(
     opt = optimize_max_ent(distribution, lower, upper, mass, none_idx, fixed_params, fixed_stat)
     distribution.opt = opt
 
-    r_error, computed_mass = relative_error(distribution, lower, upper, mass)
+    return relative_error(distribution, lower, upper, mass)
 
-    if r_error > 0.01:
-        warnings.warn(
-            f"\nThe requested mass is {mass:.3g},\n" f"but the computed one is {computed_mass:.3g}",
-            stacklevel=2,
-        )
 
-    if plot:
-        ax = distribution.plot_pdf(**plot_kwargs)
-        if plot_kwargs.get("pointinterval"):
-            cid = -4
-        else:
-            cid = -1
-        ax.plot([lower, upper], [0, 0], "o", color=ax.get_lines()[cid].get_c(), alpha=0.5)
-        return distribution, ax
-
-    return distribution
+def _init_guess(distribution, lower, upper, mass):
+    # Heuristic to provide an initial guess for the optimization step
+    # We obtain those guesses by first approximating the mean and standard deviation
+    # from intervals and mass and then use those values for moment matching
+    if distribution.__class__.__name__ == "Uniform":
+        distribution._fit_moments(mean=(lower + upper) / 2, sigma=((upper - lower) / 3.4) / mass)
+    else:
+        distribution._fit_moments(mean=(lower + upper) / 2, sigma=((upper - lower) / 4) / mass)
 
 
 def end_points_ints(lower, upper):
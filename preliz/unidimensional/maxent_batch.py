@@ -0,0 +1,205 @@
+import os
+import warnings
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+
+import numpy as np
+
+from preliz.internal.distribution_helper import valid_distribution
+from preliz.internal.optimization import relative_error
+from preliz.internal.rcparams import rcParams
+from preliz.unidimensional.maxent import _check_maxent, _fit_maxent, _init_guess
+
+MaxEntResult = namedtuple("MaxEntResult", ["dist", "params", "mass", "success", "status", "nfev"])
+
+
+def maxent_batch(specs, workers=None):
+    """
+    Find the maximum entropy distributions for many interval constraints.
+
+    Every spec is solved as with :func:`maxent`, without plotting and without modifying the
+    distributions passed in. Identical specs are solved once. Specs with the same distribution,
+    including the values of its fixed parameters, are sorted by their end-points and solved in
+    sequence. Each optimization starts from the solution of the previous spec when it is closer
+    to the requested mass than the initial guess used by :func:`maxent`, and it is repeated from
+    that guess if it fails.
+
+    Parameters
+    ----------
+    specs : iterable of tuples
+        Each element is ``(distribution, lower, upper)`` or ``(distribution, lower, upper, mass)``,
+        with the same meaning as the arguments of :func:`maxent`. When missing, ``mass`` is the
+        value of rcParams["stats.ci_prob"].
+    workers : int
+        Number of processes used to solve the specs. Defaults to None, which solves them in the
+        current process. Use -1 to use all the available CPUs.
+
+    Returns
+    -------
+    list of MaxEntResult
+        One named tuple per spec, in the same order as ``specs``, with fields:
+
+        - dist: copy of the distribution with the solution.
+        - params: dict with the parameters of the distribution.
+        - mass: mass between ``lower`` and ``upper``.
+        - success: whether the optimization converged and ``mass`` is within 0.01 % of the
+          requested one.
+        - status: status of the optimizer, see :func:`scipy.optimize.minimize`.
+        - nfev: number of evaluations of the entropy, including those of failed warm starts.
+
+    See Also
+    --------
+    maxent : Find the maximum entropy distribution that satisfies the constraints.
+
+    Examples
+    --------
+    Find the maxent Normal distributions for a table of intervals:
+
+    >>> import preliz as pz
+    >>> specs = [(pz.Normal(), -i, i, 0.9) for i in range(1, 5)]
+    >>> results = pz.maxent_batch(specs, workers=2)
+    >>> [result.params["sigma"] for result in results]
+    """
+    if workers == -1:
+        workers = os.cpu_count()
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError("workers must be a positive integer or -1")
+
+    unique = {}
+    keys = []
+    for spec in specs:
+        distribution, lower, upper, *mass = spec
+        mass = mass[0] if mass else rcParams["stats.ci_prob"]
+        valid_distribution(distribution)
+        _check_maxent(distribution, lower, upper, mass, None)
+        # the class does not tell apart distributions with different fixed parameters
+        family = f"{distribution!r}{distribution.param_names}"
+        family += str([getattr(distribution, name) for name in distribution.param_names])
+        key = (family, lower, upper, mass)
+        unique.setdefault(key, distribution)
+        keys.append(key)
+
+    ordered = [(key, unique[key]) for key in sorted(unique)]
+    if workers is None or workers == 1 or len(ordered) < 2:
+        solved = _solve_chunk(ordered)
+    else:
+        # several chunks per worker balance the load, contiguous ones keep the neighbours together
+        chunks = np.array_split(np.arange(len(ordered)), min(4 * workers, len(ordered)))
+        with ProcessPoolExecutor(workers) as executor:
+            parts = executor.map(
+                _solve_chunk, [[ordered[idx] for idx in chunk] for chunk in chunks]
+            )
+            solved = [result for part in parts for result in part]
+
+    results = dict(zip(sorted(unique), solved))
+    return [results[key] for key in keys]
+
+
+def maxent_rank(distributions, lower=-1, upper=1, mass=None, workers=None):
+    """
+    Find and rank the maximum entropy distributions of several families.
+
+    Every distribution is solved for the same constraint as with :func:`maxent`, without
+    plotting and without modifying the distributions passed in. Distributions whose support does
+    not contain ``lower`` and ``upper`` are discarded before solving the rest.
+
+    Parameters
+    ----------
+    distributions : list of PreliZ distributions
+        Candidate distributions, partially initialized distributions keep their fixed parameters.
+    lower : float
+        Lower end-point
+    upper: float
+        Upper end-point
+    mass: float
+        Probability mass between ``lower`` and ``upper`` bounds. Defaults to None,
+        which results in the value of rcParams["stats.ci_prob"] being used.
+    workers : int
+        Number of processes used to solve the distributions. Defaults to None, which solves them
+        in the current process. Use -1 to use all the available CPUs.
+
+    Returns
+    -------
+    list of MaxEntResult
+        One named tuple per valid distribution, see :func:`maxent_batch`. The solutions that
+        satisfy the constraint come first, sorted by decreasing entropy, followed by the rest,
+        sorted by increasing relative error of the mass.
+
+    See Also
+    --------
+    maxent : Find the maximum entropy distribution that satisfies the constraints.
+
+    Examples
+    --------
+    Rank some families for a positive quantity with 90 % of the mass between 1 and 10:
+
+    >>> import preliz as pz
+    >>> families = [pz.Gamma(), pz.LogNormal(), pz.InverseGamma(), pz.Weibull()]
+    >>> ranked = pz.maxent_rank(families, 1, 10, 0.9, workers=-1)
+    >>> ranked[0].dist
+    """
+    if mass is None:
+        mass = rcParams["stats.ci_prob"]
+
+    for distribution in distributions:
+        valid_distribution(distribution)
+    valid = [
+        distribution
+        for distribution in distributions
+        if distribution._check_endpoints(lower, upper, raise_error=False)
+    ]
+    if not valid:
+        raise ValueError("The provided endpoints are outside the domain of all the distributions")
+
+    results = maxent_batch([(distribution, lower, upper, mass) for distribution in valid], workers)
+
+    def rank(result):
+        if result.success:
+            return (0, -result.dist.entropy())
+        return (1, abs(result.mass - mass) / mass)
+
+    return sorted(results, key=rank)
+
+
+def _solve_chunk(ordered):
+    """Solve the specs in order, warm starting from the previous solution of the same family."""
+    solved = []
+    previous = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for (family, lower, upper, mass), distribution in ordered:
+            result = _solve(distribution, lower, upper, mass, previous.get(family))
+            nfev = result.nfev
+            if not result.success and family in previous:
+                result = _solve(distribution, lower, upper, mass)
+                nfev += result.nfev
+            if result.success:
+                previous[family] = result.params
+            solved.append(result._replace(nfev=nfev))
+    return solved
+
+
+def _solve(distribution, lower, upper, mass, neighbour=None):
+    distribution = deepcopy(distribution)
+    init_params = None
+    if neighbour is not None:
+        # start from the neighbour only when it is closer to the requested mass than the guess
+        # used by maxent, so a distant neighbour does not slow down the optimization
+        guess = deepcopy(distribution)
+        _init_guess(guess, lower, upper, mass)
+        guess_error, _ = relative_error(guess, lower, upper, mass)
+        guess._parametrization(**neighbour)
+        if relative_error(guess, lower, upper, mass)[0] < guess_error:
+            init_params = neighbour
+
+    r_error, computed_mass = _fit_maxent(distribution, lower, upper, mass, (), init_params)
+    opt = distribution.opt
+    return MaxEntResult(
+        distribution,
+        dict(zip(distribution.param_names, distribution.params)),
+        computed_mass,
+        bool(opt.success and r_error <= 0.01),
+        opt.status,
+        opt.nfev,
+    )